@@ -54,17 +54,39 @@ agent.tool.calculator(
     mode="integrate",
     wrt="x"
 )
+
+# Evaluate a formula over many rows at once
+agent.tool.calculator(
+    expression="p * (1 + r)**n",
+    mode="batch",
+    variables={"p": [1000, 2500, 4000], "r": 0.05, "n": [1, 5, 10]}
+)
 ```
 
 See the calculator function docstring for more details on available modes and parameters.
 """
 
 import ast
+import atexit
+import functools
+import hashlib
 import logging
+import math
 import os
-from typing import Any, Dict, Optional, Union
+import pickle
+import queue
+import statistics
+import struct
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple, Union
 
 # Required dependencies
+import mpmath
 import sympy as sp
 from rich import box
 from rich.console import Console
@@ -73,9 +95,26 @@ from rich.table import Table
 from strands import tool
 
 from strands_tools.utils import console_util
+from strands_tools.utils.file_cache import PickleFileCache
 
 logger = logging.getLogger(__name__)
 
+# Number of distinct expression strings kept parsed and compiled in memory
+EXPRESSION_CACHE_SIZE = int(os.getenv("CALCULATOR_CACHE_SIZE", "256"))
+
+# Seconds after which a symbolic worker process that never became ready is considered broken.
+# Startup time counts against the budget of the calls waiting for it, but a call that runs out
+# of budget leaves the process starting for the next call.
+WORKER_STARTUP_TIMEOUT = 60
+
+# Share of a call's time budget given to the symbolic operation; the rest is left for the
+# numeric fallback, so the call as a whole stays within its budget
+SYMBOLIC_BUDGET_SHARE = 0.75
+
+
+class SymbolicTimeoutError(TimeoutError):
+    """Raised when a symbolic operation exceeds its time budget."""
+
 
 def create_result_table(
     operation: str,
@@ -170,6 +209,38 @@ def parse_expression(expr_str: str) -> Any:
         raise ValueError(f"Invalid expression: {str(e)}") from e
 
 
+class CompiledExpression:
+    """A parsed expression together with its lambdified numeric functions.
+
+    Functions are compiled lazily, once per combination of argument names and backend module,
+    so repeated evaluations of the same formula with different inputs skip SymPy entirely.
+    """
+
+    def __init__(self, expr: Any) -> None:
+        self.expr = expr
+        self._functions: Dict[Tuple[Tuple[str, ...], str], Callable] = {}
+
+    @functools.cached_property
+    def symbol_names(self) -> Tuple[str, ...]:
+        """Sorted names of the free symbols in the expression."""
+        if not isinstance(self.expr, sp.Basic):
+            return ()
+        return tuple(sorted(str(symbol) for symbol in self.expr.free_symbols))
+
+    def get_function(self, names: Tuple[str, ...], module: str = "mpmath") -> Callable:
+        """Get the expression compiled to a numeric function of the given argument names."""
+        key = (names, module)
+        if key not in self._functions:
+            self._functions[key] = sp.lambdify([sp.Symbol(name) for name in names], self.expr, modules=module)
+        return self._functions[key]
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(expr_str: str) -> CompiledExpression:
+    """Parse an expression string, caching the parsed and compiled form by its text."""
+    return CompiledExpression(parse_expression(expr_str))
+
+
 def get_precision_level(num: Union[float, int, sp.Expr]) -> int:
     """Determine appropriate precision based on number magnitude."""
     try:
@@ -395,14 +466,185 @@ def numeric_evaluation(result: Any, precision: int, scientific: bool) -> Union[i
         raise ValueError(f"Could not evaluate expression numerically: {str(e)}") from e
 
 
+def fast_numeric_evaluation(
+    compiled: CompiledExpression,
+    variables: Optional[Dict[str, Any]],
+    precision: int,
+    scientific: bool,
+) -> Optional[Union[int, str]]:
+    """Evaluate a compiled expression with mpmath when every free symbol has a numeric value.
+
+    Returns None when the fast path does not apply or cannot reproduce the symbolic result
+    (exact big integers, non-finite values, unsupported functions), so the caller can fall back
+    to evaluate_expression.
+    """
+    if not variables or not compiled.symbol_names:
+        return None
+
+    if any(isinstance(v, bool) or not isinstance(v, (int, float, complex)) for v in variables.values()):
+        return None
+
+    names = compiled.symbol_names
+    if not set(names).issubset(variables):
+        return None
+
+    try:
+        value = compiled.get_function(names)(*(variables[name] for name in names))
+        value = complex(value) if isinstance(value, (complex, mpmath.mpc)) else float(value)
+    except Exception as e:
+        logger.debug(f"Numeric fast path unavailable: {str(e)}")
+        return None
+
+    if isinstance(value, complex):
+        if value.imag != 0:
+            if not (math.isfinite(value.real) and math.isfinite(value.imag)):
+                return None
+            return format_number(value, scientific, precision)
+        value = value.real
+
+    if not math.isfinite(value):
+        return None
+
+    # Integer inputs produce exact integers symbolically, which floats can only match below 2**53
+    if value.is_integer() and all(isinstance(v, int) for v in variables.values()):
+        if abs(value) >= 2**53:
+            return None
+        return int(value)
+
+    return format_number(value, scientific, precision)
+
+
+def expand_batch_values(variables: Dict[str, Any]) -> Tuple[Dict[str, List[Any]], int]:
+    """Expand batch variables into equal-length value lists.
+
+    Each variable may be a list of values, a range given as {"start", "stop", "step"} (stop exclusive)
+    or {"start", "stop", "num"} (evenly spaced, stop inclusive), or a scalar broadcast to every row.
+    """
+    max_size = int(os.getenv("CALCULATOR_BATCH_MAX_SIZE", "1000000"))
+    expanded: Dict[str, Any] = {}
+    for name, value in variables.items():
+        if isinstance(value, dict):
+            start = float(value.get("start", 0))
+            stop = float(value["stop"])
+            if "num" in value:
+                num = int(value["num"])
+                if num < 0:
+                    raise ValueError(f"Range num for '{name}' must not be negative")
+                step = (stop - start) / (num - 1) if num > 1 else 0.0
+            else:
+                step = float(value.get("step", 1))
+                if step == 0:
+                    raise ValueError(f"Range step for '{name}' must not be zero")
+                num = max(0, math.ceil((stop - start) / step))
+            if num > max_size:
+                raise ValueError(f"Range for '{name}' has {num} values, more than the batch limit of {max_size}")
+            expanded[name] = [start + i * step for i in range(num)]
+        elif isinstance(value, (list, tuple)):
+            expanded[name] = list(value)
+        else:
+            expanded[name] = value
+
+    lengths = {len(v) for v in expanded.values() if isinstance(v, list)}
+    if len(lengths) > 1:
+        raise ValueError(f"Batch variables must all have the same number of values, got lengths {sorted(lengths)}")
+    size = lengths.pop() if lengths else 1
+    if size > max_size:
+        raise ValueError(f"Batch has {size} rows, more than the batch limit of {max_size}")
+
+    return {name: v if isinstance(v, list) else [v] * size for name, v in expanded.items()}, size
+
+
+def batch_evaluate(compiled: CompiledExpression, variables: Dict[str, Any]) -> Tuple[Dict[str, List[Any]], List[Any]]:
+    """Evaluate a compiled expression for every row of batch variables.
+
+    Uses a single vectorized NumPy call when NumPy is installed and falls back to the compiled
+    mpmath function row by row otherwise. Rows that cannot be evaluated produce NaN.
+    """
+    inputs, size = expand_batch_values(variables)
+    names = compiled.symbol_names
+    missing = [name for name in names if name not in inputs]
+    if missing:
+        raise ValueError(f"Missing values for variables: {', '.join(missing)}")
+
+    try:
+        import numpy as np  # Imported here to keep NumPy optional
+    except ImportError:
+        np = None
+
+    if np is not None:
+        try:
+            # Float arrays avoid silent int64 overflow in expressions like x**100
+            arrays = [
+                np.asarray(inputs[name], dtype=complex if any(isinstance(v, complex) for v in inputs[name]) else float)
+                for name in names
+            ]
+            with np.errstate(all="ignore"):
+                values = np.broadcast_to(compiled.get_function(names, "numpy")(*arrays), (size,))
+            return inputs, values.tolist()
+        except Exception as e:
+            logger.debug(f"Vectorized batch evaluation failed, evaluating row by row: {str(e)}")
+
+    function = compiled.get_function(names)
+    values = []
+    for row in range(size):
+        try:
+            value = function(*(inputs[name][row] for name in names))
+            values.append(complex(value) if isinstance(value, (complex, mpmath.mpc)) else float(value))
+        except Exception:
+            values.append(math.nan)
+    return inputs, values
+
+
+def summarize_batch(
+    inputs: Dict[str, List[Any]],
+    values: List[Any],
+    precision: int,
+    scientific: bool,
+) -> str:
+    """Format batch results as summary statistics followed by the leading rows."""
+    max_rows = int(os.getenv("CALCULATOR_BATCH_MAX_ROWS", "20"))
+
+    def fmt(value: Any) -> str:
+        if isinstance(value, (int, float, complex)) and not isinstance(value, bool):
+            return format_number(value, scientific, precision)
+        return str(value)
+
+    lines = [f"Batch of {len(values)} evaluations"]
+    real = [float(v) for v in values if isinstance(v, (int, float)) and not isinstance(v, bool)]
+    finite = [v for v in real if math.isfinite(v)]
+    if finite:
+        stats = {
+            "min": min(finite),
+            "max": max(finite),
+            "mean": statistics.fmean(finite),
+            "std": statistics.pstdev(finite),
+            "sum": math.fsum(finite),
+        }
+        lines.append(", ".join(f"{key}: {fmt(value)}" for key, value in stats.items()))
+    if len(finite) < len(values):
+        lines.append(f"non-finite or complex values: {len(values) - len(finite)}")
+
+    shown = min(len(values), max_rows)
+    lines.append(f"Rows ({shown} of {len(values)}):")
+    for row in range(shown):
+        assignments = ", ".join(f"{name}={fmt(column[row])}" for name, column in inputs.items())
+        lines.append(f"{assignments} -> {fmt(values[row])}")
+
+    return "\n".join(lines)
+
+
 def evaluate_expression(
     expr: Any,
     variables: Optional[Dict[str, Any]] = None,
     precision: int = 10,
     scientific: bool = False,
     force_numeric: bool = False,
+    simplify: bool = True,
 ) -> Union[Any, int, float, str]:
-    """Evaluate a mathematical expression with optional variables."""
+    """Evaluate a mathematical expression with optional variables.
+
+    Set simplify=False to skip symbolic simplification, e.g. when it already exceeded its time budget.
+    """
     try:
         # Step 1: Apply variable substitutions
         result = preprocess_expression(expr, variables)
@@ -417,7 +659,8 @@ def evaluate_expression(
             result = result.subs(substitutions)
 
         # Step 3: Apply symbolic simplifications
-        result = apply_symbolic_simplifications(result)
+        if simplify:
+            result = apply_symbolic_simplifications(result)
 
         # Step 4: Force numerical evaluation if requested
         if force_numeric and isinstance(result, sp.Basic):
@@ -554,38 +797,620 @@ def calculate_series(expr: Any, var: str, point: str, order: int) -> Any:
         raise ValueError(f"Series expansion error: {str(e)}") from e
 
 
+def numeric_solve(expr: Any, precision: int) -> Any:
+    """Find roots numerically with mpmath.findroot, used when symbolic solving runs out of time."""
+    try:
+        if isinstance(expr, (list, tuple)):
+            equations = [eq.lhs - eq.rhs if isinstance(eq, sp.Equality) else eq for eq in expr]
+            symbols = sorted(set().union(*[eq.free_symbols for eq in equations]), key=str)
+            if len(symbols) != len(equations):
+                raise ValueError("Numeric solving needs as many equations as unknowns")
+            function = sp.lambdify(symbols, equations, modules="mpmath")
+            root = mpmath.findroot(function, [mpmath.mpf(1)] * len(symbols))
+            values = [root] if len(symbols) == 1 else list(root)
+            return {symbol: _round_complex(value, precision) for symbol, value in zip(symbols, values, strict=True)}
+
+        equation = expr.lhs - expr.rhs if isinstance(expr, sp.Equality) else expr
+        symbols = list(equation.free_symbols)
+        if len(symbols) != 1:
+            raise ValueError("Numeric solving needs an equation in a single unknown")
+        function = sp.lambdify(symbols[0], equation, modules="mpmath")
+
+        # Start from a spread of real and complex guesses and keep the distinct roots found
+        roots: List[complex] = []
+        for guess in [0, 0.5, -0.5, 1, -1, 3, -3, 10, -10, 100, -100, 1j, -1j, 1 + 1j, -1 - 1j]:
+            try:
+                root = _round_complex(mpmath.findroot(function, guess), precision)
+            except (ValueError, ZeroDivisionError, TypeError):
+                continue
+            if all(abs(root - known) > 10**-precision * max(1, abs(root)) for known in roots):
+                roots.append(root)
+        return roots
+    except Exception as e:
+        raise ValueError(f"Numeric solving error: {str(e)}") from e
+
+
+def numeric_limit(expr: Any, var: str, point: str) -> Any:
+    """Approximate a limit with mpmath.limit, used when the symbolic limit runs out of time."""
+    try:
+        var_sym = sp.Symbol(var)
+        if expr.free_symbols - {var_sym}:
+            raise ValueError("Numeric limits need an expression in a single variable")
+        function = sp.lambdify(var_sym, expr, modules="mpmath")
+
+        point_val = sp.sympify(point)
+        if point_val == sp.oo:
+            target = mpmath.inf
+        elif point_val == -sp.oo:
+            target = -mpmath.inf
+        else:
+            target = mpmath.mpmathify(complex(point_val) if not point_val.is_real else float(point_val))
+
+        return _round_complex(mpmath.limit(function, target), 15)
+    except Exception as e:
+        raise ValueError(f"Numeric limit error: {str(e)}") from e
+
+
+def _round_complex(value: Any, precision: int) -> Union[float, complex]:
+    """Convert an mpmath number to a float or complex rounded to the given precision."""
+    number = complex(value)
+    real, imag = round(number.real, precision), round(number.imag, precision)
+    return real if imag == 0 else complex(real, imag)
+
+
+# Operations that run in the symbolic worker process, addressed by name
+SYMBOLIC_OPERATIONS: Dict[str, Callable] = {
+    "evaluate": evaluate_expression,
+    "solve": solve_equation,
+    "integrate": calculate_integral,
+    "limit": calculate_limit,
+}
+
+
+def _write_frame(stream: IO[bytes], message: Any) -> None:
+    """Write a length-prefixed pickled message."""
+    data = pickle.dumps(message)
+    stream.write(struct.pack("!Q", len(data)) + data)
+    stream.flush()
+
+
+def _read_frame(stream: IO[bytes]) -> Any:
+    """Read a length-prefixed pickled message, returning None at end of stream."""
+    header = stream.read(8)
+    if len(header) < 8:
+        return None
+    (length,) = struct.unpack("!Q", header)
+    return pickle.loads(stream.read(length))
+
+
+def run_symbolic_worker() -> None:
+    """Serve symbolic operations over stdin/stdout until stdin is closed.
+
+    This is the entry point of the worker process started by SymbolicWorker.
+    """
+    requests = sys.stdin.buffer
+    responses = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    # Keep stray output from SymPy off the message stream
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    _write_frame(responses, ("ready", None))
+    while True:
+        request = _read_frame(requests)
+        if request is None:
+            break
+        name, args = request
+        try:
+            response = ("ok", SYMBOLIC_OPERATIONS[name](*args))
+            pickle.dumps(response)
+        except Exception as e:
+            response = ("error", str(e))
+        _write_frame(responses, response)
+
+
+class SymbolicWorker:
+    """Reusable child process for symbolic operations that can be killed when one overruns its budget.
+
+    The worker is a fresh interpreter started with ``python -c`` rather than multiprocessing, so it never
+    re-imports the caller's ``__main__`` module. Calls are serialized; waiting for a busy or starting
+    worker counts against the caller's budget. A worker killed after a timeout is replaced right away,
+    so the replacement starts up in the background. ``poll_ready`` starts the worker without waiting,
+    so calls made while it imports SymPy can run in-process instead.
+    """
+
+    def __init__(self) -> None:
+        self._process: Optional[subprocess.Popen] = None
+        self._responses: "queue.Queue[Any]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._ready = False
+        self._started_at = 0.0
+
+    def is_alive(self) -> bool:
+        """Check whether the worker process is running."""
+        return self._process is not None and self._process.poll() is None
+
+    def _start(self) -> None:
+        """Start the worker process without waiting for it to become ready."""
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+        self._process = subprocess.Popen(
+            [sys.executable, "-c", "from strands_tools.calculator import run_symbolic_worker; run_symbolic_worker()"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+        )
+        self._responses = queue.Queue()
+        self._ready = False
+        self._started_at = time.monotonic()
+        reader = threading.Thread(target=self._read_responses, args=(self._process.stdout, self._responses))
+        reader.daemon = True
+        reader.start()
+
+    def _wait_until_ready(self, deadline: float, budget: float) -> None:
+        """Wait for a starting worker until the caller's deadline."""
+        if self._ready:
+            return
+        try:
+            status, _ = self._responses.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            if time.monotonic() - self._started_at < WORKER_STARTUP_TIMEOUT:
+                raise SymbolicTimeoutError(
+                    f"Symbolic worker did not start within the {budget:g}s time budget"
+                ) from None
+            status = "timeout"
+        if status != "ready":
+            self.stop()
+            raise RuntimeError(f"Symbolic worker failed to start ({status})")
+        self._ready = True
+        logger.debug("Symbolic worker started")
+
+    def poll_ready(self) -> bool:
+        """Start the worker in the background if needed and return whether it can take calls now."""
+        if not self._lock.acquire(blocking=False):
+            # Busy with a call, so it is running; the caller waits in line
+            return True
+        try:
+            if not self.is_alive():
+                self._start()
+            if not self._ready:
+                try:
+                    status, _ = self._responses.get_nowait()
+                except queue.Empty:
+                    return False
+                if status != "ready":
+                    self.stop()
+                    raise RuntimeError(f"Symbolic worker failed to start ({status})")
+                self._ready = True
+                logger.debug("Symbolic worker started")
+            return True
+        finally:
+            self._lock.release()
+
+    def _restart(self) -> None:
+        """Replace a killed worker so that its successor starts while the caller moves on."""
+        self.stop()
+        try:
+            self._start()
+        except Exception as e:
+            logger.debug(f"Error restarting symbolic worker: {str(e)}")
+
+    @staticmethod
+    def _read_responses(stream: IO[bytes], responses: "queue.Queue[Any]") -> None:
+        """Forward messages from the worker to the response queue until it exits."""
+        try:
+            while True:
+                message = _read_frame(stream)
+                if message is None:
+                    break
+                responses.put(message)
+        except Exception as e:
+            logger.debug(f"Symbolic worker stream error: {str(e)}")
+        responses.put(("exit", None))
+
+    def run(self, name: str, args: Tuple[Any, ...], timeout: float) -> Any:
+        """Run a named symbolic operation, raising SymbolicTimeoutError if it exceeds the timeout."""
+        deadline = time.monotonic() + timeout
+        if not self._lock.acquire(timeout=timeout):
+            raise SymbolicTimeoutError(f"Symbolic worker stayed busy for the whole {timeout:g}s time budget")
+        try:
+            if not self.is_alive():
+                self._start()
+            self._wait_until_ready(deadline, timeout)
+            _write_frame(self._process.stdin, (name, args))
+            try:
+                status, payload = self._responses.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                self._restart()
+                raise SymbolicTimeoutError(f"Symbolic {name} exceeded the {timeout:g}s time budget") from None
+        finally:
+            self._lock.release()
+
+        if status == "error":
+            raise ValueError(payload)
+        if status != "ok":
+            self.stop()
+            raise RuntimeError("Symbolic worker exited unexpectedly")
+        return payload
+
+    def stop(self) -> None:
+        """Kill the worker process; the next call starts a fresh one."""
+        if self._process is None:
+            return
+        try:
+            self._process.kill()
+            self._process.wait(timeout=5)
+        except Exception as e:
+            logger.debug(f"Error stopping symbolic worker: {str(e)}")
+        finally:
+            for stream in (self._process.stdin, self._process.stdout):
+                try:
+                    stream.close()
+                except Exception:
+                    pass
+            self._process = None
+            self._ready = False
+
+
+symbolic_worker = SymbolicWorker()
+atexit.register(symbolic_worker.stop)
+
+
+def run_symbolic(name: str, args: Tuple[Any, ...], timeout: float) -> Any:
+    """Run a symbolic operation within a time budget in the worker process.
+
+    A timeout of zero or less runs the operation inline without a budget. If the worker cannot be
+    started, the operation also runs inline so the calculator keeps working. While the worker is
+    still starting, the operation runs in this process through ``run_fallback``: the caller gets
+    its answer or a timeout within the budget, but an overrunning operation cannot be killed.
+    """
+    if timeout <= 0:
+        return SYMBOLIC_OPERATIONS[name](*args)
+    try:
+        ready = symbolic_worker.poll_ready()
+    except Exception as e:
+        logger.warning(f"Symbolic worker unavailable, running {name} inline: {str(e)}")
+        return SYMBOLIC_OPERATIONS[name](*args)
+    if not ready:
+        return run_fallback(SYMBOLIC_OPERATIONS[name], args, time.monotonic() + timeout)
+    try:
+        return symbolic_worker.run(name, args, timeout)
+    except (SymbolicTimeoutError, ValueError):
+        raise
+    except Exception as e:
+        logger.warning(f"Symbolic worker unavailable, running {name} inline: {str(e)}")
+        return SYMBOLIC_OPERATIONS[name](*args)
+
+
+def run_fallback(func: Callable, args: Tuple[Any, ...], deadline: Optional[float]) -> Any:
+    """Run a numeric fallback in this process, giving up at the deadline of the call.
+
+    The fallback runs in a daemon thread that cannot be killed; it is left to finish in the
+    background when it overruns. Numeric methods have iteration limits of their own, so it does.
+    """
+    if deadline is None:
+        return func(*args)
+
+    outcome: Dict[str, Any] = {}
+
+    def target() -> None:
+        try:
+            outcome["result"] = func(*args)
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(max(0.0, deadline - time.monotonic()))
+    if thread.is_alive():
+        raise SymbolicTimeoutError("Numeric fallback did not finish within the time budget")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+def needs_symbolic_worker(expr: Any, variables: Optional[Dict[str, Any]]) -> bool:
+    """Return whether evaluating an expression involves simplifying a symbolic expression.
+
+    Expressions that are plain numbers once the variables are substituted are cheap to evaluate
+    and are not worth a round trip to the worker process.
+    """
+    try:
+        substituted = preprocess_expression(expr, variables)
+    except Exception:
+        return True
+    return isinstance(substituted, sp.Basic) and bool(substituted.free_symbols)
+
+
+class SymbolicResultCache(PickleFileCache):
+    """Persistent cache of symbolic results keyed on the canonical form of the input.
+
+    Keys combine the operation, ``sp.srepr`` of the parsed expression, the operation parameters and
+    the SymPy version. Entries are stored by PickleFileCache, and recently used ones are also kept
+    in memory. The cache is off unless CALCULATOR_RESULT_CACHE is set.
+    """
+
+    MEMORY_ENTRIES = 128
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        super().__init__(directory, max_bytes)
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+
+    @staticmethod
+    def make_key(operation: str, expr: Any, params: Tuple[Any, ...]) -> str:
+        """Build a cache key from the operation, canonical expression form and parameters."""
+        canonical = sp.srepr(expr) if isinstance(expr, sp.Basic) else repr(expr)
+        text = f"{sp.__version__}|{operation}|{canonical}|{params!r}"
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Any:
+        """Get a cached result, or None if there is none."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+        value = super().get(key)
+        if value is not None:
+            self._remember(key, value)
+        return value
+
+    def set(self, key: str, value: Any) -> bool:
+        """Store a result on disk and in memory, evicting old entries if over the size limit."""
+        self._remember(key, value)
+        return super().set(key, value)
+
+    def _remember(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.MEMORY_ENTRIES:
+                self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        with self._lock:
+            self._memory.clear()
+        super().clear()
+
+
+_result_caches: Dict[Tuple[str, int], SymbolicResultCache] = {}
+
+
+def get_result_cache() -> Optional[SymbolicResultCache]:
+    """Get the result cache configured by the environment, or None when it is disabled."""
+    if os.getenv("CALCULATOR_RESULT_CACHE", "").lower() != "true":
+        return None
+    max_bytes = int(float(os.getenv("CALCULATOR_RESULT_CACHE_MAX_MB", "100")) * 1024 * 1024)
+    if max_bytes <= 0:
+        return None
+    directory = os.getenv("CALCULATOR_RESULT_CACHE_DIR", str(Path.home() / ".strands" / "calculator_cache"))
+    key = (directory, max_bytes)
+    if key not in _result_caches:
+        try:
+            _result_caches[key] = SymbolicResultCache(Path(directory), max_bytes)
+        except OSError as e:
+            logger.warning(f"Result cache disabled, cannot use {directory}: {str(e)}")
+            return None
+    return _result_caches[key]
+
+
+def cached_symbolic(operation: str, expr: Any, params: Tuple[Any, ...], compute: Callable[[], Any]) -> Any:
+    """Return a cached symbolic result or compute and cache it."""
+    cache = get_result_cache()
+    if cache is None:
+        return compute()
+
+    key = cache.make_key(operation, expr, params)
+    result = cache.get(key)
+    if result is None:
+        result = compute()
+        cache.set(key, result)
+    return result
+
+
+# Functions available in matrix mode, e.g. "det([[1, 2], [3, 4]])" or "solve([[3, 1], [1, 2]], [9, 8])"
+MATRIX_FUNCTIONS = ("det", "inv", "solve", "eig", "eigvals", "svd", "rank", "transpose", "trace")
+
+# Largest integer magnitude a float64 holds exactly; bigger integers keep a matrix on the exact SymPy path
+FLOAT_EXACT_INTEGER = 2**53
+
+
+class NumpyMatrixOps:
+    """Matrix operations for floating-point matrices, backed by NumPy/LAPACK."""
+
+    def __init__(self, np: Any) -> None:
+        self.np = np
+
+    def matrix(self, data: List[Any]) -> Any:
+        return self.np.array(data)
+
+    def product(self, a: Any, b: Any) -> Any:
+        return a @ b if self.np.ndim(a) and self.np.ndim(b) else a * b
+
+    def power(self, a: Any, exponent: int) -> Any:
+        return self.np.linalg.matrix_power(a, exponent)
+
+    def det(self, a: Any) -> Any:
+        return self.np.linalg.det(a)
+
+    def inv(self, a: Any) -> Any:
+        return self.np.linalg.inv(a)
+
+    def solve(self, a: Any, b: Any) -> Any:
+        return self.np.linalg.solve(a, b)
+
+    def eig(self, a: Any) -> Dict[str, Any]:
+        eigenvalues, eigenvectors = self.np.linalg.eig(a)
+        return {"eigenvalues": eigenvalues, "eigenvectors": eigenvectors}
+
+    def eigvals(self, a: Any) -> Any:
+        return self.np.linalg.eigvals(a)
+
+    def svd(self, a: Any) -> Any:
+        return self.np.linalg.svd(a, compute_uv=False)
+
+    def rank(self, a: Any) -> Any:
+        return self.np.linalg.matrix_rank(a)
+
+    def transpose(self, a: Any) -> Any:
+        return self.np.transpose(a)
+
+    def trace(self, a: Any) -> Any:
+        return self.np.trace(a)
+
+
+class SympyMatrixOps:
+    """Exact matrix operations on SymPy matrices, used unless entries are floats and NumPy is installed."""
+
+    def matrix(self, data: List[Any]) -> Any:
+        return sp.Matrix(data)
+
+    def product(self, a: Any, b: Any) -> Any:
+        return a * b
+
+    def power(self, a: Any, exponent: int) -> Any:
+        return a**exponent
+
+    def det(self, a: Any) -> Any:
+        return a.det()
+
+    def inv(self, a: Any) -> Any:
+        return a.inv()
+
+    def solve(self, a: Any, b: Any) -> Any:
+        return a.LUsolve(b)
+
+    def eig(self, a: Any) -> Any:
+        return a.eigenvects()
+
+    def eigvals(self, a: Any) -> Any:
+        return a.eigenvals()
+
+    def svd(self, a: Any) -> Any:
+        return a.singular_values()
+
+    def rank(self, a: Any) -> Any:
+        return a.rank()
+
+    def transpose(self, a: Any) -> Any:
+        return a.T
+
+    def trace(self, a: Any) -> Any:
+        return a.trace()
+
+
+def _validate_matrix_literal(value: Any) -> Tuple[bool, bool]:
+    """Check that a literal is a vector or rectangular matrix.
+
+    Returns whether every entry fits a float64 exactly and whether any entry is a float or complex.
+    """
+    rows = value if value and all(isinstance(row, (list, tuple)) for row in value) else [value]
+    if not rows[0] or any(len(row) != len(rows[0]) for row in rows):
+        raise ValueError("rows must be non-empty and all have the same length")
+    for row in rows:
+        for entry in row:
+            if isinstance(entry, (list, tuple)):
+                raise ValueError("matrices must be one- or two-dimensional")
+    entries = [entry for row in rows for entry in row]
+    fits_float = all(
+        isinstance(entry, (float, complex)) or (type(entry) is int and abs(entry) <= FLOAT_EXACT_INTEGER)
+        for entry in entries
+    )
+    return fits_float, any(isinstance(entry, (float, complex)) for entry in entries)
+
+
 def parse_matrix_expression(expr_str: str) -> Any:
-    """Parse matrix expression and perform operations."""
+    """Parse matrix expression and perform operations.
+
+    Supports matrix literals, +, -, * (matrix product or scalar scaling), @, ** with an integer
+    exponent, and the functions in MATRIX_FUNCTIONS. Matrices with float entries are computed with
+    NumPy when it is installed. Integer, big-integer and symbolic (string) entries use SymPy, which
+    keeps results exact.
+    """
     try:
-        # Function to safely convert string to matrix
-        def safe_matrix_from_str(matrix_str: str) -> Any:
-            # Use ast.literal_eval for safe evaluation of matrix literals
+        try:
+            tree = ast.parse(expr_str.strip(), mode="eval").body
+        except SyntaxError as e:
+            raise ValueError(f"Invalid matrix format: {str(e)}") from e
+
+        # Evaluate each matrix literal once and use them to decide between the numeric and symbolic engines
+        literals: Dict[int, Any] = {}
+        pending = [tree]
+        while pending:
+            node = pending.pop()
+            if isinstance(node, (ast.List, ast.Tuple)):
+                try:
+                    literals[id(node)] = ast.literal_eval(node)
+                except ValueError as e:
+                    raise ValueError(f"Invalid matrix format: {str(e)}") from e
+            else:
+                pending.extend(ast.iter_child_nodes(node))
+
+        fits_float, has_float = True, False
+        for literal in literals.values():
             try:
-                matrix_data = ast.literal_eval(matrix_str.strip())
-                return sp.Matrix(matrix_data)
-            except (ValueError, SyntaxError) as e:
+                literal_fits, literal_has_float = _validate_matrix_literal(literal)
+            except ValueError as e:
                 raise ValueError(f"Invalid matrix format: {str(e)}") from e
+            fits_float = fits_float and literal_fits
+            has_float = has_float or literal_has_float
 
-        # Split into parts for operations
-        parts = expr_str.split("*")
-        if len(parts) == 2:
-            # Handle multiplication
-            matrix1 = safe_matrix_from_str(parts[0])
-            matrix2 = safe_matrix_from_str(parts[1])
-            return matrix1 * matrix2
-        elif "+" in expr_str:
-            # Handle addition
-            parts = expr_str.split("+")
-            matrix1 = safe_matrix_from_str(parts[0])
-            matrix2 = safe_matrix_from_str(parts[1])
-            return matrix1 + matrix2
-        else:
-            # Single matrix operations
-            return safe_matrix_from_str(expr_str)
+        ops: Union[NumpyMatrixOps, SympyMatrixOps] = SympyMatrixOps()
+        if fits_float and has_float:
+            try:
+                import numpy as np  # Imported here to keep NumPy optional
+
+                ops = NumpyMatrixOps(np)
+            except ImportError:
+                logger.debug("NumPy not installed, using SymPy for float matrices")
+
+        return _evaluate_matrix_node(tree, ops, literals)
     except Exception as e:
         raise ValueError(f"Matrix parsing error: {str(e)}") from e
 
 
+def _evaluate_matrix_node(node: ast.AST, ops: Union[NumpyMatrixOps, SympyMatrixOps], literals: Dict[int, Any]) -> Any:
+    """Recursively evaluate a parsed matrix expression with the given operations and pre-evaluated literals."""
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return ops.matrix(literals[id(node)])
+
+    if isinstance(node, ast.Constant) or (isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub)):
+        value = ast.literal_eval(node)
+        return sp.sympify(value) if isinstance(value, str) else value
+
+    if isinstance(node, ast.BinOp):
+        left = _evaluate_matrix_node(node.left, ops, literals)
+        if isinstance(node.op, ast.Pow):
+            exponent = ast.literal_eval(node.right)
+            if not isinstance(exponent, int):
+                raise ValueError("Matrix powers need an integer exponent")
+            return ops.power(left, exponent)
+        right = _evaluate_matrix_node(node.right, ops, literals)
+        if isinstance(node.op, ast.Add):
+            return left + right
+        if isinstance(node.op, ast.Sub):
+            return left - right
+        if isinstance(node.op, (ast.Mult, ast.MatMult)):
+            return ops.product(left, right)
+
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in MATRIX_FUNCTIONS:
+        args = [_evaluate_matrix_node(arg, ops, literals) for arg in node.args]
+        return getattr(ops, node.func.id)(*args)
+
+    raise ValueError(f"Invalid matrix format: unsupported syntax '{ast.unparse(node)}'")
+
+
+def format_matrix_result(result: Any) -> Any:
+    """Convert NumPy results to SymPy matrices and Python numbers, so both engines print alike."""
+    if isinstance(result, dict) and all(type(value).__module__ == "numpy" for value in result.values()):
+        return ", ".join(f"{key}: {sp.sstr(format_matrix_result(value))}" for key, value in result.items())
+    if type(result).__module__ != "numpy":
+        return result
+    if getattr(result, "ndim", 0) == 0:
+        return result.item()
+    return sp.Matrix(result.tolist())
+
+
 @tool
 def calculator(
     expression: str,
@@ -597,6 +1422,7 @@ def calculator(
     wrt: str = None,
     point: str = None,
     order: int = None,
+    timeout: float = None,
 ) -> dict:
     """
     Calculator powered by SymPy for comprehensive mathematical operations.
@@ -623,7 +1449,8 @@ def calculator(
     - integrate: Find the indefinite integral of an expression
     - limit: Evaluate the limit of an expression at a point
     - series: Generate series expansion of an expression
-    - matrix: Perform matrix operations
+    - matrix: Perform matrix operations (products, det, inv, solve, eig, svd, ...)
+    - batch: Evaluate an expression over many rows of variable values in one vectorized pass
 
     Common Usage Scenarios:
     ---------------------
@@ -646,6 +1473,7 @@ def calculator(
             - "limit": Calculate the limit of an expression at a point
             - "series": Generate a series expansion of an expression
             - "matrix": Perform matrix operations
+            - "batch": Evaluate the expression for every row of values in "variables"
         precision: Number of decimal places for the result (default: 10).
             Higher values provide more precise output but may impact performance.
         scientific: Whether to use scientific notation for numbers (default: False).
@@ -653,13 +1481,21 @@ def calculator(
         force_numeric: Force numeric evaluation of symbolic expressions (default: False).
             When True, tries to convert symbolic results to numeric values.
         variables: Optional dictionary of variable names and their values to substitute
-            in the expression, e.g., {"a": 1, "b": 2}.
+            in the expression, e.g., {"a": 1, "b": 2}. In "batch" mode each value may be a
+            list of values, a range such as {"start": 0, "stop": 10, "step": 0.5} or
+            {"start": 0, "stop": 1, "num": 101}, or a scalar applied to every row; lists and
+            ranges are paired row by row and must have the same length.
         wrt: Variable to differentiate or integrate with respect to (required for
             "derive" and "integrate" modes).
         point: Point at which to evaluate a limit (required for "limit" mode).
             Use "oo" for infinity.
         order: Order of derivative or series expansion (optional for "derive" and
             "series" modes, default is 1 for derivatives and 5 for series).
+        timeout: Time budget in seconds for symbolic solving, integration, limits and
+            simplification of symbolic expressions (default: 10). These run in a separate worker
+            process, killed when it uses up three quarters of the budget, and the calculator then
+            falls back to numeric methods (mpmath findroot, numeric limits, unsimplified
+            evaluation) for the rest of it. Use 0 to disable.
 
     Returns:
         Dict containing status and response content in the format:
@@ -675,9 +1511,18 @@ def calculator(
         - For equation solving, set the expression equal to zero implicitly (x**2 + 1 means x**2 + 1 = 0)
         - Use 'pi' and 'e' for mathematical constants
         - The 'wrt' parameter is required for differentiation and integration
-        - Matrix expressions use Python-like syntax: [[1, 2], [3, 4]]
+        - Matrix expressions use Python-like syntax: [[1, 2], [3, 4]], combined with +, -, *, **
+          and the functions det, inv, solve, eig, eigvals, svd, rank, transpose and trace.
+          Purely numeric matrices are computed with NumPy when installed; use string entries
+          such as [["a", 1], [0, "b"]] for symbolic matrices
         - Precision control impacts display only, internal calculations use higher precision
         - Symbolic results are returned when possible unless force_numeric=True
+        - With CALCULATOR_RESULT_CACHE=true, derivatives, integrals and series expansions are cached
+          on disk (CALCULATOR_RESULT_CACHE_DIR) so repeated work is answered instantly, also across
+          processes
+        - Batch mode returns summary statistics (min, max, mean, std, sum) and the leading rows
+        - Parsed expressions are cached by their text, and evaluations where every variable has a
+          numeric value use a compiled mpmath function instead of symbolic substitution
     """
     console = console_util.create()
 
@@ -692,62 +1537,115 @@ def calculator(
         default_order = int(os.getenv("CALCULATOR_DERIVE_ORDER", "1"))
         default_series_point = os.getenv("CALCULATOR_SERIES_POINT", "0")
         default_series_order = int(os.getenv("CALCULATOR_SERIES_ORDER", "5"))
+        timeout = float(os.getenv("CALCULATOR_TIMEOUT", "10")) if timeout is None else float(timeout)
+        # The symbolic operation gets part of the budget; its numeric fallback must finish by the deadline
+        deadline = time.monotonic() + timeout if timeout > 0 else None
+        symbolic_timeout = timeout * SYMBOLIC_BUDGET_SHARE
 
         # Extract parameters
         variables = variables or {}
 
         # Parse the expression
+        compiled = None
         if mode == "matrix":
             expr = parse_matrix_expression(expression)
         else:
-            expr = parse_expression(expression)
+            compiled = compile_expression(expression)
+            expr = compiled.expr
 
         # Process based on mode
         additional_info = {}
 
         if mode == "solve":
             if isinstance(expr, list):
-                result = solve_equation(expr, precision)
                 operation = "Solve System of Equations"
             else:
-                result = solve_equation(expr, precision)
                 operation = "Solve Equation"
+            try:
+                result = run_symbolic("solve", (expr, precision), symbolic_timeout)
+            except SymbolicTimeoutError:
+                result = run_fallback(numeric_solve, (expr, precision), deadline)
+                additional_info["Fallback"] = (
+                    f"Symbolic solving exceeded {symbolic_timeout:g}s; roots found numerically"
+                )
 
         elif mode == "derive":
             var = wrt or str(list(expr.free_symbols)[0])
             actual_order = order or default_order
-            result = calculate_derivative(expr, var, actual_order)
+            result = cached_symbolic(
+                "derive", expr, (var, actual_order), lambda: calculate_derivative(expr, var, actual_order)
+            )
             operation = f"Calculate {actual_order}-th Derivative"
             additional_info = {"With respect to": var}
 
         elif mode == "integrate":
             var = wrt or str(list(expr.free_symbols)[0])
-            result = calculate_integral(expr, var)
             operation = "Calculate Integral"
             additional_info = {"With respect to": var}
+            try:
+                result = cached_symbolic(
+                    "integrate", expr, (var,), lambda: run_symbolic("integrate", (expr, var), symbolic_timeout)
+                )
+            except SymbolicTimeoutError:
+                # An indefinite integral has no numeric form, so the integral is returned unevaluated
+                result = sp.Integral(expr, sp.Symbol(var))
+                additional_info["Fallback"] = (
+                    f"Symbolic integration exceeded {symbolic_timeout:g}s; integral left unevaluated"
+                )
 
         elif mode == "limit":
             var = wrt or str(list(expr.free_symbols)[0])
             point_val = point or default_series_point
-            result = calculate_limit(expr, var, point_val)
             operation = "Calculate Limit"
             additional_info = {"Variable": var, "Point": point_val}
+            try:
+                result = run_symbolic("limit", (expr, var, point_val), symbolic_timeout)
+            except SymbolicTimeoutError:
+                result = run_fallback(numeric_limit, (expr, var, point_val), deadline)
+                additional_info["Fallback"] = (
+                    f"Symbolic limit exceeded {symbolic_timeout:g}s; limit approximated numerically"
+                )
 
         elif mode == "series":
             var = wrt or str(list(expr.free_symbols)[0])
             point_val = point or default_series_point
             actual_order = order or default_series_order
-            result = calculate_series(expr, var, point_val, actual_order)
+            result = cached_symbolic(
+                "series",
+                expr,
+                (var, point_val, actual_order),
+                lambda: calculate_series(expr, var, point_val, actual_order),
+            )
             operation = "Calculate Series Expansion"
             additional_info = {"Variable": var, "Point": point_val, "Order": actual_order}
 
         elif mode == "matrix":
-            result = expr
+            result = format_matrix_result(expr)
             operation = "Matrix Operation"
 
+        elif mode == "batch":
+            inputs, values = batch_evaluate(compiled, variables)
+            result = summarize_batch(inputs, values, precision, scientific)
+            operation = "Batch Evaluation"
+            additional_info = {"Rows": len(values)}
+
         else:  # evaluate
-            result = evaluate_expression(expr, variables, precision, scientific, force_numeric)
             operation = "Evaluate Expression"
+            result = fast_numeric_evaluation(compiled, variables, precision, scientific)
+            if result is None and not needs_symbolic_worker(expr, variables):
+                result = evaluate_expression(expr, variables, precision, scientific, force_numeric)
+            elif result is None:
+                try:
+                    result = run_symbolic(
+                        "evaluate", (expr, variables, precision, scientific, force_numeric), symbolic_timeout
+                    )
+                except SymbolicTimeoutError:
+                    result = run_fallback(
+                        evaluate_expression,
+                        (expr, variables, precision, scientific, force_numeric, False),
+                        deadline,
+                    )
+                    additional_info["Fallback"] = f"Simplification exceeded {symbolic_timeout:g}s; evaluated without it"
             if force_numeric:
                 additional_info["Note"] = "Forced numerical evaluation"
             if scientific:
@@ -765,9 +1663,13 @@ def calculator(
             )
         )
 
+        result_text = f"Result: {result}"
+        if "Fallback" in additional_info:
+            result_text += f"\nNote: {additional_info['Fallback']}"
+
         return {
             "status": "success",
-            "content": [{"text": f"Result: {result}"}],
+            "content": [{"text": result_text}],
         }
 
     except Exception as e:
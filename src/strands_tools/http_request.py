@@ -16,17 +16,27 @@ Use the environment tool (agent.tool.environment) to view available environment
 - Set new: environment(action="set", name="CUSTOM_TOKEN", value="your-token")
 """
 
+import asyncio
 import base64
+import bisect
+import codecs
 import collections
+import contextlib
 import datetime
+import email.utils
+import hashlib
 import http.cookiejar
 import json
+import logging
 import os
+import threading
 import time
-from typing import Any, Dict, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Coroutine, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
-import markdownify
+import aiohttp
 import requests
 from aws_requests_auth.aws_auth import AWSRequestsAuth
 from requests.adapters import HTTPAdapter
@@ -42,8 +52,12 @@ from strands.types.tools import (
 from urllib3 import Retry
 
 from strands_tools.utils import console_util
+from strands_tools.utils.file_cache import PickleFileCache
+from strands_tools.utils.html_util import html_to_markdown
 from strands_tools.utils.user_input import get_user_input
 
+logger = logging.getLogger(__name__)
+
 TOOL_SPEC = {
     "name": "http_request",
     "description": (
@@ -57,6 +71,15 @@ TOOL_SPEC = {
         "json": {
             "type": "object",
             "properties": {
+                "action": {
+                    "type": "string",
+                    "enum": ["request", "metrics"],
+                    "description": (
+                        "'request' (default) sends an HTTP request. 'metrics' returns rolling per-host latency "
+                        "percentiles (p50/p95/p99), byte counts, status classes and retries for recent requests, "
+                        "optionally limited to the host of 'url'"
+                    ),
+                },
                 "method": {
                     "type": "string",
                     "description": "HTTP method (GET, POST, PUT, DELETE, etc.)",
@@ -122,10 +145,27 @@ TOOL_SPEC = {
                     "type": "boolean",
                     "description": "Whether to collect request metrics",
                 },
+                "cache": {
+                    "type": "boolean",
+                    "description": (
+                        "Serve GET requests from a local HTTP cache that honors Cache-Control, Expires, ETag and "
+                        "Last-Modified, revalidating stale entries (default: HTTP_REQUEST_CACHE env var or False)"
+                    ),
+                },
                 "streaming": {
                     "type": "boolean",
                     "description": "Enable streaming response handling",
                 },
+                "save_to": {
+                    "type": "string",
+                    "description": (
+                        "Stream the response body straight to this file instead of returning it (implies streaming)"
+                    ),
+                },
+                "max_bytes": {
+                    "type": "integer",
+                    "description": "Stop reading the response body after this many bytes (implies streaming)",
+                },
                 "allow_redirects": {
                     "type": "boolean",
                     "description": "Whether to follow redirects (default: True)",
@@ -186,36 +226,877 @@ TOOL_SPEC = {
                         "ftp": {"type": "string"},
                     },
                 },
+                "requests": {
+                    "type": "array",
+                    "description": (
+                        "Batch mode: run many requests concurrently and return results in input order. Each item "
+                        "needs a url and may override method (default GET), headers, body, timeout, auth settings, "
+                        "verify_ssl, allow_redirects, max_bytes and convert_to_markdown; top-level values are "
+                        "used as defaults"
+                    ),
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "method": {"type": "string"},
+                            "url": {"type": "string"},
+                            "headers": {"type": "object"},
+                            "body": {"type": "string"},
+                            "timeout": {"type": "number"},
+                        },
+                        "required": ["url"],
+                    },
+                },
+                "max_concurrency": {
+                    "type": "integer",
+                    "description": "Batch mode: maximum requests in flight at once (default: 32)",
+                },
+                "max_per_host": {
+                    "type": "integer",
+                    "description": "Batch mode: maximum requests in flight per host (default: 6)",
+                },
+                "timeout": {
+                    "type": "number",
+                    "description": "Batch mode: default timeout in seconds for each request (default: 30)",
+                },
             },
-            "required": ["method", "url"],
+            "required": [],
         }
     },
 }
 
-# Session cache keyed by domain
-SESSION_CACHE = {}
+# Character budget for HTML converted to markdown
+MARKDOWN_MAX_CHARS = int(os.getenv("HTTP_REQUEST_MARKDOWN_MAX_CHARS", "50000"))
+
+# Size of the chunks read from streamed response bodies
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Batch mode limits
+BATCH_MAX_REQUESTS = int(os.getenv("HTTP_REQUEST_BATCH_MAX_REQUESTS", "1000"))
+BATCH_CONCURRENCY = int(os.getenv("HTTP_REQUEST_BATCH_CONCURRENCY", "32"))
+BATCH_PER_HOST = int(os.getenv("HTTP_REQUEST_BATCH_PER_HOST", "6"))
+BATCH_TIMEOUT = float(os.getenv("HTTP_REQUEST_BATCH_TIMEOUT", "30"))
+
+# Settings a batch item inherits from the top-level tool input unless it sets them itself
+BATCH_SHARED_FIELDS = (
+    "method",
+    "headers",
+    "timeout",
+    "auth_type",
+    "auth_token",
+    "auth_env_var",
+    "basic_auth",
+    "jwt_config",
+    "verify_ssl",
+    "allow_redirects",
+    "max_bytes",
+    "convert_to_markdown",
+    "proxies",
+)
+
+# Session pool limits
+MAX_SESSIONS = int(os.getenv("HTTP_REQUEST_MAX_SESSIONS", "64"))
+MAX_CONNECTIONS = int(os.getenv("HTTP_REQUEST_MAX_CONNECTIONS", "256"))
+SESSION_IDLE_TIMEOUT = float(os.getenv("HTTP_REQUEST_SESSION_IDLE_TIMEOUT", "300"))
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class SessionPool:
+    """Thread-safe LRU pool of requests sessions.
+
+    Sessions are keyed by (scheme, host, port) plus the pool and retry settings they were
+    created with, so a session configured with a small pool is never handed to a caller that
+    asked for a larger one. Every session reserves ``pool_size`` connections against
+    ``max_connections``; the least recently used sessions are evicted when either limit would
+    be exceeded, and sessions unused for ``idle_timeout`` seconds are evicted on the next lookup.
+
+    ``get`` counts the caller as a user of the session until it calls ``release``. Evicted
+    sessions are closed right away when nobody uses them, and otherwise by the last ``release``;
+    until then their connections still count against ``max_connections``.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = MAX_SESSIONS,
+        max_connections: int = MAX_CONNECTIONS,
+        idle_timeout: float = SESSION_IDLE_TIMEOUT,
+    ):
+        self.max_sessions = max(1, max_sessions)
+        self.max_connections = max(1, max_connections)
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._sessions: "collections.OrderedDict[Tuple, Dict[str, Any]]" = collections.OrderedDict()
+        # Entries by id of their session, including evicted ones still in use
+        self._entries: Dict[int, Dict[str, Any]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._idle_evictions = 0
+
+    @staticmethod
+    def make_key(url: str, config: Dict[str, Any]) -> Tuple:
+        """Build the pool key for a URL and session configuration."""
+        parsed = urlparse(url)
+        scheme = (parsed.scheme or "http").lower()
+        host = (parsed.hostname or "").lower()
+        try:
+            port = parsed.port or DEFAULT_PORTS.get(scheme)
+        except ValueError:
+            port = None
+        return (
+            scheme,
+            host,
+            port,
+            bool(config.get("keep_alive", True)),
+            int(config.get("pool_size", 10)),
+            int(config.get("max_retries", 3)),
+            bool(config.get("cookie_persistence", True)),
+        )
+
+    def get(self, url: str, config: Dict[str, Any]) -> requests.Session:
+        """Return the pooled session for ``url`` and ``config``, creating it if needed.
+
+        Call ``release`` with the session once the request, including reading its body, is done.
+        """
+        key = self.make_key(url, config)
+        now = time.monotonic()
+        with self._lock:
+            closable = self._retire(self._pop_idle(now))
+            entry = self._sessions.get(key)
+            if entry is not None:
+                self._hits += 1
+                self._sessions.move_to_end(key)
+            else:
+                self._misses += 1
+                connections = min(key[4], self.max_connections) if key[3] else 1
+                config = {**config, "pool_size": connections}
+                while self._sessions and (
+                    len(self._sessions) >= self.max_sessions
+                    or self._open_connections() + connections > self.max_connections
+                ):
+                    closable += self._retire([self._sessions.popitem(last=False)[1]])
+                    self._evictions += 1
+                entry = {"session": create_session(config), "connections": connections, "in_use": 0, "retired": False}
+                self._sessions[key] = entry
+                self._entries[id(entry["session"])] = entry
+            entry["last_used"] = now
+            entry["in_use"] += 1
+        self._close(closable)
+        return entry["session"]
+
+    def release(self, session: requests.Session) -> None:
+        """Mark a request with ``session`` as done, closing the session if it was evicted meanwhile."""
+        with self._lock:
+            entry = self._entries.get(id(session))
+            if entry is None or entry["session"] is not session:
+                return
+            entry["in_use"] = max(0, entry["in_use"] - 1)
+            closable = self._retire([entry]) if entry["retired"] else []
+        self._close(closable)
+
+    def evict_idle(self) -> int:
+        """Drop sessions that have been idle longer than ``idle_timeout``."""
+        with self._lock:
+            stale = self._pop_idle(time.monotonic())
+            closable = self._retire(stale)
+        self._close(closable)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Close every session, in use or not, and reset the statistics; for shutdown."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._sessions.clear()
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._idle_evictions = 0
+        self._close(entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of pool usage."""
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "connections": self._connections(),
+                "retired_in_use": len(self._entries) - len(self._sessions),
+                "open_connections": self._open_connections(),
+                "max_sessions": self.max_sessions,
+                "max_connections": self.max_connections,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "idle_evictions": self._idle_evictions,
+                "hosts": sorted({f"{key[1]}:{key[2]}" for key in self._sessions}),
+            }
+
+    def keys(self) -> list:
+        """Return the keys of the pooled sessions, least recently used first."""
+        with self._lock:
+            return list(self._sessions)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def _connections(self) -> int:
+        return sum(entry["connections"] for entry in self._sessions.values())
+
+    def _open_connections(self) -> int:
+        return sum(entry["connections"] for entry in self._entries.values())
+
+    def _retire(self, entries: list) -> list:
+        """Mark evicted entries and return those nobody uses, which can be closed. Caller holds the lock."""
+        closable = []
+        for entry in entries:
+            entry["retired"] = True
+            if entry["in_use"] == 0:
+                self._entries.pop(id(entry["session"]), None)
+                closable.append(entry)
+        return closable
+
+    @staticmethod
+    def _close(entries: list) -> None:
+        for entry in entries:
+            try:
+                entry["session"].close()
+            except Exception as e:
+                logger.debug(f"Error closing session: {str(e)}")
+
+    def _pop_idle(self, now: float) -> list:
+        if self.idle_timeout <= 0:
+            return []
+        stale_keys = [key for key, entry in self._sessions.items() if now - entry["last_used"] > self.idle_timeout]
+        self._idle_evictions += len(stale_keys)
+        return [self._sessions.pop(key) for key in stale_keys]
+
+
+# Shared session pool
+SESSION_POOL = SessionPool()
+
+# Metrics window settings
+METRICS_WINDOW = float(os.getenv("HTTP_REQUEST_METRICS_WINDOW", "3600"))
+METRICS_SLOTS = int(os.getenv("HTTP_REQUEST_METRICS_SLOTS", "12"))
+METRICS_MAX_HOSTS = int(os.getenv("HTTP_REQUEST_METRICS_MAX_HOSTS", "256"))
+
+# Upper bounds of the latency histogram buckets in milliseconds (1 ms to ~131 s, four per doubling)
+LATENCY_BUCKETS_MS = tuple(2 ** (i / 4) for i in range(69))
+
+STATUS_CLASSES = ("1xx", "2xx", "3xx", "4xx", "5xx", "error")
+
+
+class _MetricsSlot:
+    """Aggregated request measurements for one time slot of a host's rolling window."""
+
+    __slots__ = (
+        "epoch",
+        "count",
+        "latency",
+        "latency_sum",
+        "latency_max",
+        "bytes_sent",
+        "bytes_received",
+        "status",
+        "retries",
+    )
+
+    def __init__(self, epoch: int):
+        self.epoch = epoch
+        self.count = 0
+        self.latency = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.status = dict.fromkeys(STATUS_CLASSES, 0)
+        self.retries = 0
+
+
+class RequestMetrics:
+    """Fixed-memory rolling request metrics per host.
+
+    Each host keeps a ring of ``slots`` time slots covering the last ``window`` seconds. A slot
+    holds a log-scale latency histogram plus byte, status class and retry counters, so memory
+    stays constant no matter how many requests are made. At most ``max_hosts`` hosts are
+    tracked; the least recently used host is dropped when a new one arrives.
+    """
+
+    def __init__(self, window: float = METRICS_WINDOW, slots: int = METRICS_SLOTS, max_hosts: int = METRICS_MAX_HOSTS):
+        self.slots = max(1, slots)
+        self.slot_width = max(window, 1.0) / self.slots
+        self.max_hosts = max(1, max_hosts)
+        self._lock = threading.Lock()
+        self._hosts: "collections.OrderedDict[str, list]" = collections.OrderedDict()
+
+    def record(
+        self,
+        host: str,
+        duration: float,
+        status_code: Optional[int],
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        retries: int = 0,
+    ) -> None:
+        """Add one request to the host's current time slot.
+
+        A ``status_code`` of None records a request that failed without a response.
+        """
+        epoch = int(time.monotonic() // self.slot_width)
+        latency_ms = duration * 1000
+        status_class = f"{status_code // 100}xx" if status_code and 100 <= status_code < 600 else "error"
+
+        with self._lock:
+            ring = self._hosts.get(host)
+            if ring is None:
+                ring = [None] * self.slots
+                self._hosts[host] = ring
+                while len(self._hosts) > self.max_hosts:
+                    self._hosts.popitem(last=False)
+            else:
+                self._hosts.move_to_end(host)
+
+            index = epoch % self.slots
+            slot = ring[index]
+            if slot is None or slot.epoch != epoch:
+                slot = ring[index] = _MetricsSlot(epoch)
+
+            slot.count += 1
+            slot.latency[bisect.bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+            slot.latency_sum += latency_ms
+            slot.latency_max = max(slot.latency_max, latency_ms)
+            slot.bytes_sent += bytes_sent
+            slot.bytes_received += bytes_received
+            slot.status[status_class] += 1
+            slot.retries += retries
+
+    def summary(self, host: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Return windowed statistics keyed by host, optionally for a single host.
+
+        Latency percentiles are estimated from the histogram and reported in milliseconds.
+        """
+        current = int(time.monotonic() // self.slot_width)
+        with self._lock:
+            hosts = [host] if host is not None else list(self._hosts)
+            merged = {}
+            for name in hosts:
+                ring = self._hosts.get(name)
+                live = [slot for slot in ring or () if slot is not None and current - slot.epoch < self.slots]
+                if live:
+                    merged[name] = self._merge(live)
+
+        return {name: self._describe(totals) for name, totals in merged.items()}
+
+    def hosts(self) -> list:
+        """Return the tracked hosts, least recently used first."""
+        with self._lock:
+            return list(self._hosts)
+
+    def clear(self) -> None:
+        """Drop all recorded metrics."""
+        with self._lock:
+            self._hosts.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._hosts)
+
+    def __contains__(self, host: object) -> bool:
+        with self._lock:
+            return host in self._hosts
+
+    @staticmethod
+    def _merge(slots: list) -> Dict[str, Any]:
+        latency = [sum(counts) for counts in zip(*(slot.latency for slot in slots), strict=True)]
+        status = {name: sum(slot.status[name] for slot in slots) for name in STATUS_CLASSES}
+        return {
+            "count": sum(slot.count for slot in slots),
+            "latency": latency,
+            "latency_sum": sum(slot.latency_sum for slot in slots),
+            "latency_max": max(slot.latency_max for slot in slots),
+            "bytes_sent": sum(slot.bytes_sent for slot in slots),
+            "bytes_received": sum(slot.bytes_received for slot in slots),
+            "status": status,
+            "retries": sum(slot.retries for slot in slots),
+        }
+
+    @staticmethod
+    def _percentile(latency: list, count: int, maximum: float, percent: float) -> float:
+        rank = percent / 100 * count
+        seen = 0
+        for index, bucket_count in enumerate(latency):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = LATENCY_BUCKETS_MS[index - 1] if index else 0.0
+                upper = LATENCY_BUCKETS_MS[index] if index < len(LATENCY_BUCKETS_MS) else maximum
+                estimate = lower + (upper - lower) * (rank - seen) / bucket_count
+                return round(min(estimate, maximum), 3)
+            seen += bucket_count
+        return round(maximum, 3)
+
+    def _describe(self, totals: Dict[str, Any]) -> Dict[str, Any]:
+        count = totals["count"]
+        maximum = totals["latency_max"]
+        return {
+            "count": count,
+            "latency_ms": {
+                "p50": self._percentile(totals["latency"], count, maximum, 50),
+                "p95": self._percentile(totals["latency"], count, maximum, 95),
+                "p99": self._percentile(totals["latency"], count, maximum, 99),
+                "mean": round(totals["latency_sum"] / count, 3),
+                "max": round(maximum, 3),
+            },
+            "bytes_sent": totals["bytes_sent"],
+            "bytes_received": totals["bytes_received"],
+            "status": {name: value for name, value in totals["status"].items() if value},
+            "retries": totals["retries"],
+            "window_seconds": self.slot_width * self.slots,
+        }
+
+
+# Rolling per-host metrics
+REQUEST_METRICS = RequestMetrics()
+
+
+def get_request_metrics(host: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Return rolling latency percentiles, byte counts, status classes and retries per host."""
+    return REQUEST_METRICS.summary(host)
+
+
+# Per-host rate limit and circuit breaker defaults
+RATE_LIMIT = float(os.getenv("HTTP_REQUEST_RATE_LIMIT", "0"))
+RATE_BURST = float(os.getenv("HTTP_REQUEST_RATE_BURST", "0"))
+RATE_MAX_WAIT = float(os.getenv("HTTP_REQUEST_RATE_MAX_WAIT", "60"))
+BREAKER_THRESHOLD = int(os.getenv("HTTP_REQUEST_BREAKER_THRESHOLD", "5"))
+BREAKER_RESET_TIMEOUT = float(os.getenv("HTTP_REQUEST_BREAKER_RESET_TIMEOUT", "30"))
+HOST_LIMITS_MAX_HOSTS = 1024
+
+# Responses that count as upstream failures for the circuit breaker
+BREAKER_FAILURE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Raised when a host's circuit breaker is open and requests fail fast."""
+
+
+class RateLimitError(Exception):
+    """Raised when a host's rate limit would delay a request longer than the allowed wait."""
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens per second up to ``capacity`` tokens.
+
+    ``reserve`` takes a token immediately and returns how long the caller must wait before using
+    it, so synchronous callers can ``time.sleep`` and coroutines can ``asyncio.sleep`` on the same
+    bucket. Not thread-safe on its own; ``HostLimiter`` serializes access.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, max_wait: float) -> Optional[float]:
+        """Reserve a token and return the wait in seconds, or None if it would exceed ``max_wait``."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        wait = max(0.0, (1 - self.tokens) / self.rate)
+        if wait > max_wait:
+            return None
+        self.tokens -= 1
+        return wait
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with closed, open and half-open states.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and requests fail fast.
+    Once ``reset_timeout`` seconds have passed a single trial request is let through (half-open);
+    its success closes the circuit and its failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+
+    def allow(self) -> Optional[float]:
+        """Return None if a request may proceed, otherwise the seconds until the next trial."""
+        if self.state == self.CLOSED:
+            return None
+        now = time.monotonic()
+        if self.state == self.OPEN:
+            remaining = self.opened_at + self.reset_timeout - now
+            if remaining > 0:
+                return remaining
+            self.state = self.HALF_OPEN
+            self.trial_in_flight = False
+        if self.trial_in_flight:
+            return self.reset_timeout
+        self.trial_in_flight = True
+        return None
+
+    def record(self, success: bool) -> None:
+        """Update the breaker with the outcome of a request."""
+        if success:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.trial_in_flight = False
+            return
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self.trial_in_flight = False
+
+
+class HostLimiter:
+    """Process-wide per-host rate limits and circuit breakers shared by all http_request calls.
+
+    Defaults come from the ``HTTP_REQUEST_RATE_*`` and ``HTTP_REQUEST_BREAKER_*`` environment
+    variables; individual hosts can be configured with ``configure`` or the
+    ``HTTP_REQUEST_HOST_LIMITS`` JSON mapping of host to settings. A rate of 0 disables rate
+    limiting and a failure threshold of 0 disables the circuit breaker.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts: "collections.OrderedDict[str, Dict[str, Any]]" = collections.OrderedDict()
+        self._settings: Dict[str, Dict[str, float]] = {}
+        try:
+            for host, settings in json.loads(os.getenv("HTTP_REQUEST_HOST_LIMITS", "{}")).items():
+                self._settings[host.lower()] = dict(settings)
+        except (ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring invalid HTTP_REQUEST_HOST_LIMITS: {str(e)}")
+
+    def configure(
+        self,
+        host: str,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None,
+    ) -> None:
+        """Set the rate limit and breaker settings for a host, replacing its current state."""
+        settings = {
+            "rate": rate,
+            "burst": burst,
+            "failure_threshold": failure_threshold,
+            "reset_timeout": reset_timeout,
+        }
+        with self._lock:
+            self._settings[host.lower()] = {name: value for name, value in settings.items() if value is not None}
+            self._hosts.pop(host.lower(), None)
+
+    def _state(self, host: str) -> Dict[str, Any]:
+        state = self._hosts.get(host)
+        if state is not None:
+            self._hosts.move_to_end(host)
+            return state
+
+        settings = self._settings.get(host, {})
+        rate = float(settings.get("rate", RATE_LIMIT))
+        threshold = int(settings.get("failure_threshold", BREAKER_THRESHOLD))
+        state = {
+            "bucket": TokenBucket(rate, float(settings.get("burst", RATE_BURST)) or rate) if rate > 0 else None,
+            "breaker": (
+                CircuitBreaker(threshold, float(settings.get("reset_timeout", BREAKER_RESET_TIMEOUT)))
+                if threshold > 0
+                else None
+            ),
+        }
+        self._hosts[host] = state
+        while len(self._hosts) > HOST_LIMITS_MAX_HOSTS:
+            self._hosts.popitem(last=False)
+        return state
+
+    def acquire(self, host: str, max_wait: float = RATE_MAX_WAIT) -> float:
+        """Admit a request to ``host`` and return how long to wait before sending it.
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open.
+            RateLimitError: If the rate limit would delay the request longer than ``max_wait``.
+        """
+        host = host.lower()
+        with self._lock:
+            state = self._state(host)
+            breaker = state["breaker"]
+            if breaker is not None:
+                retry_in = breaker.allow()
+                if retry_in is not None:
+                    raise CircuitOpenError(
+                        f"Circuit open for {host} after {breaker.failures} consecutive failures; "
+                        f"retry in {retry_in:.1f} seconds"
+                    )
+            if state["bucket"] is None:
+                return 0.0
+            wait = state["bucket"].reserve(max_wait)
+            if wait is None:
+                if breaker is not None and breaker.trial_in_flight:
+                    breaker.trial_in_flight = False
+                raise RateLimitError(f"Rate limit for {host} would delay the request more than {max_wait:g} seconds")
+            return wait
+
+    def record(self, host: str, success: bool) -> None:
+        """Report the outcome of a request admitted by ``acquire``."""
+        with self._lock:
+            breaker = self._state(host.lower())["breaker"]
+            if breaker is not None:
+                breaker.record(success)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return the breaker state and available rate limit tokens per host."""
+        with self._lock:
+            return {
+                host: {
+                    "circuit": state["breaker"].state if state["breaker"] else "disabled",
+                    "consecutive_failures": state["breaker"].failures if state["breaker"] else 0,
+                    "tokens": round(state["bucket"].tokens, 2) if state["bucket"] else None,
+                }
+                for host, state in self._hosts.items()
+            }
+
+    def clear(self) -> None:
+        """Reset all host state, keeping configured settings."""
+        with self._lock:
+            self._hosts.clear()
+
+
+# Shared per-host rate limits and circuit breakers
+HOST_LIMITER = HostLimiter()
+
+
+def is_failure_status(status_code: Optional[int]) -> bool:
+    """Check whether a response status counts as an upstream failure for the circuit breaker."""
+    return status_code is None or status_code in BREAKER_FAILURE_STATUS_CODES
+
+
+# Status codes that may be stored and given heuristic freshness (RFC 9110 section 15.1)
+CACHEABLE_STATUS_CODES = {200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501}
+
+# Upper bound on heuristic freshness derived from Last-Modified
+HEURISTIC_FRESHNESS_LIMIT = 86400
+
+# Headers a 304 response must not overwrite in the stored response
+NOT_MODIFIED_EXCLUDED_HEADERS = {"content-length", "content-encoding", "transfer-encoding", "content-range"}
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Parse a Cache-Control header into a dict of lower-cased directives and their arguments."""
+    directives: Dict[str, Optional[str]] = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip().strip('"') if argument else None
+    return directives
+
+
+def _parse_seconds(value: Optional[str]) -> Optional[int]:
+    try:
+        return max(0, int(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _parse_http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def freshness_lifetime(headers: Any, response_time: float) -> float:
+    """Compute how long a response stays fresh in a private cache (RFC 9111 section 4.2.1)."""
+    directives = parse_cache_control(headers.get("Cache-Control"))
+    if "no-cache" in directives:
+        return 0.0
+    max_age = _parse_seconds(directives.get("max-age"))
+    if max_age is not None:
+        return float(max_age)
+
+    date = _parse_http_date(headers.get("Date")) or response_time
+    if "Expires" in headers:
+        expires = _parse_http_date(headers.get("Expires"))
+        return max(0.0, expires - date) if expires is not None else 0.0
+
+    last_modified = _parse_http_date(headers.get("Last-Modified"))
+    if last_modified is not None:
+        return min(max(0.0, (date - last_modified) / 10), HEURISTIC_FRESHNESS_LIMIT)
+    return 0.0
+
+
+def _vary_digest(vary: str, request_headers: Dict[str, Any]) -> str:
+    lowered = {str(k).lower(): str(v) for k, v in (request_headers or {}).items()}
+    names = sorted(name.strip().lower() for name in vary.split(",") if name.strip())
+    text = "|".join(f"{name}={lowered.get(name, '')}" for name in names)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def build_cache_entry(
+    response: requests.Response,
+    request_headers: Dict[str, Any],
+    request_time: float,
+    response_time: float,
+) -> Optional[Dict[str, Any]]:
+    """Build a storable cache entry from a response, or return None if it must not be cached."""
+    if response.status_code not in CACHEABLE_STATUS_CODES:
+        return None
+    request_directives = parse_cache_control((request_headers or {}).get("Cache-Control"))
+    directives = parse_cache_control(response.headers.get("Cache-Control"))
+    vary = response.headers.get("Vary", "")
+    if "no-store" in request_directives or "no-store" in directives or vary.strip() == "*":
+        return None
+
+    lifetime = freshness_lifetime(response.headers, response_time)
+    has_validator = "ETag" in response.headers or "Last-Modified" in response.headers
+    if lifetime <= 0 and not has_validator:
+        return None
+
+    # Initial age per RFC 9111 section 4.2.3
+    date = _parse_http_date(response.headers.get("Date"))
+    apparent_age = max(0.0, response_time - date) if date is not None else 0.0
+    age = _parse_seconds(response.headers.get("Age")) or 0
+    initial_age = max(apparent_age, age + (response_time - request_time))
+
+    return {
+        "status_code": response.status_code,
+        "reason": response.reason,
+        "headers": dict(response.headers),
+        "content": response.content,
+        "response_time": response_time,
+        "initial_age": initial_age,
+        "freshness_lifetime": lifetime,
+        "vary": vary,
+        "vary_digest": _vary_digest(vary, request_headers) if vary else "",
+    }
+
+
+def current_age(entry: Dict[str, Any], now: Optional[float] = None) -> float:
+    """Return the age of a stored response in seconds."""
+    now = time.time() if now is None else now
+    return entry["initial_age"] + max(0.0, now - entry["response_time"])
+
 
-# Metrics storage
-REQUEST_METRICS = collections.defaultdict(list)
+def is_fresh(entry: Dict[str, Any], request_headers: Dict[str, Any], now: Optional[float] = None) -> bool:
+    """Check whether a stored response can be served without contacting the origin."""
+    directives = parse_cache_control((request_headers or {}).get("Cache-Control"))
+    if "no-cache" in directives:
+        return False
+    age = current_age(entry, now)
+    lifetime = entry["freshness_lifetime"]
+    max_age = _parse_seconds(directives.get("max-age"))
+    if max_age is not None:
+        lifetime = min(lifetime, max_age)
+    return age < lifetime
 
 
-def extract_content_from_html(html: str) -> str:
-    """Convert HTML content to Markdown format.
+def vary_matches(entry: Dict[str, Any], request_headers: Dict[str, Any]) -> bool:
+    """Check that the request selects the stored response according to its Vary header."""
+    return not entry["vary"] or entry["vary_digest"] == _vary_digest(entry["vary"], request_headers)
+
+
+def conditional_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+    """Build the validators for revalidating a stored response."""
+    headers = {}
+    stored = requests.structures.CaseInsensitiveDict(entry["headers"])
+    if "ETag" in stored:
+        headers["If-None-Match"] = stored["ETag"]
+    if "Last-Modified" in stored:
+        headers["If-Modified-Since"] = stored["Last-Modified"]
+    return headers
+
+
+def refresh_cache_entry(
+    entry: Dict[str, Any], not_modified: requests.Response, request_time: float, response_time: float
+) -> Dict[str, Any]:
+    """Update a stored response with the headers of a 304 Not Modified (RFC 9111 section 4.3.4)."""
+    headers = requests.structures.CaseInsensitiveDict(entry["headers"])
+    for name, value in not_modified.headers.items():
+        if name.lower() not in NOT_MODIFIED_EXCLUDED_HEADERS:
+            headers[name] = value
+
+    date = _parse_http_date(headers.get("Date"))
+    apparent_age = max(0.0, response_time - date) if date is not None else 0.0
+    age = _parse_seconds(not_modified.headers.get("Age")) or 0
+    return {
+        **entry,
+        "headers": dict(headers),
+        "response_time": response_time,
+        "initial_age": max(apparent_age, age + (response_time - request_time)),
+        "freshness_lifetime": freshness_lifetime(headers, response_time),
+    }
+
+
+def build_cached_response(entry: Dict[str, Any], url: str) -> requests.Response:
+    """Rebuild a requests Response from a stored cache entry."""
+    response = requests.Response()
+    response.status_code = entry["status_code"]
+    response.reason = entry["reason"]
+    response.headers = requests.structures.CaseInsensitiveDict(entry["headers"])
+    response.headers["Age"] = str(int(current_age(entry)))
+    response._content = entry["content"]
+    response.url = url
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+class ResponseCache(PickleFileCache):
+    """Private on-disk HTTP response cache.
+
+    Entries are keyed by method, URL and the credentials used for the request and stored by
+    PickleFileCache, which evicts the least recently used files past the size limit.
+    """
+
+    @staticmethod
+    def make_key(method: str, url: str, credentials: str = "") -> str:
+        """Build a cache key from the request method, URL and a description of its credentials."""
+        text = f"{method.upper()}|{url}|{credentials}"
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+_response_caches: Dict[Tuple[str, int], ResponseCache] = {}
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Get the response cache configured by the environment, or None when it is disabled."""
+    max_bytes = int(float(os.getenv("HTTP_REQUEST_CACHE_MAX_MB", "100")) * 1024 * 1024)
+    if max_bytes <= 0:
+        return None
+    directory = os.getenv("HTTP_REQUEST_CACHE_DIR", str(Path.home() / ".strands" / "http_cache"))
+    key = (directory, max_bytes)
+    if key not in _response_caches:
+        try:
+            _response_caches[key] = ResponseCache(Path(directory), max_bytes)
+        except OSError as e:
+            logger.warning(f"Response cache disabled, cannot use {directory}: {str(e)}")
+            return None
+    return _response_caches[key]
+
+
+def extract_content_from_html(html: str, max_chars: Optional[int] = None) -> str:
+    """Convert the main content of an HTML page to Markdown format.
+
+    Navigation, scripts, headers, footers and other boilerplate are dropped before conversion.
 
     Args:
         html: Raw HTML content to process
+        max_chars: Character budget for the Markdown (default: HTTP_REQUEST_MARKDOWN_MAX_CHARS, 0 for unlimited)
 
     Returns:
         Markdown version of the content, or original HTML if conversion fails
     """
     try:
-        content = markdownify.markdownify(
-            html,
-            heading_style=markdownify.ATX,
-        )
-        return content
-    except Exception:
+        return html_to_markdown(html, max_chars=MARKDOWN_MAX_CHARS if max_chars is None else max_chars)
+    except Exception as e:
         # If conversion fails, return original HTML
+        logger.debug(f"HTML to markdown conversion failed: {str(e)}")
         return html
 
 
@@ -243,24 +1124,54 @@ def create_session(config: Dict[str, Any]) -> requests.Session:
 
 
 def get_cached_session(url: str, config: Dict[str, Any]) -> requests.Session:
-    """Get or create a cached session for the domain."""
-    domain = urlparse(url).netloc
-    if domain not in SESSION_CACHE:
-        SESSION_CACHE[domain] = create_session(config)
-    return SESSION_CACHE[domain]
+    """Get or create a pooled session for the URL's origin and session configuration.
+
+    Pass the session to ``release_cached_session`` when the request is done.
+    """
+    return SESSION_POOL.get(url, config)
+
+
+def release_cached_session(session: requests.Session) -> None:
+    """Let the pool close a session from ``get_cached_session`` if it was evicted while in use."""
+    SESSION_POOL.release(session)
+
 
+def count_retries(response: requests.Response) -> int:
+    """Return how many times urllib3 retried the request behind ``response``."""
+    retries = getattr(getattr(response, "raw", None), "retries", None)
+    history = getattr(retries, "history", None)
+    return len(history) if isinstance(history, tuple) else 0
 
-def process_metrics(start_time: float, response: requests.Response) -> Dict[str, Any]:
-    """Process and store request metrics."""
+
+def process_metrics(
+    start_time: float,
+    response: requests.Response,
+    record: bool = True,
+    bytes_received: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Record the request in the rolling per-host metrics and return its measurements.
+
+    Responses served from the local cache pass ``record=False`` so they do not skew host latency.
+    Streamed responses pass the ``bytes_received`` counted while reading so the body is not buffered.
+    """
     end_time = time.time()
     metrics = {
         "duration": round(end_time - start_time, 3),
         "status_code": response.status_code,
         "bytes_sent": (len(response.request.body) if response.request and response.request.body is not None else 0),
-        "bytes_received": len(response.content),
+        "bytes_received": len(response.content) if bytes_received is None else bytes_received,
+        "retries": count_retries(response),
         "timestamp": datetime.datetime.now().isoformat(),
     }
-    REQUEST_METRICS[urlparse(response.url).netloc].append(metrics)
+    if record:
+        REQUEST_METRICS.record(
+            urlparse(response.url).netloc,
+            end_time - start_time,
+            response.status_code,
+            bytes_sent=metrics["bytes_sent"],
+            bytes_received=metrics["bytes_received"],
+            retries=metrics["retries"],
+        )
     return metrics
 
 
@@ -275,24 +1186,67 @@ def handle_digest_auth(config: Dict[str, Any], method: str, url: str) -> request
     return requests.auth.HTTPDigestAuth(config["username"], config["password"])
 
 
+# Credential and signer caches
+CREDENTIALS_CACHE_TTL = float(os.getenv("HTTP_REQUEST_CREDENTIALS_TTL", "900"))
+AUTH_CACHE_MAX_ENTRIES = 64
+
+# Cached JWTs are re-signed once less than this fraction of their lifetime remains
+JWT_REFRESH_FRACTION = 0.1
+
+_auth_cache_lock = threading.Lock()
+_aws_credentials: Dict[str, Any] = {}
+_sigv4_signers: "collections.OrderedDict[Tuple, AWSRequestsAuth]" = collections.OrderedDict()
+_jwt_tokens: "collections.OrderedDict[Tuple, Tuple[str, float]]" = collections.OrderedDict()
+
+
+def clear_auth_caches() -> None:
+    """Drop cached AWS credentials, SigV4 signers and JWTs."""
+    with _auth_cache_lock:
+        _aws_credentials.clear()
+        _sigv4_signers.clear()
+        _jwt_tokens.clear()
+
+
+def _remember_auth(cache: "collections.OrderedDict", key: Tuple, value: Any) -> None:
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > AUTH_CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+
+
 def get_aws_credentials() -> tuple:
-    """Get AWS credentials from boto3 with proper credential chain."""
+    """Get AWS credentials from boto3 with proper credential chain.
+
+    The boto3 session and its credential provider are resolved once and reused for
+    ``HTTP_REQUEST_CREDENTIALS_TTL`` seconds. Temporary credentials are refreshable, so
+    ``get_frozen_credentials`` renews them ahead of expiry without walking the chain again.
+    """
     import boto3
 
-    # Create a boto3 session to ensure we're using the same credential chain
-    session = boto3.Session()
-    credentials = session.get_credentials()
+    now = time.monotonic()
+    with _auth_cache_lock:
+        cached = _aws_credentials.get("default")
+        if cached is None or now - cached["resolved_at"] > CREDENTIALS_CACHE_TTL:
+            # Create a boto3 session to ensure we're using the same credential chain
+            session = boto3.Session()
+            credentials = session.get_credentials()
+
+            if not credentials:
+                raise ValueError("No AWS credentials found in the credential chain")
 
-    if not credentials:
-        raise ValueError("No AWS credentials found in the credential chain")
+            cached = {"session": session, "credentials": credentials, "resolved_at": now}
+            _aws_credentials["default"] = cached
 
-    frozen = credentials.get_frozen_credentials()
-    return frozen, session.region_name
+    frozen = cached["credentials"].get_frozen_credentials()
+    return frozen, cached["session"].region_name
 
 
 def handle_aws_sigv4(config: Dict[str, Any], url: str) -> AWSRequestsAuth:
     """
     Configure AWS SigV4 authentication using boto3's credential chain.
+
+    Signers are cached per credentials, host, region and service, so refreshed credentials
+    produce a new signer while repeated calls reuse the existing one.
     """
     try:
         # Get credentials using boto3's credential chain
@@ -308,6 +1262,13 @@ def handle_aws_sigv4(config: Dict[str, Any], url: str) -> AWSRequestsAuth:
             raise ValueError("AWS region not found in config or environment")
 
         parsed = urlparse(url)
+        key = (credentials.access_key, credentials.secret_key, credentials.token, parsed.netloc, region, service)
+        with _auth_cache_lock:
+            auth = _sigv4_signers.get(key)
+            if auth is not None:
+                _sigv4_signers.move_to_end(key)
+                return auth
+
         auth = AWSRequestsAuth(
             aws_access_key=credentials.access_key,
             aws_secret_access_key=credentials.secret_key,
@@ -316,6 +1277,8 @@ def handle_aws_sigv4(config: Dict[str, Any], url: str) -> AWSRequestsAuth:
             aws_service=service,
             aws_token=credentials.token,  # Add session token directly
         )
+        with _auth_cache_lock:
+            _remember_auth(_sigv4_signers, key, auth)
 
         return auth
 
@@ -324,7 +1287,10 @@ def handle_aws_sigv4(config: Dict[str, Any], url: str) -> AWSRequestsAuth:
 
 
 def handle_jwt(config: Dict[str, Any]) -> Dict[str, str]:
-    """Process JWT authentication."""
+    """Process JWT authentication.
+
+    Signed tokens are reused until less than ``JWT_REFRESH_FRACTION`` of their lifetime remains.
+    """
     try:
         import jwt  # Imported here to avoid global dependency
     except ImportError:
@@ -332,6 +1298,13 @@ def handle_jwt(config: Dict[str, Any]) -> Dict[str, str]:
             "ImportError: PyJWT package is required for JWT authentication. Install with: pip install PyJWT"
         ) from None
 
+    key = (config["secret"], config["algorithm"], config["expiry"])
+    now = time.time()
+    with _auth_cache_lock:
+        cached = _jwt_tokens.get(key)
+    if cached is not None and cached[1] - now > config["expiry"] * JWT_REFRESH_FRACTION:
+        return {"Authorization": f"Bearer {cached[0]}"}
+
     # Create expiration time using datetime module properly
     expiry_time = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=config["expiry"])
     token = jwt.encode(
@@ -342,6 +1315,8 @@ def handle_jwt(config: Dict[str, Any]) -> Dict[str, str]:
 
     # Convert token to string based on type
     token_str = token.decode("utf-8") if hasattr(token, "decode") else str(token)
+    with _auth_cache_lock:
+        _remember_auth(_jwt_tokens, key, (token_str, expiry_time.timestamp()))
 
     return {"Authorization": f"Bearer {token_str}"}
 
@@ -371,6 +1346,59 @@ def format_headers_table(headers: Dict) -> Table:
     return table
 
 
+def format_metrics_table(summary: Dict[str, Dict[str, Any]]) -> Table:
+    """Format per-host request metrics as a rich table."""
+    table = Table(title="Request Metrics", show_header=True, box=box.ROUNDED)
+    table.add_column("Host", style="cyan")
+    table.add_column("Requests", justify="right")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p95 ms", justify="right")
+    table.add_column("p99 ms", justify="right")
+    table.add_column("Max ms", justify="right")
+    table.add_column("Status", style="green")
+    table.add_column("Retries", justify="right")
+
+    for host, stats in summary.items():
+        latency = stats["latency_ms"]
+        table.add_row(
+            host,
+            str(stats["count"]),
+            f"{latency['p50']:.1f}",
+            f"{latency['p95']:.1f}",
+            f"{latency['p99']:.1f}",
+            f"{latency['max']:.1f}",
+            " ".join(f"{name}={value}" for name, value in stats["status"].items()),
+            str(stats["retries"]),
+        )
+
+    return table
+
+
+def handle_metrics_action(tool_input: Dict[str, Any], tool_use_id: str, console: Any) -> ToolResult:
+    """Report rolling request metrics, session pool statistics and per-host limiter state."""
+    host = urlparse(tool_input["url"]).netloc if tool_input.get("url") else None
+    summary = get_request_metrics(host)
+    pool_stats = SESSION_POOL.stats()
+
+    if summary:
+        console.print(format_metrics_table(summary))
+    else:
+        console.print(Text("No requests recorded in the current metrics window", style="yellow"))
+
+    host_limits = HOST_LIMITER.stats()
+    if host is not None:
+        host_limits = {name: state for name, state in host_limits.items() if name == host.lower()}
+
+    result_text = [f"Request metrics: {json.dumps(summary)}"]
+    result_text.append(f"Session pool: {json.dumps(pool_stats)}")
+    result_text.append(f"Host limits: {json.dumps(host_limits)}")
+    return {
+        "toolUseId": tool_use_id,
+        "status": "success",
+        "content": [{"text": text} for text in result_text],
+    }
+
+
 def process_auth_headers(headers: Dict[str, Any], tool_input: Dict[str, Any]) -> Dict[str, Any]:
     """
     Process authentication headers based on input parameters.
@@ -426,13 +1454,318 @@ def process_auth_headers(headers: Dict[str, Any], tool_input: Dict[str, Any]) ->
     return headers
 
 
-def stream_response(response: requests.Response) -> str:
-    """Handle streaming response processing."""
-    chunks = []
-    for chunk in response.iter_content(chunk_size=8192):
-        if chunk:
-            chunks.append(chunk)
-    return b"".join(chunks).decode()
+def declared_charset(response: requests.Response) -> Optional[str]:
+    """Return the charset named in the Content-Type header, if it is a known codec.
+
+    Unlike ``response.encoding``, this does not assume ISO-8859-1 for text without a charset.
+    """
+    for param in response.headers.get("Content-Type", "").split(";")[1:]:
+        name, _, value = param.strip().partition("=")
+        if name.strip().lower() == "charset":
+            charset = value.strip().strip("\"'")
+            try:
+                codecs.lookup(charset)
+            except LookupError:
+                return None
+            return charset
+    return None
+
+
+def confirm_save_to(path: str, console: Any) -> Optional[str]:
+    """Ask before writing a response body to disk, returning an error message if it may not.
+
+    Without BYPASS_TOOL_CONSENT an existing file is never overwritten and the user must confirm.
+    """
+    if os.environ.get("BYPASS_TOOL_CONSENT", "").lower() == "true":
+        return None
+    if os.path.exists(path):
+        return f"Refusing to overwrite existing file {path}; remove it first or choose another save_to path"
+
+    console.print(
+        Panel(
+            Text.assemble(("Response body will be written to ", "yellow"), (path, "bold yellow")),
+            title="[bold yellow]Save To File Confirmation",
+            border_style="yellow",
+            box=box.ROUNDED,
+            expand=False,
+        )
+    )
+    user_input = get_user_input(f"<yellow><bold>Do you want to save the response to {path}?</bold> [y/*]</yellow>")
+    if user_input.lower().strip() != "y":
+        cancellation_reason = (
+            user_input if user_input.strip() != "n" else get_user_input("Please provide a reason for cancellation:")
+        )
+        return f"Saving the response was cancelled by the user. Reason: {cancellation_reason}"
+    return None
+
+
+def stream_response(
+    response: requests.Response, max_bytes: Optional[int] = None, save_to: Optional[str] = None
+) -> Dict[str, Any]:
+    """Read a streamed response body chunk by chunk without holding the raw bytes in memory.
+
+    Text is decoded incrementally. With ``save_to`` the body is written straight to that file and
+    not returned. Reading stops after ``max_bytes`` bytes, in which case the connection is closed.
+
+    Returns:
+        Dict with the decoded ``content`` (empty when saved to a file), ``bytes_received``,
+        whether the body was ``truncated`` and the ``saved_to`` path.
+    """
+    decoder = codecs.getincrementaldecoder(declared_charset(response) or "utf-8")(errors="replace")
+    parts = []
+    received = 0
+    truncated = False
+    path = os.path.expanduser(save_to) if save_to else None
+    if path and os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with open(path, "wb") if path else contextlib.nullcontext() as sink:
+        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+            if not chunk:
+                continue
+            if max_bytes is not None and received + len(chunk) > max_bytes:
+                chunk = chunk[: max_bytes - received]
+                truncated = True
+            received += len(chunk)
+            if sink is not None:
+                sink.write(chunk)
+            else:
+                parts.append(decoder.decode(chunk))
+            if truncated:
+                break
+
+    if truncated:
+        response.close()
+    if sink is None:
+        parts.append(decoder.decode(b"", final=True))
+    return {"content": "".join(parts), "bytes_received": received, "truncated": truncated, "saved_to": path}
+
+
+def prepare_batch_request(shared: Dict[str, Any], item: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge a batch item with the shared top-level settings and resolve its auth headers."""
+    spec = {name: shared[name] for name in BATCH_SHARED_FIELDS if name in shared}
+    spec.update(item)
+    if not spec.get("url"):
+        raise ValueError("url is required for every batch request")
+    spec["method"] = spec.get("method", "GET").upper()
+
+    headers = {**(shared.get("headers") or {}), **(item.get("headers") or {})}
+    headers = process_auth_headers(headers, spec)
+    auth_type = spec.get("auth_type")
+    if auth_type == "basic":
+        basic_config = spec.get("basic_auth") or {}
+        if "username" not in basic_config or "password" not in basic_config:
+            raise ValueError("username and password required for basic authentication")
+        headers.update(handle_basic_auth(basic_config["username"], basic_config["password"]))
+    elif auth_type == "jwt":
+        headers.update(handle_jwt(spec["jwt_config"]))
+    elif auth_type in ("digest", "aws_sig_v4", "kerberos"):
+        raise ValueError(f"auth_type '{auth_type}' is not supported in batch mode")
+    spec["headers"] = headers
+    return spec
+
+
+async def fetch_batch_request(
+    session: aiohttp.ClientSession,
+    spec: Dict[str, Any],
+    global_limit: asyncio.Semaphore,
+    host_limits: Dict[str, asyncio.Semaphore],
+) -> Dict[str, Any]:
+    """Run one batch request once a global and a per-host slot are free.
+
+    The timeout starts when the request gets its slots, so time spent queued behind other requests
+    does not count against it.
+    """
+    url = spec["url"]
+    host = urlparse(url).netloc
+    timeout = float(spec.get("timeout") or BATCH_TIMEOUT)
+    max_bytes = spec.get("max_bytes")
+    result: Dict[str, Any] = {"method": spec["method"], "url": url}
+
+    async def send() -> None:
+        async with session.request(
+            spec["method"],
+            url,
+            headers=spec["headers"],
+            data=spec.get("body"),
+            ssl=None if spec.get("verify_ssl", True) else False,
+            allow_redirects=spec.get("allow_redirects", True),
+            proxy=(spec.get("proxies") or {}).get(urlparse(url).scheme),
+        ) as response:
+            decoder = codecs.getincrementaldecoder(response.charset or "utf-8")(errors="replace")
+            parts = []
+            received = 0
+            truncated = False
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                if max_bytes is not None and received + len(chunk) > max_bytes:
+                    chunk = chunk[: max_bytes - received]
+                    truncated = True
+                received += len(chunk)
+                parts.append(decoder.decode(chunk))
+                if truncated:
+                    break
+            parts.append(decoder.decode(b"", final=True))
+
+            content = "".join(parts)
+            content_type = response.headers.get("Content-Type", "")
+            if spec.get("convert_to_markdown") and "text/html" in content_type.lower():
+                content = extract_content_from_html(content)
+            result.update(
+                {
+                    "status_code": response.status,
+                    "content_type": content_type,
+                    "body": content,
+                    "bytes_received": received,
+                    "truncated": truncated,
+                }
+            )
+
+    try:
+        wait = HOST_LIMITER.acquire(host)
+    except (CircuitOpenError, RateLimitError) as e:
+        result.update({"error": str(e), "duration": 0.0})
+        return result
+    if wait > 0:
+        await asyncio.sleep(wait)
+
+    async with global_limit, host_limits[host]:
+        start_time = time.time()
+        try:
+            await asyncio.wait_for(send(), timeout)
+        except asyncio.TimeoutError:
+            result["error"] = f"Timed out after {timeout:g} seconds"
+        except aiohttp.ClientError as e:
+            result["error"] = f"{type(e).__name__}: {str(e)}"
+        except Exception as e:
+            result["error"] = str(e)
+
+        duration = time.time() - start_time
+        result["duration"] = round(duration, 3)
+        HOST_LIMITER.record(host, success=not is_failure_status(result.get("status_code")))
+        REQUEST_METRICS.record(
+            host,
+            duration,
+            result.get("status_code"),
+            bytes_sent=len(spec.get("body") or ""),
+            bytes_received=result.get("bytes_received", 0),
+        )
+    return result
+
+
+async def run_batch_requests(
+    specs: List[Dict[str, Any]], max_concurrency: int = BATCH_CONCURRENCY, max_per_host: int = BATCH_PER_HOST
+) -> List[Dict[str, Any]]:
+    """Run prepared batch requests concurrently and return their results in input order."""
+    global_limit = asyncio.Semaphore(max(1, max_concurrency))
+    host_limits = collections.defaultdict(lambda: asyncio.Semaphore(max(1, max_per_host)))
+    connector = aiohttp.TCPConnector(limit=max(1, max_concurrency), limit_per_host=max(1, max_per_host))
+    async with aiohttp.ClientSession(connector=connector) as session:
+        return await asyncio.gather(*(fetch_batch_request(session, spec, global_limit, host_limits) for spec in specs))
+
+
+def run_coroutine(coroutine: Coroutine) -> Any:
+    """Run a coroutine to completion, also when called from a thread that already runs an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+def format_batch_table(results: List[Dict[str, Any]]) -> Table:
+    """Format batch results as a rich table."""
+    table = Table(title="Batch Results", show_header=True, box=box.ROUNDED)
+    table.add_column("#", justify="right")
+    table.add_column("Method", style="cyan")
+    table.add_column("URL")
+    table.add_column("Status")
+    table.add_column("Duration", justify="right")
+
+    for index, result in enumerate(results):
+        status_code = result.get("status_code")
+        if status_code is None:
+            status = Text(result.get("error", "error"), style="red")
+        else:
+            status = Text(str(status_code), style="green" if 200 <= status_code < 400 else "red")
+        table.add_row(str(index), result["method"], result["url"], status, f"{result['duration']:.3f}s")
+
+    return table
+
+
+def handle_batch_requests(tool_input: Dict[str, Any], tool_use_id: str, console: Any) -> ToolResult:
+    """Run the requests of a batch concurrently and report each result in input order."""
+    items = tool_input["requests"]
+    if not isinstance(items, list):
+        raise ValueError("requests must be a list of request objects")
+    if len(items) > BATCH_MAX_REQUESTS:
+        raise ValueError(f"Batch of {len(items)} requests exceeds the limit of {BATCH_MAX_REQUESTS}")
+
+    specs = [prepare_batch_request(tool_input, item) for item in items]
+
+    # Modifying requests need a single confirmation for the whole batch
+    modifying = [spec for spec in specs if spec["method"] in {"POST", "PUT", "PATCH", "DELETE"}]
+    if modifying and os.environ.get("BYPASS_TOOL_CONSENT", "").lower() != "true":
+        hosts = sorted({urlparse(spec["url"]).netloc for spec in modifying})
+        console.print(
+            Panel(
+                Text.assemble(
+                    ("⚠️ Warning: ", "bold red"),
+                    (f"{len(modifying)} request(s) in this batch may modify data at ", "yellow"),
+                    (", ".join(hosts), "bold yellow"),
+                ),
+                title="[bold red]Modifying Request Confirmation",
+                border_style="red",
+                box=box.DOUBLE,
+                expand=False,
+                padding=(1, 1),
+            )
+        )
+        user_input = get_user_input(
+            "<yellow><bold>Do you want to proceed with this batch of requests?</bold> [y/*]</yellow>"
+        )
+        if user_input.lower().strip() != "y":
+            cancellation_reason = (
+                user_input if user_input.strip() != "n" else get_user_input("Please provide a reason for cancellation:")
+            )
+            return {
+                "toolUseId": tool_use_id,
+                "status": "error",
+                "content": [{"text": f"HTTP batch cancelled by the user. Reason: {cancellation_reason}"}],
+            }
+
+    console.print(Text(f"Sending {len(specs)} requests...", style="blue"))
+    start_time = time.time()
+    results = run_coroutine(
+        run_batch_requests(
+            specs,
+            max_concurrency=tool_input.get("max_concurrency") or BATCH_CONCURRENCY,
+            max_per_host=tool_input.get("max_per_host") or BATCH_PER_HOST,
+        )
+    )
+    wall_time = time.time() - start_time
+    console.print(format_batch_table(results))
+
+    failed = sum(1 for result in results if "error" in result)
+    result_text = [
+        f"Batch: {len(results)} requests, {len(results) - failed} completed, {failed} failed in {wall_time:.3f} seconds"
+    ]
+    for index, result in enumerate(results):
+        lines = [f"[{index}] {result['method']} {result['url']}"]
+        if "error" in result:
+            lines.append(f"Error: {result['error']}")
+        else:
+            lines.append(f"Status Code: {result['status_code']} ({result['duration']:.3f}s)")
+            if result["truncated"]:
+                lines.append(f"Truncated: body cut off after {result['bytes_received']} bytes")
+            lines.append(f"Body: {result['body']}")
+        result_text.append("\n".join(lines))
+
+    return {
+        "toolUseId": tool_use_id,
+        "status": "error" if results and failed == len(results) else "success",
+        "content": [{"text": text} for text in result_text],
+    }
 
 
 def format_request_preview(method: str, url: str, headers: Dict, body: Optional[str] = None) -> Panel:
@@ -478,9 +1811,15 @@ def format_request_preview(method: str, url: str, headers: Dict, body: Optional[
 
 
 def format_response_preview(
-    response: requests.Response, content: str, metrics: Optional[Dict[Any, Any]] = None
+    response: requests.Response,
+    content: str,
+    metrics: Optional[Dict[Any, Any]] = None,
+    size_bytes: Optional[int] = None,
 ) -> Panel:
-    """Format response for preview."""
+    """Format response for preview.
+
+    Pass ``size_bytes`` for streamed responses so the body is not read again.
+    """
     status_code = response.status_code if response and hasattr(response, "status_code") else 0
     status_style = "green" if 200 <= status_code < 400 else "red"  # type: ignore
 
@@ -500,7 +1839,8 @@ def format_response_preview(
     main_table.add_row("Content-Type", content_type)
 
     # Size
-    size_bytes = len(response.content)
+    if size_bytes is None:
+        size_bytes = len(response.content)
     size_display = f"{size_bytes:,} bytes"
     if size_bytes > 1024:
         size_display += f" ({size_bytes / 1024:.1f} KB)"
@@ -621,12 +1961,37 @@ def http_request(tool: ToolUse, **kwargs: Any) -> ToolResult:
         )
         ```
 
+    8. Download a large artifact without buffering it in memory:
+        ```python
+        http_request(
+            method="GET",
+            url="https://example.com/releases/data.tar.gz",
+            save_to="~/downloads/data.tar.gz",
+        )
+        ```
+
+    9. Fetch many URLs concurrently (results come back in input order):
+        ```python
+        http_request(
+            requests=[{"url": "https://example.com/a"}, {"url": "https://example.org/b", "timeout": 5}],
+            max_concurrency=32,
+            max_per_host=4,
+        )
+        ```
+
+    10. Tail latency of recently called APIs:
+        ```python
+        http_request(action="metrics")  # all hosts
+        http_request(action="metrics", url="https://api.github.com")  # one host
+        ```
+
     Environment Variables:
     - Authentication tokens are read from environment when auth_env_var is specified
     - AWS credentials are automatically loaded from environment variables or credentials file
     - Use environment(action='list') to view all available environment variables
     """
     console = console_util.create()
+    session = None
 
     try:
         # Extract input from tool use object or use directly if already a dict
@@ -639,6 +2004,15 @@ def http_request(tool: ToolUse, **kwargs: Any) -> ToolResult:
                 tool_use_id = tool.get("toolUseId", "default_id")
             # No else here - tool_input has already been initialized
 
+        if tool_input.get("action", "request") == "metrics":
+            return handle_metrics_action(tool_input, tool_use_id, console)
+
+        if tool_input.get("requests"):
+            return handle_batch_requests(tool_input, tool_use_id, console)
+
+        if not tool_input.get("method") or not tool_input.get("url"):
+            raise ValueError("method and url are required to send a request")
+
         method = tool_input["method"]
         url = tool_input["url"]
         headers = process_auth_headers(tool_input.get("headers", {}), tool_input)
@@ -726,134 +2100,208 @@ def http_request(tool: ToolUse, **kwargs: Any) -> ToolResult:
                     "content": [{"text": error_message}],
                 }
 
-        # Session handling
-        session_config = tool_input.get("session_config", {})
-        session = get_cached_session(url, session_config)
-
-        # Authentication processing
-        auth: Optional[Union[requests.auth.HTTPDigestAuth, AWSRequestsAuth]] = None
-        if "auth_type" in tool_input:
-            auth_type = tool_input["auth_type"]
-
-            if auth_type == "digest":
-                auth = handle_digest_auth(tool_input["digest_auth"], method, url)
-            elif auth_type == "aws_sig_v4":
-                auth = handle_aws_sigv4(tool_input["aws_auth"], url)
-            elif auth_type == "basic":
-                if "basic_auth" not in tool_input:
-                    raise ValueError("basic_auth configuration required for basic authentication")
-                basic_config = tool_input["basic_auth"]
-                if "username" not in basic_config or "password" not in basic_config:
-                    raise ValueError("username and password required for basic authentication")
-                headers.update(handle_basic_auth(basic_config["username"], basic_config["password"]))
-            elif auth_type == "jwt":
-                headers.update(handle_jwt(tool_input["jwt_config"]))
-
-        # Show request confirmation message
-        console.print(Text("Sending request...", style="blue"))
-
-        # Prepare request
-        request_kwargs = {
-            "method": method,
-            "url": url,
-            "headers": headers,
-            "verify": verify,
-            "auth": auth,
-            "allow_redirects": tool_input.get("allow_redirects", True),
-            "proxies": tool_input.get("proxies", None),
-        }
-
-        # Set max_redirects if specified
-        if "max_redirects" in tool_input:
-            max_redirects = tool_input["max_redirects"]
-            if max_redirects is not None and hasattr(session, "max_redirects"):
-                session.max_redirects = max_redirects
-
-        # Handle cookies
-        if cookie:
-            cookie_path = os.path.expanduser(cookie)
-            if os.path.exists(cookie_path):
-                cookies = http.cookiejar.MozillaCookieJar()
-                try:
-                    # Try Mozilla format first
-                    cookies.load(cookie_path, ignore_discard=True, ignore_expires=True)
-                    session.cookies.update(cookies)
-                except Exception:
+        # Bodies that are saved to disk or capped are streamed instead of loaded into memory
+        save_to = tool_input.get("save_to")
+        if save_to:
+            save_to = os.path.expanduser(save_to)
+            save_error = confirm_save_to(save_to, console)
+            if save_error:
+                console.print(Panel(Text(save_error, style="bold red"), title="[bold red]Save Cancelled"))
+                return {"toolUseId": tool_use_id, "status": "error", "content": [{"text": save_error}]}
+        max_bytes = tool_input.get("max_bytes")
+        streamed = bool(tool_input.get("streaming", False) or save_to or max_bytes is not None)
+
+        # Serve GET requests from the response cache when the stored response is still fresh
+        use_cache = tool_input.get("cache", os.getenv("HTTP_REQUEST_CACHE", "").lower() == "true")
+        cacheable_request = method.upper() == "GET" and not body and not streamed
+        cache = get_response_cache() if use_cache and cacheable_request else None
+        cache_key = cache_entry = cache_status = None
+        response = None
+        if cache is not None:
+            credentials = json.dumps(
+                {
+                    name: tool_input.get(name)
+                    for name in ("auth_type", "basic_auth", "digest_auth", "jwt_config", "aws_auth")
+                },
+                sort_keys=True,
+                default=str,
+            )
+            cache_key = cache.make_key(method, url, f"{credentials}|{headers.get('Authorization', '')}")
+            cache_entry = cache.get(cache_key)
+            if cache_entry is not None and not vary_matches(cache_entry, headers):
+                cache_entry = None
+            if cache_entry is not None and is_fresh(cache_entry, headers):
+                start_time = time.time()
+                response = build_cached_response(cache_entry, url)
+                cache_status = "hit"
+                console.print(Text("Served from response cache", style="green"))
+            elif cache_entry is not None:
+                headers.update(conditional_headers(cache_entry))
+
+        if response is None:
+            # Session handling
+            session_config = tool_input.get("session_config", {})
+            session = get_cached_session(url, session_config)
+
+            # Authentication processing
+            auth: Optional[Union[requests.auth.HTTPDigestAuth, AWSRequestsAuth]] = None
+            if "auth_type" in tool_input:
+                auth_type = tool_input["auth_type"]
+
+                if auth_type == "digest":
+                    auth = handle_digest_auth(tool_input["digest_auth"], method, url)
+                elif auth_type == "aws_sig_v4":
+                    auth = handle_aws_sigv4(tool_input["aws_auth"], url)
+                elif auth_type == "basic":
+                    if "basic_auth" not in tool_input:
+                        raise ValueError("basic_auth configuration required for basic authentication")
+                    basic_config = tool_input["basic_auth"]
+                    if "username" not in basic_config or "password" not in basic_config:
+                        raise ValueError("username and password required for basic authentication")
+                    headers.update(handle_basic_auth(basic_config["username"], basic_config["password"]))
+                elif auth_type == "jwt":
+                    headers.update(handle_jwt(tool_input["jwt_config"]))
+
+            # Show request confirmation message
+            console.print(Text("Sending request...", style="blue"))
+
+            # Prepare request
+            request_kwargs = {
+                "method": method,
+                "url": url,
+                "headers": headers,
+                "verify": verify,
+                "auth": auth,
+                "allow_redirects": tool_input.get("allow_redirects", True),
+                "proxies": tool_input.get("proxies", None),
+                "stream": streamed,
+            }
+
+            # Set max_redirects if specified
+            if "max_redirects" in tool_input:
+                max_redirects = tool_input["max_redirects"]
+                if max_redirects is not None and hasattr(session, "max_redirects"):
+                    session.max_redirects = max_redirects
+
+            # Handle cookies
+            if cookie:
+                cookie_path = os.path.expanduser(cookie)
+                if os.path.exists(cookie_path):
+                    cookies = http.cookiejar.MozillaCookieJar()
                     try:
-                        # Try Netscape format (curl style)
-                        with open(cookie_path, "r") as f:
-                            for line in f:
-                                line = line.strip()
-                                if line and not line.startswith("#"):
-                                    parts = line.split("\t")
-                                    if len(parts) >= 7:  # Standard Netscape format
-                                        (
-                                            domain,
-                                            flag,
-                                            path,
-                                            secure,
-                                            expires,
-                                            name,
-                                            value,
-                                        ) = parts
-                                        session.cookies.set(name, value, domain=domain, path=path)
-                    except Exception as e2:
-                        console.print(
-                            Text(
-                                f"Failed to load cookies from {cookie}: {str(e2)}",
-                                style="red",
+                        # Try Mozilla format first
+                        cookies.load(cookie_path, ignore_discard=True, ignore_expires=True)
+                        session.cookies.update(cookies)
+                    except Exception:
+                        try:
+                            # Try Netscape format (curl style)
+                            with open(cookie_path, "r") as f:
+                                for line in f:
+                                    line = line.strip()
+                                    if line and not line.startswith("#"):
+                                        parts = line.split("\t")
+                                        if len(parts) >= 7:  # Standard Netscape format
+                                            (
+                                                domain,
+                                                flag,
+                                                path,
+                                                secure,
+                                                expires,
+                                                name,
+                                                value,
+                                            ) = parts
+                                            session.cookies.set(name, value, domain=domain, path=path)
+                        except Exception as e2:
+                            console.print(
+                                Text(
+                                    f"Failed to load cookies from {cookie}: {str(e2)}",
+                                    style="red",
+                                )
                             )
-                        )
-                console.print(Text(f"Using cookies from {cookie}", style="blue"))
-            else:
-                console.print(Text(f"Warning: Cookie file {cookie} not found", style="yellow"))
-
-        if body:
-            request_kwargs["data"] = body
-
-        # Execute request with metrics
-        start_time = time.time()
-        response = session.request(**request_kwargs)
-
-        # Save cookies to cookie jar if specified
-        if cookie_jar:
-            cookie_jar_path = os.path.expanduser(cookie_jar)
-            # Ensure directory exists
-            cookie_jar_dir = os.path.dirname(cookie_jar_path)
-            if cookie_jar_dir and not os.path.exists(cookie_jar_dir):
-                os.makedirs(cookie_jar_dir, exist_ok=True)
-
-            # Save cookies in Netscape format compatible with curl
-            with open(cookie_jar_path, "w") as f:
-                f.write("# Netscape HTTP Cookie File\n")
-                f.write("# https://curl.se/docs/http-cookies.html\n")
-                f.write("# This file was generated by Strands http_request tool\n\n")
-
-                for cookie in session.cookies:
-                    # Format is: domain flag path secure expires name value
-                    secure = "TRUE" if cookie.secure else "FALSE"
-                    httponly = "TRUE" if cookie.has_nonstandard_attr("httponly") else "FALSE"
-                    expires = str(int(cookie.expires)) if hasattr(cookie, "expires") and cookie.expires else "0"
-                    f.write(
-                        f"{cookie.domain}\t{httponly}\t{cookie.path}\t{secure}\t{expires}\t{cookie.name}\t{cookie.value}\n"
-                    )
+                    console.print(Text(f"Using cookies from {cookie}", style="blue"))
+                else:
+                    console.print(Text(f"Warning: Cookie file {cookie} not found", style="yellow"))
 
-            console.print(Text(f"Cookies saved to {cookie_jar}", style="blue"))
+            if body:
+                request_kwargs["data"] = body
+
+            # Wait for the host's rate limit and fail fast while its circuit is open
+            host = urlparse(url).netloc
+            wait = HOST_LIMITER.acquire(host)
+            if wait > 0:
+                console.print(Text(f"Rate limited, waiting {wait:.2f}s for {host}", style="yellow"))
+                time.sleep(wait)
+
+            # Execute request with metrics
+            start_time = time.time()
+            try:
+                response = session.request(**request_kwargs)
+            except Exception:
+                REQUEST_METRICS.record(host, time.time() - start_time, None)
+                HOST_LIMITER.record(host, success=False)
+                raise
+            HOST_LIMITER.record(host, success=not is_failure_status(response.status_code))
+
+            # Save cookies to cookie jar if specified
+            if cookie_jar:
+                cookie_jar_path = os.path.expanduser(cookie_jar)
+                # Ensure directory exists
+                cookie_jar_dir = os.path.dirname(cookie_jar_path)
+                if cookie_jar_dir and not os.path.exists(cookie_jar_dir):
+                    os.makedirs(cookie_jar_dir, exist_ok=True)
+
+                # Save cookies in Netscape format compatible with curl
+                with open(cookie_jar_path, "w") as f:
+                    f.write("# Netscape HTTP Cookie File\n")
+                    f.write("# https://curl.se/docs/http-cookies.html\n")
+                    f.write("# This file was generated by Strands http_request tool\n\n")
+
+                    for cookie in session.cookies:
+                        # Format is: domain flag path secure expires name value
+                        secure = "TRUE" if cookie.secure else "FALSE"
+                        httponly = "TRUE" if cookie.has_nonstandard_attr("httponly") else "FALSE"
+                        expires = str(int(cookie.expires)) if hasattr(cookie, "expires") and cookie.expires else "0"
+                        f.write(
+                            f"{cookie.domain}\t{httponly}\t{cookie.path}\t{secure}\t{expires}\t{cookie.name}\t{cookie.value}\n"
+                        )
 
-        # Process metrics if enabled
-        metrics = None
-        if tool_input.get("metrics", False):
-            metrics = process_metrics(start_time, response)
+                console.print(Text(f"Cookies saved to {cookie_jar}", style="blue"))
+
+            # Store or refresh the cache entry; a 304 answers the conditional request with the stored body
+            if cache is not None:
+                response_time = time.time()
+                if response.status_code == 304 and cache_entry is not None:
+                    metrics = process_metrics(start_time, response)
+                    cache_entry = refresh_cache_entry(cache_entry, response, start_time, response_time)
+                    cache.set(cache_key, cache_entry)
+                    response = build_cached_response(cache_entry, url)
+                    cache_status = "revalidated"
+                else:
+                    entry = build_cache_entry(response, headers, start_time, response_time)
+                    if entry is not None:
+                        cache.set(cache_key, entry)
+                    cache_status = "stored" if entry is not None else "not cacheable"
 
         # Handle streaming responses
-        if tool_input.get("streaming", False):
-            content = stream_response(response)
+        streamed_body = None
+        if streamed:
+            streamed_body = stream_response(response, max_bytes=max_bytes, save_to=save_to)
+            content = streamed_body["content"]
         else:
             content = response.text
+        bytes_received = streamed_body["bytes_received"] if streamed_body else None
+
+        # Every request feeds the rolling host metrics; the per-request figures are shown only on demand
+        if cache_status not in ("hit", "revalidated"):
+            metrics = process_metrics(start_time, response, bytes_received=bytes_received)
+        elif cache_status == "hit":
+            metrics = process_metrics(start_time, response, record=False)
+        if not tool_input.get("metrics", False):
+            metrics = None
 
         # Convert HTML to markdown if requested
         convert_to_markdown = tool_input.get("convert_to_markdown", False)
-        if convert_to_markdown:
+        if convert_to_markdown and not save_to:
             content_type = response.headers.get("content-type", "")
             is_html_content = (
                 "text/html" in content_type.lower()
@@ -870,7 +2318,9 @@ def http_request(tool: ToolUse, **kwargs: Any) -> ToolResult:
                     console.print(Text("✓ Converted HTML content to markdown", style="green"))
 
         # Format and display the response
-        response_panel = format_response_preview(response, content, metrics if metrics is not None else None)
+        response_panel = format_response_preview(
+            response, content, metrics if metrics is not None else None, size_bytes=bytes_received
+        )
         console.print(response_panel)
 
         # Show redirect information if redirects were followed
@@ -904,13 +2354,21 @@ def http_request(tool: ToolUse, **kwargs: Any) -> ToolResult:
             redirect_chain = " -> ".join([str(r.status_code) for r in response.history] + [str(response.status_code)])
             result_text.append(f"Redirects: {redirect_count} redirects followed ({redirect_chain})")
 
+        if cache_status:
+            result_text.append(f"Cache: {cache_status}")
+
         # Add minimal headers to text response
         important_headers = ["Content-Type", "Content-Length", "Date", "Server"]
         headers_text = {k: v for k, v in response.headers.items() if k in important_headers}
         result_text.append(f"Headers: {headers_text}")
 
         # Add body to text response
-        result_text.append(f"Body: {content}")
+        if streamed_body and streamed_body["saved_to"]:
+            result_text.append(f"Body: saved {streamed_body['bytes_received']:,} bytes to {streamed_body['saved_to']}")
+        else:
+            result_text.append(f"Body: {content}")
+        if streamed_body and streamed_body["truncated"]:
+            result_text.append(f"Truncated: body cut off after max_bytes={max_bytes} bytes")
 
         # Add metrics if available
         if metrics:
@@ -952,3 +2410,6 @@ def http_request(tool: ToolUse, **kwargs: Any) -> ToolResult:
             "status": "error",
             "content": [{"text": error_text}],
         }
+    finally:
+        if session is not None:
+            release_cached_session(session)
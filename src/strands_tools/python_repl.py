@@ -29,26 +29,35 @@ agent.tool.python_repl(code="input('Enter your name: ')", interactive=True)
 
 # Reset the REPL state if needed
 agent.tool.python_repl(code="print('Fresh start')", reset_state=True)
+
+# Profile a cell and get the hottest functions (or allocation sites) next to the output
+agent.tool.python_repl(code="sorted(range(10**6), key=str)", profile="cpu")
+agent.tool.python_repl(code="data = [str(i) for i in range(10**5)]", profile="memory")
 ```
 """
 
+import atexit
+import cProfile
 import fcntl
 import logging
 import os
+import pstats
 import pty
 import re
 import select
 import signal
 import struct
 import sys
+import tempfile
 import termios
 import threading
 import traceback
+import tracemalloc
 import types
 from datetime import datetime
-from io import StringIO
+from io import BufferedWriter, StringIO, TextIOBase
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 import dill
 from rich import box
@@ -63,6 +72,9 @@ from strands_tools.utils.user_input import get_user_input
 # Initialize logging and set paths
 logger = logging.getLogger(__name__)
 
+# Partial PTY lines longer than this are flushed to the output capture without waiting for a newline
+PTY_LINE_BUFFER_LIMIT = 4096
+
 # Tool specification
 TOOL_SPEC = {
     "name": "python_repl",
@@ -78,12 +90,15 @@ TOOL_SPEC = {
     "- Persistent state between executions\n"
     "- Interactive PTY support for real-time feedback\n"
     "- Output capturing and formatting\n"
+    "- Large outputs are capped: the middle is elided and the full output is saved to a temp file "
+    "(path included in the result) that can be paged through with file_read\n"
     "- Error handling and logging\n"
     "- State reset capabilities\n\n"
     "Example Usage:\n"
     "1. Basic execution: code=\"print('Hello, world!')\"\n"
     '2. With state: First call code="x = 10", then code="print(x * 2)"\n'
-    "3. Reset state: code=\"print('Fresh start')\", reset_state=True",
+    "3. Reset state: code=\"print('Fresh start')\", reset_state=True\n"
+    '4. Profiling: code="...", profile="cpu" (hot functions) or profile="memory" (allocation sites)',
     "inputSchema": {
         "json": {
             "type": "object",
@@ -105,6 +120,23 @@ TOOL_SPEC = {
                     ),
                     "default": False,
                 },
+                "profile": {
+                    "type": "string",
+                    "enum": ["cpu", "memory"],
+                    "description": (
+                        "Run the code under a profiler and return a report next to the output. "
+                        "'cpu' uses cProfile and lists the hottest functions, "
+                        "'memory' uses tracemalloc and lists the top allocation sites."
+                    ),
+                },
+                "profile_top_n": {
+                    "type": "integer",
+                    "description": (
+                        "Number of functions or allocation sites to include in the profile report. "
+                        "Default controlled by PYTHON_REPL_PROFILE_TOP_N environment variable."
+                    ),
+                    "default": 20,
+                },
             },
             "required": ["code"],
         }
@@ -112,12 +144,144 @@ TOOL_SPEC = {
 }
 
 
+class CappedOutput(TextIOBase):
+    """Text stream that keeps the head and tail of its output within a byte cap.
+
+    Once the cap is exceeded, the middle of the output is elided from ``getvalue()`` and the
+    complete output is spilled to a temporary file so it can still be paged through with file_read.
+    The spill file is deleted when the stream is closed (see ``retain_output``).
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None, name: str = "output") -> None:
+        if max_bytes is None:
+            max_bytes = int(os.environ.get("PYTHON_REPL_MAX_OUTPUT_BYTES", "65536"))
+        self.max_bytes = max(2, max_bytes)
+        self.name = name
+        self.total_bytes = 0
+        self.spill_path: Optional[str] = None
+        self._head_limit = self.max_bytes // 2
+        self._tail_limit = self.max_bytes - self._head_limit
+        self._head = bytearray()
+        self._tail = bytearray()
+        self._spill_file: Optional[BufferedWriter] = None
+
+    @property
+    def encoding(self) -> str:
+        return "utf-8"
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        """Write text, spilling to disk once the cap is exceeded."""
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        data = text.encode("utf-8", errors="replace")
+        if self.spill_path is None and self.total_bytes + len(data) > self.max_bytes:
+            self._start_spill()
+        self.total_bytes += len(data)
+        if self._spill_file:
+            self._spill_file.write(data)
+
+        room = self._head_limit - len(self._head)
+        if room > 0:
+            self._head += data[:room]
+            data = data[room:]
+        if data:
+            self._tail += data
+            # Trim lazily so that many small writes don't each pay for shifting the whole tail
+            if len(self._tail) > 2 * self._tail_limit:
+                del self._tail[: -self._tail_limit]
+        return len(text)
+
+    def _start_spill(self) -> None:
+        """Open the spill file and write everything captured so far."""
+        fd, self.spill_path = tempfile.mkstemp(prefix=f"python_repl_{self.name}_", suffix=".txt")
+        self._spill_file = os.fdopen(fd, "wb")
+        # Until the cap is first exceeded, head and tail together hold the complete output
+        self._spill_file.write(self._head)
+        self._spill_file.write(self._tail)
+
+    def getvalue(self) -> str:
+        """Get the captured text, with the middle elided if the cap was exceeded."""
+        if self.spill_path is None:
+            return (self._head + self._tail).decode("utf-8", errors="replace")
+
+        if self._spill_file:
+            self._spill_file.flush()
+        tail = self._tail[-self._tail_limit :]
+        elided = self.total_bytes - len(self._head) - len(tail)
+        return (
+            f"{self._head.decode('utf-8', errors='ignore')}\n"
+            f"... [{elided} bytes elided, full output ({self.total_bytes} bytes) saved to {self.spill_path}] ...\n"
+            f"{tail.decode('utf-8', errors='ignore')}"
+        )
+
+    def close(self) -> None:
+        """Close and delete the spill file."""
+        if self._spill_file:
+            try:
+                self._spill_file.close()
+            except OSError as e:
+                logger.debug(f"Error closing spill file: {e}")
+            finally:
+                self._spill_file = None
+        if self.spill_path:
+            try:
+                os.remove(self.spill_path)
+            except OSError as e:
+                logger.debug(f"Error removing spill file: {e}")
+        super().close()
+
+
+# Spilled outputs kept open per calling agent, so that their spill files can be read: id(owner) -> (turn, outputs)
+_retained_outputs: Dict[int, Tuple[Any, List[CappedOutput]]] = {}
+_retained_lock = threading.Lock()
+
+
+def release_outputs(owner: Any = None, turn: Any = None) -> None:
+    """Close the outputs retained for an owner by earlier turns, deleting their spill files.
+
+    Outputs retained in the same turn are kept, so calls made together by one agent do not delete
+    each other's files. With no arguments, the outputs of every owner are closed.
+    """
+    with _retained_lock:
+        if owner is None and turn is None:
+            released = list(_retained_outputs.values())
+            _retained_outputs.clear()
+        elif id(owner) in _retained_outputs and _retained_outputs[id(owner)][0] != turn:
+            released = [_retained_outputs.pop(id(owner))]
+        else:
+            released = []
+    for _, outputs in released:
+        for output in outputs:
+            output.close()
+
+
+def retain_output(owner: Any, turn: Any, *outputs: CappedOutput) -> None:
+    """Keep the spilled outputs of a call until its owner moves on to another turn.
+
+    Outputs that did not spill are closed right away.
+    """
+    release_outputs(owner, turn)
+    with _retained_lock:
+        _, retained = _retained_outputs.setdefault(id(owner), (turn, []))
+        retained.extend(output for output in outputs if output.spill_path)
+    for output in outputs:
+        if not output.spill_path:
+            output.close()
+
+
+atexit.register(release_outputs)
+
+
 class OutputCapture:
     """Captures stdout and stderr output."""
 
     def __init__(self) -> None:
-        self.stdout = StringIO()
-        self.stderr = StringIO()
+        self.stdout = CappedOutput(name="stdout")
+        self.stderr = CappedOutput(name="stderr")
         self._stdout = sys.stdout
         self._stderr = sys.stderr
 
@@ -144,6 +308,89 @@ class OutputCapture:
         return output
 
 
+class CellProfiler:
+    """Profiles a code cell with cProfile (cpu) or tracemalloc (memory)."""
+
+    MODES = ("cpu", "memory")
+
+    def __init__(self, mode: str, top_n: int = 20) -> None:
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported profile mode: {mode}. Expected one of: {', '.join(self.MODES)}")
+        self.mode = mode
+        self.top_n = max(1, top_n)
+        self._profiler: Optional[cProfile.Profile] = None
+        self._started_tracing = False
+        self._start_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._report = ""
+
+    def __enter__(self) -> "CellProfiler":
+        if self.mode == "cpu":
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        else:
+            # Only stop tracing on exit if we were the ones who started it
+            self._started_tracing = not tracemalloc.is_tracing()
+            if self._started_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self._start_snapshot = tracemalloc.take_snapshot()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        traceback: Optional[types.TracebackType],
+    ) -> None:
+        try:
+            if self.mode == "cpu":
+                self._profiler.disable()
+                self._report = self._format_cpu_report()
+            else:
+                self._report = self._format_memory_report()
+        except Exception as e:
+            logger.warning(f"Error building profile report: {e}")
+            self._report = f"Profile report unavailable: {e}"
+        finally:
+            if self.mode == "memory" and self._started_tracing:
+                tracemalloc.stop()
+
+    def _format_cpu_report(self) -> str:
+        """Format the top functions by cumulative time."""
+        stream = StringIO()
+        stats = pstats.Stats(self._profiler, stream=stream)
+        stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE, pstats.SortKey.TIME).print_stats(self.top_n)
+        return f"CPU profile (top {self.top_n} functions by cumulative time):\n{stream.getvalue().strip()}"
+
+    def _format_memory_report(self) -> str:
+        """Format the top allocation sites by net allocated size."""
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ]
+        diff = snapshot.filter_traces(filters).compare_to(self._start_snapshot.filter_traces(filters), "lineno")
+        diff = [stat for stat in diff if stat.size_diff > 0][: self.top_n]
+
+        lines = [f"Memory profile (top {self.top_n} allocation sites, peak {peak / 1024:.1f} KiB):"]
+        for index, stat in enumerate(diff, 1):
+            frame = stat.traceback[0]
+            lines.append(
+                f"{index:>3}. {frame.filename}:{frame.lineno}: "
+                f"{stat.size_diff / 1024:.1f} KiB in {stat.count_diff} blocks"
+            )
+        if not diff:
+            lines.append("No retained allocations recorded")
+        return "\n".join(lines)
+
+    def get_report(self) -> str:
+        """Get the formatted profile report."""
+        return self._report
+
+
 class ReplState:
     """Manages persistent Python REPL state."""
 
@@ -231,9 +478,13 @@ class ReplState:
         except Exception as e:
             logger.error(f"Error saving state: {e}")
 
-    def execute(self, code: str) -> None:
-        """Execute code and save state."""
-        exec(code, self._namespace)
+    def execute(self, code: str, profiler: Optional[CellProfiler] = None) -> None:
+        """Execute code (optionally under a profiler) and save state."""
+        if profiler:
+            with profiler:
+                exec(code, self._namespace)
+        else:
+            exec(code, self._namespace)
         self.save_state()
 
     def get_namespace(self) -> dict:
@@ -287,17 +538,24 @@ def clean_ansi(text: str) -> str:
 class PtyManager:
     """Manages PTY-based Python execution with state synchronization."""
 
-    def __init__(self, callback: Optional[Callable] = None):
+    def __init__(self, callback: Optional[Callable] = None, profiler: Optional[CellProfiler] = None):
         self.supervisor_fd = -1
         self.worker_fd = -1
         self.pid = -1
-        self.output_buffer: List[str] = []
+        self.output_capture = CappedOutput(name="pty")
         self.input_buffer: List[str] = []
         self.stop_event = threading.Event()
         self.callback = callback
+        self.profiler = profiler
+        self.profile_file: Optional[str] = None
 
     def start(self, code: str) -> None:
         """Start PTY session with code execution."""
+        # The child reports its profile through a file since it cannot share memory with us
+        if self.profiler:
+            fd, self.profile_file = tempfile.mkstemp(prefix="python_repl_profile_", suffix=".txt")
+            os.close(fd)
+
         # Create PTY
         self.supervisor_fd, self.worker_fd = pty.openpty()
 
@@ -318,7 +576,15 @@ class PtyManager:
 
                 # Execute in REPL namespace
                 namespace = repl_state.get_namespace()
-                exec(code, namespace)
+                if self.profiler:
+                    try:
+                        with self.profiler:
+                            exec(code, namespace)
+                    finally:
+                        with open(self.profile_file, "w") as f:
+                            f.write(self.profiler.get_report())
+                else:
+                    exec(code, namespace)
 
                 os._exit(0)
 
@@ -403,7 +669,7 @@ class PtyManager:
                             line, buffer = buffer.split("\n", 1)
                             # Clean and store output
                             cleaned = clean_ansi(line + "\n")
-                            self.output_buffer.append(cleaned)
+                            self.output_capture.write(cleaned)
 
                             # Stream if callback exists
                             if self.callback:
@@ -412,9 +678,15 @@ class PtyManager:
                                 except Exception as callback_error:
                                     logger.warning(f"Error in output callback: {callback_error}")
 
+                        # Output without newlines is flushed in chunks rather than growing the buffer
+                        flush = len(buffer) > PTY_LINE_BUFFER_LIMIT
+
                         # Handle remaining buffer (usually prompts)
                         if buffer:
                             cleaned = clean_ansi(buffer)
+                            if flush:
+                                self.output_capture.write(cleaned)
+                                buffer = ""
                             if self.callback:
                                 try:
                                     self.callback(cleaned)
@@ -446,7 +718,7 @@ class PtyManager:
         if buffer:
             try:
                 cleaned = clean_ansi(buffer)
-                self.output_buffer.append(cleaned)
+                self.output_capture.write(cleaned)
                 if self.callback:
                     self.callback(cleaned)
             except Exception as e:
@@ -459,7 +731,7 @@ class PtyManager:
                 final_data = incomplete_bytes.decode("utf-8", errors="replace")
                 if final_data:
                     cleaned = clean_ansi(final_data)
-                    self.output_buffer.append(cleaned)
+                    self.output_capture.write(cleaned)
                     if self.callback:
                         self.callback(cleaned)
             except Exception as e:
@@ -493,8 +765,8 @@ class PtyManager:
                 break
 
     def get_output(self) -> str:
-        """Get complete output with ANSI codes removed and binary content truncated."""
-        raw = "".join(self.output_buffer)
+        """Get output with ANSI codes removed, binary content truncated and the middle elided past the cap."""
+        raw = self.output_capture.getvalue()
         clean = clean_ansi(raw)
 
         # Handle binary content
@@ -507,6 +779,17 @@ class PtyManager:
 
         return format_binary(clean)
 
+    def get_profile_report(self) -> str:
+        """Get the profile report written by the child process, if any."""
+        if not self.profile_file:
+            return ""
+        try:
+            with open(self.profile_file, "r") as f:
+                return f.read()
+        except OSError as e:
+            logger.debug(f"Error reading profile report: {e}")
+            return ""
+
     def stop(self) -> None:
         """Stop PTY session and clean up resources properly."""
         logger.debug("Stopping PTY session...")
@@ -557,6 +840,15 @@ class PtyManager:
             finally:
                 self.supervisor_fd = -1
 
+        # Clean up profile report file
+        if self.profile_file:
+            try:
+                os.remove(self.profile_file)
+            except OSError as e:
+                logger.debug(f"Error removing profile file: {e}")
+            finally:
+                self.profile_file = None
+
         logger.debug("PTY session cleanup completed")
 
 
@@ -573,6 +865,16 @@ def python_repl(tool: ToolUse, **kwargs: Any) -> ToolResult:
     code = tool_input["code"]
     interactive = os.environ.get("PYTHON_REPL_INTERACTIVE", str(tool_input.get("interactive", True))).lower() == "true"
     reset_state = os.environ.get("PYTHON_REPL_RESET_STATE", str(tool_input.get("reset_state", False))).lower() == "true"
+    profile = tool_input.get("profile")
+
+    if profile and profile not in CellProfiler.MODES:
+        return {
+            "toolUseId": tool_use_id,
+            "status": "error",
+            "content": [
+                {"text": f"Unsupported profile mode: {profile}. Expected one of: {', '.join(CellProfiler.MODES)}"}
+            ],
+        }
 
     # Check for development mode
     strands_dev = os.environ.get("BYPASS_TOOL_CONSENT", "").lower() == "true"
@@ -580,6 +882,10 @@ def python_repl(tool: ToolUse, **kwargs: Any) -> ToolResult:
     # Check for non_interactive_mode parameter
     non_interactive_mode = kwargs.get("non_interactive_mode", False)
 
+    # Spill files are kept per calling agent until its conversation moves on to another turn
+    owner = kwargs.get("agent")
+    turn = len(owner.messages) if isinstance(getattr(owner, "messages", None), list) else object()
+
     try:
         # Handle state reset if requested
         if reset_state:
@@ -608,6 +914,8 @@ def python_repl(tool: ToolUse, **kwargs: Any) -> ToolResult:
             details_table.add_row("Line Count", f"{len(code.splitlines())} lines")
             details_table.add_row("Mode", "Interactive" if interactive else "Standard")
             details_table.add_row("Reset State", "Yes" if reset_state else "No")
+            if profile:
+                details_table.add_row("Profile", profile)
 
             # Show confirmation panel
             console.print(
@@ -645,11 +953,19 @@ def python_repl(tool: ToolUse, **kwargs: Any) -> ToolResult:
         # Track execution time and capture output
         start_time = datetime.now()
         output = None
-
+        profile_report = ""
+        profiler = None
+        if profile:
+            profile_top_n = int(os.environ.get("PYTHON_REPL_PROFILE_TOP_N", tool_input.get("profile_top_n", 20)))
+            profiler = CellProfiler(profile, profile_top_n)
+
+        release_outputs(owner, turn)
+        outputs: List[CappedOutput] = []
         try:
             if interactive:
                 console.print("[green]Running in interactive mode...[/]")
-                pty_mgr = PtyManager()
+                pty_mgr = PtyManager(profiler=profiler)
+                outputs.append(pty_mgr.output_capture)
                 pty_mgr.start(code)
 
                 # Wait for completion
@@ -664,6 +980,8 @@ def python_repl(tool: ToolUse, **kwargs: Any) -> ToolResult:
 
                 # Get output and clean up
                 output = pty_mgr.get_output()
+                if profiler:
+                    profile_report = pty_mgr.get_profile_report()
                 pty_mgr.stop()
 
                 # Save state if execution succeeded
@@ -672,8 +990,11 @@ def python_repl(tool: ToolUse, **kwargs: Any) -> ToolResult:
             else:
                 console.print("[blue]Running in standard mode...[/]")
                 captured = OutputCapture()
+                outputs.extend([captured.stdout, captured.stderr])
                 with captured as output_capture:
-                    repl_state.execute(code)
+                    repl_state.execute(code, profiler)
+                    if profiler:
+                        profile_report = profiler.get_report()
                     output = output_capture.get_output()
                     if output:
                         console.print("[cyan]Output:[/]")
@@ -690,11 +1011,16 @@ def python_repl(tool: ToolUse, **kwargs: Any) -> ToolResult:
                     status += f"\n - {name} = {value}"
             console.print(f"[bold green]{status}[/]")
 
+            content = [{"text": output if output else "Code executed successfully"}]
+            if profile_report:
+                console.print(Panel(profile_report, title=f"[bold cyan]Profile ({profile})[/]", border_style="cyan"))
+                content.append({"text": profile_report})
+
             # Return result with output
             return {
                 "toolUseId": tool_use_id,
                 "status": "success",
-                "content": [{"text": output if output else "Code executed successfully"}],
+                "content": content,
             }
 
         except RecursionError:
@@ -703,6 +1029,9 @@ def python_repl(tool: ToolUse, **kwargs: Any) -> ToolResult:
             # Re-raise the exception after cleanup
             raise
 
+        finally:
+            retain_output(owner, turn, *outputs)
+
     except Exception as e:
         error_tb = traceback.format_exc()
         error_time = datetime.now()
@@ -8,22 +8,18 @@ from typing import Dict, List, Optional, Set, Union
 from urllib.parse import urlparse
 
 import feedparser
-import html2text
 import requests
 from strands import tool
 
+from strands_tools.utils.html_util import html_to_markdown
+
 # Configure logging and defaults
 logger = logging.getLogger(__name__)
 # Always use temporary directory for storage
 DEFAULT_STORAGE_PATH = os.path.join(tempfile.gettempdir(), "strands_rss_feeds")
 DEFAULT_MAX_ENTRIES = int(os.environ.get("STRANDS_RSS_MAX_ENTRIES", "100"))
 DEFAULT_UPDATE_INTERVAL = int(os.environ.get("STRANDS_RSS_UPDATE_INTERVAL", "60"))  # minutes
-
-# Create HTML to text converter
-html_converter = html2text.HTML2Text()
-html_converter.ignore_links = False
-html_converter.ignore_images = True
-html_converter.body_width = 0
+DEFAULT_MAX_CONTENT_CHARS = int(os.environ.get("STRANDS_RSS_MAX_CONTENT_CHARS", "20000"))
 
 
 class RSSManager:
@@ -40,7 +36,7 @@ class RSSManager:
         return os.path.join(self.storage_path, "subscriptions.json")
 
     def clean_html(self, html_content: str) -> str:
-        return "" if not html_content else html_converter.handle(html_content)
+        return html_to_markdown(html_content, max_chars=DEFAULT_MAX_CONTENT_CHARS, main_content=False, images=False)
 
     def format_entry(self, entry: Dict, include_content: bool = False) -> Dict:
         result = {
@@ -0,0 +1,135 @@
+"""
+On-disk cache of pickled values shared by the calculator and http_request tools.
+
+Each key is stored in its own file so several processes can share a directory, and writes are
+atomic renames. The directory is created private, because loading a pickle can run arbitrary
+code: it must only be writable by trusted users.
+"""
+
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PickleFileCache:
+    """Size-limited directory of pickled values, one file per key.
+
+    When the directory grows past ``max_bytes``, the least recently used files are evicted, along
+    with temporary files left behind by interrupted writes.
+    """
+
+    # Temporary files older than this are left over from interrupted writes
+    STALE_TMP_SECONDS = 3600
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pkl"
+
+    def get(self, key: str) -> Any:
+        """Get a stored value, or None if there is none."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            # Mark as recently used for eviction
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Discarding unreadable cache entry {path}: {str(e)}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return value
+
+    def set(self, key: str, value: Any) -> bool:
+        """Store a value, evicting old entries if over the size limit, and return whether it was stored."""
+        try:
+            data = pickle.dumps(value)
+        except Exception as e:
+            logger.debug(f"Value not cacheable: {str(e)}")
+            return False
+        if len(data) > self.max_bytes:
+            return False
+
+        path = self._path(key)
+        try:
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Error writing cache entry: {str(e)}")
+            return False
+
+        with self._lock:
+            if self._size is None:
+                self._remove_stale_tmp_files()
+                self._size = sum(entry.stat().st_size for entry in self.directory.glob("*.pkl"))
+            else:
+                self._size += len(data) - replaced
+            if self._size > self.max_bytes:
+                self._evict()
+        return True
+
+    def _remove_stale_tmp_files(self) -> None:
+        """Remove temporary files of writes that were interrupted before their rename."""
+        stale = time.time() - self.STALE_TMP_SECONDS
+        for entry in self.directory.glob("*.tmp"):
+            try:
+                if entry.stat().st_mtime < stale:
+                    entry.unlink()
+            except OSError:
+                continue
+
+    def _evict(self) -> None:
+        """Remove least recently used files until the directory is back under its size limit."""
+        self._remove_stale_tmp_files()
+        entries = []
+        for entry in self.directory.glob("*.pkl"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        entries.sort()
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, entry in entries:
+            if size <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+                size -= entry_size
+            except OSError:
+                continue
+        self._size = size
+
+    def clear(self) -> None:
+        """Remove all stored values."""
+        with self._lock:
+            for entry in self.directory.glob("*.pkl"):
+                try:
+                    entry.unlink()
+                except OSError:
+                    continue
+            self._size = 0
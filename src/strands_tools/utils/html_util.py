@@ -0,0 +1,230 @@
+"""
+HTML to Markdown conversion shared by the web-facing tools.
+
+The pipeline parses the page once, measures the text and links of every element in a single
+bottom-up pass, picks the main content block with a readability-style score, strips boilerplate
+around and inside it (navigation, headers, footers, sidebars, cookie banners), converts it with
+markdownify and trims the result to a character budget. Results are cached in memory by
+a hash of the input and options, so the same page or feed entry is only converted once.
+"""
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional
+
+import markdownify
+from bs4 import BeautifulSoup, Comment, NavigableString, Tag
+
+# Number of converted documents kept in memory
+MARKDOWN_CACHE_SIZE = int(os.getenv("STRANDS_MARKDOWN_CACHE_SIZE", "128"))
+
+# Elements that never carry readable text
+NON_CONTENT_TAGS = ("script", "style", "noscript", "template", "iframe", "svg", "canvas")
+
+# Page chrome, removed unless it wraps the main content
+BOILERPLATE_TAGS = ("form", "button", "nav", "header", "footer", "aside")
+
+BOILERPLATE_ROLES = {"navigation", "banner", "contentinfo", "complementary", "search", "dialog"}
+
+# Class and id fragments that mark navigation, ads and other page chrome
+BOILERPLATE_PATTERN = re.compile(
+    r"(^|[\s_-])(nav|navbar|menu|footer|sidebar|breadcrumbs?|cookie|consent|banner|advert|ads?|promo|"
+    r"share|social|related|comments?|popup|modal|subscribe|newsletter|signup)([\s_-]|$)",
+    re.IGNORECASE,
+)
+
+# Class and id fragments that keep a block even when it also matches BOILERPLATE_PATTERN
+CONTENT_PATTERN = re.compile(r"article|content|main|body", re.IGNORECASE)
+
+# Blocks with more paragraphs than this are only matched by class or id when they are mostly links
+LEAF_MAX_PARAGRAPHS = 2
+
+# Paragraph text that is never removed: this many characters, or half of the page's paragraph text
+SUBSTANTIAL_TEXT = 500
+
+# Containers considered when scoring candidates for the main content
+CANDIDATE_TAGS = ("article", "main", "section", "div", "td")
+
+PARAGRAPH_TAGS = ("p", "pre", "li", "blockquote")
+
+_cache: "OrderedDict[str, str]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+class _Stats(NamedTuple):
+    text: int  # Length of all text
+    paragraphs: int  # Length of text in PARAGRAPH_TAGS
+    links: int  # Length of text in links
+    p_text: int  # Length of text in <p> elements
+    p_count: int  # Number of <p> elements
+
+    @property
+    def score(self) -> float:
+        """Paragraph text, penalized by link density."""
+        if not self.paragraphs:
+            return 0.0
+        return self.paragraphs * (1 - self.links / (self.text or 1))
+
+
+def _measure(root: Tag) -> Dict[int, _Stats]:
+    """Measure every element under ``root`` in one bottom-up pass, keyed by ``id(element)``."""
+    stats: Dict[int, _Stats] = {}
+    elements = [root, *root.find_all(True)]
+    # Document order lists parents before children, so the reverse sees children first
+    for element in reversed(elements):
+        text = paragraphs = links = p_text = p_count = 0
+        for child in element.contents:
+            if isinstance(child, Tag):
+                child_stats = stats[id(child)]
+                text += child_stats.text
+                paragraphs += child_stats.paragraphs
+                links += child_stats.links
+                p_text += child_stats.p_text
+                p_count += child_stats.p_count
+            elif isinstance(child, NavigableString) and not isinstance(child, Comment):
+                text += len(child.strip())
+        if element.name in PARAGRAPH_TAGS:
+            paragraphs = text
+        if element.name == "a":
+            links = text
+        if element.name == "p":
+            p_text = text
+            p_count += 1
+        stats[id(element)] = _Stats(text, paragraphs, links, p_text, p_count)
+    return stats
+
+
+def _is_boilerplate(element: Tag, stats: _Stats) -> bool:
+    if element.name in ("html", "body", "main", "article"):
+        return False
+    if element.name in BOILERPLATE_TAGS:
+        # Headers and footers inside an article hold its title and byline
+        return not (element.name in ("header", "footer") and element.find_parent(["article", "main"]))
+    if element.get("role") in BOILERPLATE_ROLES or element.get("aria-hidden") == "true":
+        return True
+    classes = element.get("class") or []
+    marker = " ".join(classes if isinstance(classes, list) else [classes])
+    marker = f"{marker} {element.get('id') or ''}"
+    if not BOILERPLATE_PATTERN.search(marker) or CONTENT_PATTERN.search(marker):
+        return False
+    # Class names such as "page-with-sidebar" also sit on wrappers, so only leaf-ish blocks count
+    return stats.p_count <= LEAF_MAX_PARAGRAPHS or stats.links > stats.text / 2
+
+
+def _strip_non_content(soup: BeautifulSoup) -> None:
+    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+        comment.extract()
+    for element in soup.find_all(NON_CONTENT_TAGS):
+        if not element.decomposed:
+            element.decompose()
+
+
+def _strip_boilerplate(soup: BeautifulSoup, stats: Dict[int, _Stats], keep: Optional[Tag] = None) -> None:
+    """Remove page chrome, sparing ``keep``, its ancestors and blocks with substantial paragraph text."""
+    protected = {id(keep), *(id(parent) for parent in keep.parents)} if keep is not None else set()
+    substantial = min(SUBSTANTIAL_TEXT, stats[id(soup)].p_text / 2)
+    for element in soup.find_all(True):
+        # Descendants of removed elements are still listed
+        if element.decomposed or id(element) in protected:
+            continue
+        element_stats = stats[id(element)]
+        if element_stats.p_text and element_stats.p_text >= substantial:
+            continue
+        if _is_boilerplate(element, element_stats):
+            element.decompose()
+
+
+def extract_main_content(soup: BeautifulSoup, stats: Optional[Dict[int, _Stats]] = None) -> Tag:
+    """Return the element that most likely holds the page's main content.
+
+    An explicit ``<article>``, ``<main>`` or ``role="main"`` element wins. Otherwise the container with
+    the best paragraph-text score is chosen, unless it holds less than half of the body's score, in
+    which case the whole body is kept. ``stats`` are the measurements of ``soup`` when already taken.
+    """
+    stats = stats if stats is not None else _measure(soup)
+    body = soup.body or soup
+    for explicit in (soup.find("article"), soup.find("main"), soup.find(attrs={"role": "main"})):
+        if explicit is not None and stats[id(explicit)].score > 0:
+            return explicit
+
+    best, best_score = body, 0.0
+    for candidate in body.find_all(CANDIDATE_TAGS):
+        score = stats[id(candidate)].score
+        # Prefer the innermost container when a parent adds nothing but wrapping
+        if score > best_score or (
+            score == best_score and score > 0 and any(parent is best for parent in candidate.parents)
+        ):
+            best, best_score = candidate, score
+    if best is not body and best_score < 0.5 * stats[id(body)].score:
+        return body
+    return best
+
+
+def _convert(root: Tag, images: bool = True) -> str:
+    strip = None if images else ["img"]
+    markdown = markdownify.MarkdownConverter(heading_style=markdownify.ATX, strip=strip).convert_soup(root)
+    markdown = re.sub(r"[ \t]+\n", "\n", markdown)
+    return re.sub(r"\n{3,}", "\n\n", markdown).strip()
+
+
+def truncate_markdown(text: str, max_chars: int) -> str:
+    """Trim Markdown to ``max_chars``, cutting at a paragraph or line boundary when possible."""
+    if max_chars <= 0 or len(text) <= max_chars:
+        return text
+    cut = text.rfind("\n\n", 0, max_chars)
+    if cut < max_chars // 2:
+        cut = text.rfind("\n", 0, max_chars)
+    if cut < max_chars // 2:
+        cut = max_chars
+    return f"{text[:cut].rstrip()}\n\n[... truncated {len(text) - cut:,} characters]"
+
+
+def html_to_markdown(html: Optional[str], max_chars: int = 0, main_content: bool = True, images: bool = True) -> str:
+    """Convert HTML to Markdown without page boilerplate.
+
+    Args:
+        html: Raw HTML document or fragment.
+        max_chars: Character budget for the result; 0 means unlimited.
+        main_content: Keep only the main content block. Disable for fragments such as feed entries
+            where everything that is not boilerplate is content.
+        images: Keep images as Markdown image links.
+
+    Returns:
+        Markdown text, truncated to the budget with a note about how much was dropped.
+    """
+    if not html:
+        return ""
+
+    key = hashlib.sha256(f"{max_chars}|{main_content}|{images}|{html}".encode("utf-8", "surrogatepass")).hexdigest()
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    soup = BeautifulSoup(html, "html.parser")
+    _strip_non_content(soup)
+    stats = _measure(soup)
+    root = extract_main_content(soup, stats) if main_content else soup
+    _strip_boilerplate(soup, stats, keep=root if main_content else None)
+    markdown = _convert(root, images)
+    if not markdown:
+        # Nothing looked like content; the whole document beats an empty answer
+        soup = BeautifulSoup(html, "html.parser")
+        _strip_non_content(soup)
+        markdown = _convert(soup, images)
+    markdown = truncate_markdown(markdown, max_chars)
+
+    with _cache_lock:
+        _cache[key] = markdown
+        while len(_cache) > MARKDOWN_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return markdown
+
+
+def clear_markdown_cache() -> None:
+    """Drop all cached conversions."""
+    with _cache_lock:
+        _cache.clear()
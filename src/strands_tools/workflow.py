@@ -30,6 +30,7 @@ Key Features:
    • Rate limiting with exponential backoff
    • Resource-aware task distribution
    • CPU usage monitoring and optimization
+   • Optional worker processes, on one or more hosts, fed by a durable queue
 
 5. Reliability Features:
    • Persistent state storage with real-time monitoring
@@ -97,30 +98,40 @@ result = agent.tool.workflow(action="status", workflow_id="research_pipeline")
 See the workflow function docstring for complete configuration options and advanced usage patterns.
 """
 
+import hashlib
+import heapq
 import json
 import logging
+import math
 import os
 import random
+import socket
+import sqlite3
+import tempfile
 import time
 import traceback
 import uuid
-from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from queue import Queue
-from threading import Lock, RLock
-from typing import Any, Dict, List, Optional
+from queue import Empty, Queue
+from threading import Event, Lock, Thread
+from typing import Any, Dict, List, Optional, Tuple
 
 from rich.box import ROUNDED
 from rich.panel import Panel
 from rich.table import Table
 from strands import Agent, tool
-from strands.telemetry.metrics import metrics_to_string
-from tenacity import retry, stop_after_attempt, wait_exponential
+from strands.agent.state import AgentState
+from strands.telemetry.metrics import EventLoopMetrics, metrics_to_string
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
 from strands_tools.utils import console_util
+from strands_tools.utils.html_util import truncate_markdown
 from strands_tools.utils.models.model import create_model
 
 logger = logging.getLogger(__name__)
@@ -134,11 +145,62 @@ MIN_THREADS = int(os.getenv("STRANDS_WORKFLOW_MIN_THREADS", "2"))
 MAX_THREADS = int(os.getenv("STRANDS_WORKFLOW_MAX_THREADS", "8"))
 CPU_THRESHOLD = int(os.getenv("STRANDS_WORKFLOW_CPU_THRESHOLD", "80"))  # CPU usage threshold for scaling down
 
-# Rate limiting configuration
-_rate_limit_lock = RLock()
-_last_request_time = 0
-_MIN_REQUEST_INTERVAL = 0.1  # Minimum time between requests (100ms)
-_MAX_BACKOFF = 30  # Maximum backoff time in seconds
+# Adaptive concurrency: concurrency is multiplied by this factor on throttling or CPU overload,
+# at most once per cooldown period, and grows by one after a full round of successful tasks
+SCALE_DOWN_FACTOR = 0.5
+SCALE_DOWN_COOLDOWN = float(os.getenv("STRANDS_WORKFLOW_SCALE_DOWN_COOLDOWN", "5"))
+
+# Number of journaled task events after which the workflow file is rewritten and the journal cleared
+SNAPSHOT_INTERVAL = int(os.getenv("STRANDS_WORKFLOW_SNAPSHOT_INTERVAL", "200"))
+
+# Rate limiting per (provider, model); 0 disables a limit. STRANDS_WORKFLOW_RATE_LIMITS holds JSON
+# overrides keyed by "provider" or "provider:model_id", e.g. {"bedrock": {"rpm": 100, "tpm": 200000}}
+DEFAULT_RPM = int(os.getenv("STRANDS_WORKFLOW_RPM", "600"))
+DEFAULT_TPM = int(os.getenv("STRANDS_WORKFLOW_TPM", "0"))
+ESTIMATED_OUTPUT_TOKENS = int(os.getenv("STRANDS_WORKFLOW_ESTIMATED_OUTPUT_TOKENS", "1000"))
+CHARS_PER_TOKEN = 4
+
+# Idle task agents (and distinct models) kept for reuse across tasks with the same configuration
+AGENT_POOL_SIZE = int(os.getenv("STRANDS_WORKFLOW_AGENT_POOL_SIZE", "32"))
+
+# Retries of model calls: throttling and transient errors back off exponentially from
+# RETRY_BASE_DELAY with full jitter, capped at RETRY_MAX_DELAY; other errors are not retried
+MAX_RETRIES = int(os.getenv("STRANDS_WORKFLOW_MAX_RETRIES", "4"))
+RETRY_BASE_DELAY = float(os.getenv("STRANDS_WORKFLOW_RETRY_BASE_DELAY", "0.25"))
+RETRY_MAX_DELAY = float(os.getenv("STRANDS_WORKFLOW_RETRY_MAX_DELAY", "30"))
+
+# When at least this many tasks become ready together, their starts are spread over up to
+# STARTUP_JITTER_MAX seconds so they do not hit the provider at the same instant
+STARTUP_JITTER_MIN_BATCH = int(os.getenv("STRANDS_WORKFLOW_JITTER_MIN_BATCH", "4"))
+STARTUP_JITTER_MAX = float(os.getenv("STRANDS_WORKFLOW_JITTER_MAX", "1.0"))
+
+# Token budget for the dependency results included in a task prompt (0 disables); tasks can set
+# "context_budget". Results over their share are summarized with the configured summary model,
+# or truncated when none is set
+CONTEXT_BUDGET = int(os.getenv("STRANDS_WORKFLOW_CONTEXT_BUDGET", "16000"))
+SUMMARY_PROVIDER = os.getenv("STRANDS_WORKFLOW_SUMMARY_PROVIDER", "")
+SUMMARY_MODEL_ID = os.getenv("STRANDS_WORKFLOW_SUMMARY_MODEL_ID", "")
+SUMMARY_CACHE_SIZE = 256
+TRUNCATION_NOTE_TOKENS = 10
+# Smallest useful excerpt of a dependency result; dependencies whose share is smaller are omitted
+MIN_RESULT_TOKENS = 20
+SUMMARY_SYSTEM_PROMPT = (
+    "You condense the output of one step of a multi-step workflow for the next step. "
+    "Keep facts, figures, names, decisions and open questions; drop repetition and filler."
+)
+
+# "threads" runs tasks in this process; "queue" hands them to worker processes (see run_worker)
+# through a SQLite queue in STRANDS_WORKFLOW_DIR
+EXECUTOR = os.getenv("STRANDS_WORKFLOW_EXECUTOR", "threads")
+QUEUE_LEASE_SECONDS = float(os.getenv("STRANDS_WORKFLOW_LEASE_SECONDS", "60"))
+QUEUE_POLL_INTERVAL = float(os.getenv("STRANDS_WORKFLOW_POLL_INTERVAL", "0.5"))
+QUEUE_MAX_IN_FLIGHT = int(os.getenv("STRANDS_WORKFLOW_QUEUE_DEPTH", "256"))
+QUEUE_CLAIM_TIMEOUT = float(os.getenv("STRANDS_WORKFLOW_CLAIM_TIMEOUT", "300"))
+QUEUE_MAX_ATTEMPTS = 3
+
+# Opt-in cache of task results keyed by everything that determines a task's output
+RESULT_CACHE_ENABLED = os.getenv("STRANDS_WORKFLOW_CACHE", "false").lower() == "true"
+RESULT_CACHE_MAX_MB = int(os.getenv("STRANDS_WORKFLOW_CACHE_MAX_MB", "100"))
 
 
 class WorkflowFileHandler(FileSystemEventHandler):
@@ -152,23 +214,688 @@ class WorkflowFileHandler(FileSystemEventHandler):
         if event.is_directory:
             return
         if event.src_path.endswith(".json"):
+            # Ignore the events caused by our own snapshots
+            if self.manager.is_own_write(event.src_path):
+                return
             workflow_id = Path(event.src_path).stem
             self.manager.load_workflow(workflow_id)
 
 
+def cpu_load_percent() -> Optional[float]:
+    """Return the one-minute load average as a percentage of the available CPUs, or None if unsupported."""
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1) * 100
+    except (AttributeError, OSError):
+        return None
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """Return whether an error means the model provider is rate limiting us."""
+    text = f"{type(error).__name__}: {error}".lower()
+    return any(marker in text for marker in ("throttl", "too many requests", "rate limit", "ratelimit"))
+
+
+TRANSIENT_ERROR_MARKERS = (
+    "timeout",
+    "timed out",
+    "connection",
+    "temporarily unavailable",
+    "serviceunavailable",
+    "service unavailable",
+    "internalserver",
+    "internal server error",
+    "bad gateway",
+    "overloaded",
+    "modelnotready",
+)
+
+
+def classify_error(error: BaseException) -> str:
+    """Classify a model call error as "throttling", "transient" or "permanent"."""
+    if is_throttling_error(error):
+        return "throttling"
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return "transient"
+    text = f"{type(error).__name__}: {error}".lower()
+    if any(marker in text for marker in TRANSIENT_ERROR_MARKERS):
+        return "transient"
+    return "permanent"
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Return the delay a provider asked for in a Retry-After header, if the error carries one."""
+    value = getattr(error, "retry_after", None)
+    response = getattr(error, "response", None)
+    if value is None and isinstance(response, dict):
+        # botocore ClientError
+        headers = response.get("ResponseMetadata", {}).get("HTTPHeaders", {})
+        value = headers.get("retry-after")
+    elif value is None and response is not None:
+        headers = getattr(response, "headers", None)
+        if headers is not None and hasattr(headers, "get"):
+            value = headers.get("retry-after") or headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        try:
+            seconds = (parsedate_to_datetime(str(value)) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return seconds if math.isfinite(seconds) and seconds >= 0 else 0.0
+
+
+def retry_delay(attempt: int, error: BaseException) -> float:
+    """Return the wait before retry number ``attempt`` (0-based): full-jitter backoff or Retry-After."""
+    delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt))
+    retry_after = retry_after_seconds(error)
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, RETRY_MAX_DELAY))
+    return delay
+
+
+def allocate_budget(sizes: Dict[str, int], budget: int) -> Dict[str, int]:
+    """Split a token budget between dependency results, giving small results all they need.
+
+    Results that fit in an equal share keep their full size and the remainder is shared among the
+    larger ones, so one huge result cannot crowd out several small ones.
+    """
+    shares = {}
+    pending = sorted(sizes, key=lambda dep_id: sizes[dep_id])
+    remaining = budget
+    while pending:
+        share = remaining // len(pending)
+        dep_id = pending[0]
+        if sizes[dep_id] > share:
+            for dep_id in pending:
+                shares[dep_id] = share
+            break
+        shares[dep_id] = sizes[dep_id]
+        remaining -= sizes[dep_id]
+        pending.pop(0)
+    return shares
+
+
+def settings_digest(settings: Optional[Dict]) -> str:
+    """Return a stable hash of model settings."""
+    return hashlib.sha256(json.dumps(settings, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the number of tokens in a text."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+class _MinuteBucket:
+    """Token bucket refilled evenly at ``per_minute`` units per minute, holding at most one minute's worth."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.available = self.capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float) -> float:
+        """Take ``amount`` units now and return how long the caller must wait before using them."""
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+        self.updated = now
+        amount = min(amount, self.capacity)
+        wait = max(0.0, (amount - self.available) / self.rate)
+        self.available -= amount
+        return wait
+
+    def refund(self, amount: float) -> None:
+        self.available = min(self.capacity, self.available + amount)
+
+
+class ModelRateLimiter:
+    """Requests-per-minute and tokens-per-minute buckets per (provider, model).
+
+    Each model call reserves one request and its estimated input plus output tokens, then sleeps
+    outside the lock until both are available, so tasks for different models never wait on each
+    other. Once the real usage is known the token estimate is corrected with ``settle``.
+    """
+
+    def __init__(self, rpm: int = DEFAULT_RPM, tpm: int = DEFAULT_TPM, overrides: Optional[Dict] = None):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._lock = Lock()
+        self._buckets: Dict[Tuple[str, str], Dict[str, Optional[_MinuteBucket]]] = {}
+        self._overrides: Dict[str, Dict[str, int]] = {}
+        if overrides is None:
+            try:
+                overrides = json.loads(os.getenv("STRANDS_WORKFLOW_RATE_LIMITS", "{}"))
+            except ValueError as e:
+                logger.warning(f"Ignoring invalid STRANDS_WORKFLOW_RATE_LIMITS: {str(e)}")
+                overrides = {}
+        for key, limits in overrides.items():
+            self._overrides[key] = dict(limits)
+
+    def limits(self, provider: str, model_id: str) -> Tuple[int, int]:
+        """Return the (rpm, tpm) limits for a model; model-specific overrides beat provider ones."""
+        settings = {"rpm": self.rpm, "tpm": self.tpm}
+        settings.update(self._overrides.get(provider, {}))
+        settings.update(self._overrides.get(f"{provider}:{model_id}", {}))
+        return int(settings["rpm"]), int(settings["tpm"])
+
+    def _buckets_for(self, provider: str, model_id: str) -> Dict[str, Optional[_MinuteBucket]]:
+        key = (provider, model_id)
+        if key not in self._buckets:
+            rpm, tpm = self.limits(provider, model_id)
+            self._buckets[key] = {
+                "requests": _MinuteBucket(rpm) if rpm > 0 else None,
+                "tokens": _MinuteBucket(tpm) if tpm > 0 else None,
+            }
+        return self._buckets[key]
+
+    def acquire(self, provider: str, model_id: str, tokens: int) -> float:
+        """Wait until the model has capacity for one request of ``tokens`` tokens; return the wait."""
+        with self._lock:
+            buckets = self._buckets_for(provider, model_id)
+            waits = [0.0]
+            if buckets["requests"]:
+                waits.append(buckets["requests"].reserve(1))
+            if buckets["tokens"]:
+                waits.append(buckets["tokens"].reserve(tokens))
+        wait = max(waits)
+        if wait > 0:
+            logger.debug(f"Rate limit for {provider}:{model_id}, waiting {wait:.2f}s")
+            time.sleep(wait)
+        return wait
+
+    def settle(self, provider: str, model_id: str, estimated: int, actual: int) -> None:
+        """Correct a token reservation once the real usage of the call is known."""
+        with self._lock:
+            bucket = self._buckets_for(provider, model_id)["tokens"]
+            if bucket:
+                if actual > estimated:
+                    bucket.reserve(actual - estimated)
+                else:
+                    bucket.refund(estimated - actual)
+
+    def clear(self) -> None:
+        """Forget all buckets."""
+        with self._lock:
+            self._buckets.clear()
+
+
+MODEL_RATE_LIMITER = ModelRateLimiter()
+
+
+class TaskAgentPool:
+    """Idle task agents and shared model instances, keyed by task configuration.
+
+    Agents are checked out for the duration of one task, so concurrent tasks never share one,
+    and their conversation, state and metrics are reset before reuse. Models are shared by all
+    agents with the same provider and settings, which reuses their clients and connections.
+    """
+
+    def __init__(self, max_size: int = AGENT_POOL_SIZE):
+        self.max_size = max_size
+        self._lock = Lock()
+        self._idle: "OrderedDict[Tuple, List[Agent]]" = OrderedDict()
+        self._idle_count = 0
+        self._models: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def acquire(self, key: Tuple) -> Optional[Agent]:
+        """Check out an idle agent for the key, or return None if there is none."""
+        with self._lock:
+            agents = self._idle.get(key)
+            if not agents:
+                self.misses += 1
+                return None
+            agent = agents.pop()
+            if not agents:
+                del self._idle[key]
+            self._idle_count -= 1
+            self.hits += 1
+            return agent
+
+    def release(self, key: Tuple, agent: Agent) -> None:
+        """Reset an agent after its task and keep it for the next task with the same key."""
+        agent.messages.clear()
+        agent.state = AgentState()
+        agent.event_loop_metrics = EventLoopMetrics()
+        with self._lock:
+            if self.max_size <= 0:
+                return
+            self._idle.setdefault(key, []).append(agent)
+            self._idle.move_to_end(key)
+            self._idle_count += 1
+            # Drop agents of the least recently used configurations first
+            while self._idle_count > self.max_size:
+                oldest_key, agents = next(iter(self._idle.items()))
+                agents.pop(0)
+                self._idle_count -= 1
+                if not agents:
+                    del self._idle[oldest_key]
+
+    def get_model(self, key: Tuple, factory) -> Any:
+        """Return the shared model for the key, creating it with ``factory`` on first use."""
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                return self._models[key]
+        model = factory()
+        with self._lock:
+            model = self._models.setdefault(key, model)
+            self._models.move_to_end(key)
+            while len(self._models) > max(self.max_size, 1):
+                self._models.popitem(last=False)
+            return model
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"idle": self._idle_count, "models": len(self._models), "hits": self.hits, "misses": self.misses}
+
+    def clear(self) -> None:
+        """Drop all idle agents and models."""
+        with self._lock:
+            self._idle.clear()
+            self._idle_count = 0
+            self._models.clear()
+
+
+class TaskResultCache:
+    """On-disk cache of successful task results.
+
+    Entries are keyed by a hash of the task's inputs, stored as one JSON file per key and written
+    with atomic renames. When the directory grows past its size limit the least recently used
+    files are evicted.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+        self._size: Optional[int] = None
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a stored result, or None if there is none."""
+        path = self._path(key)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+            # Mark as recently used for eviction
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Discarding unreadable result cache entry {path}: {str(e)}")
+            path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    def set(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store a result, evicting old entries if over the size limit."""
+        try:
+            data = json.dumps(entry)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Not caching result that cannot be serialized: {str(e)}")
+            return
+        if len(data) > self.max_bytes:
+            return
+
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logger.debug(f"Error writing result cache entry: {str(e)}")
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(path.stat().st_size for path in self.directory.glob("*.json"))
+            else:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used files until the directory is back under its size limit."""
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in entries:
+            if size <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                size -= entry_size
+            except OSError:
+                continue
+        self._size = size
+
+    def clear(self) -> None:
+        """Remove all stored results."""
+        with self._lock:
+            for path in self.directory.glob("*.json"):
+                path.unlink(missing_ok=True)
+            self._size = 0
+
+
+class DurableTaskQueue:
+    """Task queue in a SQLite database shared by a workflow manager and its worker processes.
+
+    Workers claim a task with a lease and renew it while the task runs. A task whose lease expires
+    goes to the next worker that asks, and fails after QUEUE_MAX_ATTEMPTS claims. The rollback
+    journal is used instead of WAL so that hosts sharing the directory over a network file system
+    can use the queue, provided that file system supports POSIX locks and clocks are in sync.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._transaction() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS tasks (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    workflow_id TEXT NOT NULL,
+                    task_id TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    worker TEXT,
+                    lease_expires REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    result TEXT,
+                    UNIQUE (workflow_id, task_id)
+                )"""
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS tasks_by_status ON tasks (status, seq)")
+
+    @contextmanager
+    def _transaction(self):
+        """Run statements in one write transaction, taking the database lock up front."""
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def enqueue(self, workflow_id: str, task_id: str, payload: Dict) -> None:
+        """Queue a task, replacing any earlier entry for it."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM tasks WHERE workflow_id = ? AND task_id = ?", (workflow_id, task_id))
+            conn.execute(
+                "INSERT INTO tasks (workflow_id, task_id, payload, status) VALUES (?, ?, ?, 'queued')",
+                (workflow_id, task_id, json.dumps(payload, default=str)),
+            )
+
+    def claim(self, worker_id: str, lease_seconds: float = QUEUE_LEASE_SECONDS) -> Optional[Dict]:
+        """Lease the oldest available task to a worker, or return None when there is none."""
+        now = time.time()
+        with self._transaction() as conn:
+            # Tasks that keep losing their worker fail instead of being handed out forever
+            lost = {"status": "error", "content": [{"text": f"Task lost its worker {QUEUE_MAX_ATTEMPTS} times"}]}
+            conn.execute(
+                "UPDATE tasks SET status = 'done', result = ? "
+                "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (json.dumps(lost), now, QUEUE_MAX_ATTEMPTS),
+            )
+            row = conn.execute(
+                "SELECT seq, workflow_id, task_id, payload FROM tasks "
+                "WHERE status = 'queued' OR (status = 'leased' AND lease_expires < ?) ORDER BY seq LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE tasks SET status = 'leased', worker = ?, lease_expires = ?, attempts = attempts + 1 "
+                "WHERE seq = ?",
+                (worker_id, now + lease_seconds, row[0]),
+            )
+        return {"workflow_id": row[1], "task_id": row[2], "payload": json.loads(row[3])}
+
+    def renew(self, workflow_id: str, task_id: str, worker_id: str, lease_seconds: float = QUEUE_LEASE_SECONDS) -> bool:
+        """Extend a worker's lease and return whether the worker still holds the task."""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET lease_expires = ? "
+                "WHERE workflow_id = ? AND task_id = ? AND worker = ? AND status = 'leased'",
+                (time.time() + lease_seconds, workflow_id, task_id, worker_id),
+            )
+        return cursor.rowcount == 1
+
+    def claimed(self, workflow_id: str) -> bool:
+        """Return whether a worker holds a live lease on, or has finished, any task of a workflow."""
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM tasks WHERE workflow_id = ? "
+                "AND (status = 'done' OR (status = 'leased' AND lease_expires >= ?)) LIMIT 1",
+                (workflow_id, time.time()),
+            ).fetchone()
+        return row is not None
+
+    def complete(self, workflow_id: str, task_id: str, worker_id: str, result: Dict) -> bool:
+        """Post a task result; it is discarded unless the worker still holds the task."""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET status = 'done', result = ?, lease_expires = NULL "
+                "WHERE workflow_id = ? AND task_id = ? AND worker = ? AND status = 'leased'",
+                (json.dumps(result, default=str), workflow_id, task_id, worker_id),
+            )
+        return cursor.rowcount == 1
+
+    def collect(self, workflow_id: str) -> Dict[str, Dict]:
+        """Remove and return the posted results of a workflow's tasks."""
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT task_id, result FROM tasks WHERE workflow_id = ? AND status = 'done'", (workflow_id,)
+            ).fetchall()
+            conn.execute("DELETE FROM tasks WHERE workflow_id = ? AND status = 'done'", (workflow_id,))
+        return {task_id: json.loads(result) for task_id, result in rows}
+
+    def purge(self, workflow_id: str) -> None:
+        """Drop all entries of a workflow; results posted for them later are discarded."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM tasks WHERE workflow_id = ?", (workflow_id,))
+
+
+class QueueExecutor:
+    """Drop-in replacement for TaskExecutor that hands tasks to worker processes.
+
+    Submitted tasks are enqueued with the dependency results they need, and a poller thread
+    resolves their futures as workers post results. Workers adapt their own concurrency to
+    throttling and CPU load, so ``concurrency`` here only bounds the number of queued tasks.
+    """
+
+    def __init__(self, queue: DurableTaskQueue, max_in_flight=QUEUE_MAX_IN_FLIGHT, poll_interval=QUEUE_POLL_INTERVAL):
+        self.queue = queue
+        self.concurrency = max(1, max_in_flight)
+        self.poll_interval = poll_interval
+        self.lock = Lock()
+        self.active_tasks = set()
+        self.results = {}
+        self._pending: Dict[str, Tuple[str, str, Future]] = {}
+        self._poller: Optional[Thread] = None
+        self._stopped = Event()
+
+    def submit_task(self, task_id: str, task_func, task: Dict, workflow: Dict, **kwargs):
+        """Enqueue a task. Workers run it with ``WorkflowManager.execute_task``; task_func is not called."""
+        with self.lock:
+            if task_id in self.active_tasks:
+                return None
+            self.active_tasks.add(task_id)
+
+        dependency_results = {
+            dep_id: workflow["task_results"][dep_id]
+            for dep_id in task.get("dependencies") or []
+            if dep_id in workflow["task_results"]
+        }
+        payload = {
+            "task": task,
+            "workflow": {"workflow_id": workflow["workflow_id"], "task_results": dependency_results},
+        }
+        if "cache" in workflow:
+            payload["workflow"]["cache"] = workflow["cache"]
+        try:
+            self.queue.enqueue(workflow["workflow_id"], task["task_id"], payload)
+        except Exception:
+            with self.lock:
+                self.active_tasks.discard(task_id)
+            raise
+
+        future = Future()
+        with self.lock:
+            self._pending[task_id] = (workflow["workflow_id"], task["task_id"], future)
+            if self._poller is None:
+                self._poller = Thread(target=self._poll, name="workflow-queue-poller", daemon=True)
+                self._poller.start()
+        return future
+
+    def _poll(self):
+        """Resolve futures from posted results until no task is pending."""
+        while not self._stopped.wait(self.poll_interval):
+            with self.lock:
+                if not self._pending:
+                    self._poller = None
+                    return
+                workflow_ids = {workflow_id for workflow_id, _, _ in self._pending.values()}
+            for workflow_id in workflow_ids:
+                try:
+                    results = self.queue.collect(workflow_id)
+                except sqlite3.Error as e:
+                    logger.warning(f"Error reading workflow queue: {str(e)}")
+                    continue
+                for task_id, result in results.items():
+                    with self.lock:
+                        entry = self._pending.pop(f"{workflow_id}:{task_id}", None)
+                    if entry is not None:
+                        entry[2].set_result(result)
+
+    def record_success(self):
+        """Concurrency is adapted by the workers."""
+
+    def record_throttle(self):
+        """Concurrency is adapted by the workers."""
+
+    def task_completed(self, task_id: str, result):
+        """Mark task as completed with result."""
+        with self.lock:
+            self.results[task_id] = result
+            self.active_tasks.discard(task_id)
+
+    def cancel(self, workflow_id: str) -> None:
+        """Forget a workflow's pending tasks and remove them from the queue."""
+        prefix = f"{workflow_id}:"
+        with self.lock:
+            cancelled = [key for key in self._pending if key.startswith(prefix)]
+            futures = [self._pending.pop(key)[2] for key in cancelled]
+            self.active_tasks.difference_update(cancelled)
+        for future in futures:
+            future.cancel()
+        self.queue.purge(workflow_id)
+
+    def wait(self, workflow_id: str, completions: Queue, claim_timeout: Optional[float] = None):
+        """Return the next completion, failing when no worker has taken a task for ``claim_timeout`` seconds."""
+        claim_timeout = QUEUE_CLAIM_TIMEOUT if claim_timeout is None else claim_timeout
+        if claim_timeout <= 0:
+            return completions.get()
+        last_claim = time.monotonic()
+        while True:
+            try:
+                return completions.get(timeout=max(self.poll_interval, 0.1))
+            except Empty:
+                pass
+            try:
+                if self.queue.claimed(workflow_id):
+                    last_claim = time.monotonic()
+            except sqlite3.Error as e:
+                logger.warning(f"Error reading workflow queue: {str(e)}")
+                last_claim = time.monotonic()
+            if time.monotonic() - last_claim >= claim_timeout:
+                self.cancel(workflow_id)
+                raise TimeoutError(
+                    f"No worker claimed a task of workflow '{workflow_id}' for {claim_timeout:g} seconds; "
+                    "start workers with run_worker or set STRANDS_WORKFLOW_EXECUTOR=threads"
+                )
+
+    def shutdown(self):
+        """Stop polling; queued tasks stay in the queue."""
+        self._stopped.set()
+
+
 class TaskExecutor:
-    """Advanced task executor with dynamic scaling and resource monitoring."""
+    """Advanced task executor with dynamic scaling and resource monitoring.
 
-    def __init__(self, min_workers=MIN_THREADS, max_workers=MAX_THREADS):
-        self.min_workers = min_workers
-        self.max_workers = max_workers
-        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+    The thread pool is sized for max_workers, but schedulers should only keep ``concurrency``
+    tasks in flight. That limit starts at min_workers and follows additive-increase/
+    multiplicative-decrease: it grows by one per successful task until the first slowdown, then
+    by one per round of ``concurrency`` successful tasks, and is cut by SCALE_DOWN_FACTOR when the
+    provider throttles or CPU load exceeds CPU_THRESHOLD, always within [min_workers, max_workers].
+    """
+
+    def __init__(self, min_workers=MIN_THREADS, max_workers=MAX_THREADS, cpu_threshold=CPU_THRESHOLD):
+        self.max_workers = max(1, max_workers)
+        self.min_workers = max(1, min(min_workers, self.max_workers))
+        self.cpu_threshold = cpu_threshold
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
         self.task_queue = Queue()
         self.active_tasks = set()
         self.lock = Lock()
         self.results = {}
         self.start_times = {}  # Track task start times
         self.active_workers = 0  # Track number of active workers
+        self.concurrency = self.min_workers
+        self._slow_start = True
+        self._successes = 0
+        self._last_scale_down = float("-inf")
+
+    def _scale_down(self, reason: str) -> bool:
+        """Cut concurrency multiplicatively unless it was cut within the cooldown. Caller holds the lock."""
+        now = time.monotonic()
+        if now - self._last_scale_down < SCALE_DOWN_COOLDOWN:
+            return False
+        self._last_scale_down = now
+        self._slow_start = False
+        self._successes = 0
+        previous = self.concurrency
+        self.concurrency = max(self.min_workers, int(self.concurrency * SCALE_DOWN_FACTOR))
+        if self.concurrency != previous:
+            logger.info(f"⬇️ Workflow concurrency {previous} -> {self.concurrency} ({reason})")
+        return True
+
+    def record_success(self):
+        """Grow concurrency by one after a full round of successful tasks, unless CPU is overloaded."""
+        load = cpu_load_percent()
+        with self.lock:
+            if load is not None and load > self.cpu_threshold:
+                self._scale_down(f"CPU load {load:.0f}%")
+                return
+            self._successes += 1
+            round_size = 1 if self._slow_start else self.concurrency
+            if self._successes >= round_size and self.concurrency < self.max_workers:
+                self._successes = 0
+                self.concurrency += 1
+                logger.debug(f"⬆️ Workflow concurrency raised to {self.concurrency}")
+
+    def record_throttle(self):
+        """Cut concurrency after the model provider throttled a request."""
+        with self.lock:
+            self._scale_down("provider throttling")
 
     def submit_task(self, task_id: str, task_func, *args, **kwargs):
         """Submit a single task for execution."""
@@ -180,13 +907,14 @@ class TaskExecutor:
             self.start_times[task_id] = time.time()
             self.active_workers += 1
 
-            # Monitor task completion
-            def task_done_callback(fut):
-                with self.lock:
-                    self.active_workers -= 1
+        # Monitor task completion; registered outside the lock because a task that has
+        # already finished runs the callback immediately in this thread
+        def task_done_callback(fut):
+            with self.lock:
+                self.active_workers -= 1
 
-            future.add_done_callback(task_done_callback)
-            return future
+        future.add_done_callback(task_done_callback)
+        return future
 
     def submit_tasks(self, tasks):
         """Submit multiple tasks at once and return their futures."""
@@ -218,6 +946,13 @@ class WorkflowManager:
     """Workflow manager with advanced model support and monitoring."""
 
     _workflows: Dict[str, Dict] = {}
+    _journal_events: Dict[str, int] = {}
+    _own_writes: Dict[str, Tuple[int, int]] = {}
+    _persistence_lock = Lock()
+    _result_cache: Optional[TaskResultCache] = None
+    _task_queue: Optional[DurableTaskQueue] = None
+    _summaries: "OrderedDict[str, str]" = OrderedDict()
+    _summaries_lock = Lock()
     _observer = None
     _watch_paths = set()
     _instance = None
@@ -234,6 +969,8 @@ class WorkflowManager:
 
             # Initialize task executor
             self.task_executor = TaskExecutor()
+            self.queue_executor: Optional[QueueExecutor] = None
+            self.agent_pool = TaskAgentPool()
 
             # Start file watching if not already started
             if not self._observer:
@@ -259,6 +996,8 @@ class WorkflowManager:
 
         if hasattr(self, "task_executor"):
             self.task_executor.shutdown()
+        if getattr(self, "queue_executor", None) is not None:
+            self.queue_executor.shutdown()
 
     def _start_file_watching(self):
         """Initialize and start the file system observer."""
@@ -280,27 +1019,46 @@ class WorkflowManager:
             self.load_workflow(workflow_id)
 
     def load_workflow(self, workflow_id: str) -> Optional[Dict]:
-        """Load a workflow from its JSON file."""
+        """Load a workflow from its snapshot file and replay its journal."""
         try:
             file_path = WORKFLOW_DIR / f"{workflow_id}.json"
             if file_path.exists():
                 with open(file_path, "r") as f:
-                    self._workflows[workflow_id] = json.load(f)
+                    workflow = json.load(f)
+                self.replay_journal(workflow_id, workflow)
+                self._workflows[workflow_id] = workflow
                 return self._workflows[workflow_id]
         except Exception as e:
             logger.error(f"Error loading workflow {workflow_id}: {str(e)}")
         return None
 
     def store_workflow(self, workflow_id: str, workflow_data: Dict) -> Dict:
-        """Store workflow data in memory and to file."""
+        """Store workflow data in memory and write a snapshot file.
+
+        The snapshot replaces the file atomically and makes the journal redundant, so the
+        journal is cleared afterwards.
+        """
         try:
             # Store in memory
             self._workflows[workflow_id] = workflow_data
 
             # Store to file
             file_path = WORKFLOW_DIR / f"{workflow_id}.json"
-            with open(file_path, "w") as f:
-                json.dump(workflow_data, f, indent=2)
+            fd, tmp_path = tempfile.mkstemp(dir=WORKFLOW_DIR, prefix=f".{workflow_id}.", suffix=".tmp")
+            os.close(fd)
+            try:
+                with open(tmp_path, "w") as f:
+                    json.dump(workflow_data, f, separators=(",", ":"))
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+            self._remember_write(file_path)
+
+            # Events are only cleared once the snapshot containing them is in place
+            (WORKFLOW_DIR / f"{workflow_id}.journal").unlink(missing_ok=True)
+            with self._persistence_lock:
+                self._journal_events[workflow_id] = 0
 
             return {"status": "success"}
         except Exception as e:
@@ -308,6 +1066,74 @@ class WorkflowManager:
             logger.error(f"Error storing workflow: {error_msg}")
             return {"status": "error", "error": error_msg}
 
+    def journal_task_events(self, workflow_id: str, workflow: Dict, task_ids: List[str]) -> None:
+        """Append the current state of the given tasks to the workflow journal.
+
+        Each line records one task transition (started, completed, failed or skipped) with the
+        task's full result entry, so only changed tasks are written. Every SNAPSHOT_INTERVAL
+        events the workflow is compacted into a snapshot.
+        """
+        if not task_ids:
+            return
+        events = {"running": "started", "completed": "completed", "error": "failed", "skipped": "skipped"}
+        lines = []
+        for task_id in task_ids:
+            state = workflow["task_results"][task_id]
+            event = {"event": events.get(state["status"], state["status"]), "task_id": task_id, "state": state}
+            lines.append(json.dumps(event, separators=(",", ":")) + "\n")
+
+        self._workflows[workflow_id] = workflow
+        try:
+            with open(WORKFLOW_DIR / f"{workflow_id}.journal", "a") as f:
+                f.writelines(lines)
+        except Exception as e:
+            logger.error(f"Error writing journal for workflow {workflow_id}: {str(e)}")
+            self.store_workflow(workflow_id, workflow)
+            return
+
+        with self._persistence_lock:
+            count = self._journal_events.get(workflow_id, 0) + len(lines)
+            self._journal_events[workflow_id] = count
+        if count >= SNAPSHOT_INTERVAL:
+            self.store_workflow(workflow_id, workflow)
+
+    def replay_journal(self, workflow_id: str, workflow: Dict) -> int:
+        """Apply journaled task events on top of a loaded snapshot and return how many were applied."""
+        journal_path = WORKFLOW_DIR / f"{workflow_id}.journal"
+        if not journal_path.exists():
+            return 0
+        applied = 0
+        with open(journal_path, "r") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave the last line half written
+                    logger.warning(f"Ignoring incomplete journal entry for workflow {workflow_id}")
+                    break
+                workflow["task_results"][event["task_id"]] = event["state"]
+                applied += 1
+        with self._persistence_lock:
+            self._journal_events[workflow_id] = applied
+        return applied
+
+    def _remember_write(self, file_path: Path) -> None:
+        stat = os.stat(file_path)
+        with self._persistence_lock:
+            self._own_writes[str(file_path)] = (stat.st_mtime_ns, stat.st_size)
+
+    def is_own_write(self, file_path: str) -> bool:
+        """Return whether a file still holds exactly what this process last wrote to it."""
+        with self._persistence_lock:
+            signature = self._own_writes.get(str(file_path))
+        if signature is None:
+            return False
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        return signature == (stat.st_mtime_ns, stat.st_size)
+
     def get_workflow(self, workflow_id: str) -> Optional[Dict]:
         """Retrieve workflow data from memory or file."""
         workflow = self._workflows.get(workflow_id)
@@ -315,8 +1141,79 @@ class WorkflowManager:
             return self.load_workflow(workflow_id)
         return workflow
 
-    def _create_task_agent(self, task: Dict) -> Agent:
-        """Create a specialized agent for a specific task with custom model and tools."""
+    def get_result_cache(self) -> TaskResultCache:
+        """Return the result cache stored under the workflow directory."""
+        directory = Path(WORKFLOW_DIR) / "cache"
+        if self._result_cache is None or self._result_cache.directory != directory:
+            self._result_cache = TaskResultCache(directory, RESULT_CACHE_MAX_MB * 1024 * 1024)
+        return self._result_cache
+
+    def get_task_queue(self) -> DurableTaskQueue:
+        """Return the durable task queue stored under the workflow directory."""
+        path = Path(WORKFLOW_DIR) / "queue.db"
+        if self._task_queue is None or self._task_queue.path != path:
+            self._task_queue = DurableTaskQueue(path)
+        return self._task_queue
+
+    def get_executor(self):
+        """Return the executor selected by STRANDS_WORKFLOW_EXECUTOR."""
+        if EXECUTOR != "queue":
+            return self.task_executor
+        queue = self.get_task_queue()
+        if self.queue_executor is None or self.queue_executor.queue is not queue:
+            self.queue_executor = QueueExecutor(queue)
+        return self.queue_executor
+
+    def result_cache_enabled(self, task: Dict, workflow: Dict) -> bool:
+        """Return whether a task may use the result cache; a task's own "cache" setting wins."""
+        return bool(task.get("cache", workflow.get("cache", RESULT_CACHE_ENABLED)))
+
+    def task_cache_key(self, task: Dict, workflow: Dict) -> str:
+        """Hash everything that determines a task's output, including the dependency results it sees.
+
+        An edited task gets a new key, its new output changes the keys of its dependents, and so
+        only the affected downstream tasks miss the cache.
+        """
+        provider, model_id = self.rate_limit_key(task)
+        system_prompt = task.get("system_prompt") or getattr(self.parent_agent, "system_prompt", None)
+        tools = task.get("tools")
+        material = {
+            "description": task["description"],
+            "system_prompt": system_prompt,
+            "provider": provider,
+            "model_id": model_id,
+            "model_settings": task.get("model_settings"),
+            "tools": sorted(tools) if tools else None,
+            # The budget and the summary model change how dependency results appear in the prompt
+            "context_budget": task.get("context_budget", CONTEXT_BUDGET),
+            "summary_model": [SUMMARY_PROVIDER, SUMMARY_MODEL_ID],
+            "dependencies": {
+                dep_id: workflow["task_results"].get(dep_id, {}).get("result")
+                for dep_id in task.get("dependencies") or []
+            },
+        }
+        return hashlib.sha256(json.dumps(material, sort_keys=True, default=str).encode()).hexdigest()
+
+    def agent_pool_key(self, task: Dict) -> Tuple:
+        """Return the key under which agents for this task's configuration are pooled."""
+        model_provider = task.get("model_provider")
+        if model_provider == "env":
+            model_provider = f"env:{os.getenv('STRANDS_PROVIDER', 'ollama')}"
+        tools = task.get("tools")
+        return (
+            model_provider,
+            settings_digest(task.get("model_settings")),
+            tuple(sorted(tools)) if tools else None,
+            task.get("system_prompt"),
+        )
+
+    def _create_task_agent(self, task: Dict) -> Tuple[Agent, bool]:
+        """Create a specialized agent for a specific task with custom model and tools.
+
+        Returns the agent and whether it was built with the requested configuration. Fallback
+        agents must not be pooled, so that later tasks retry the configured model.
+        """
+        configured = True
         try:
             # Get task-specific configuration
             task_tools = task.get("tools")
@@ -349,21 +1246,29 @@ class WorkflowManager:
                 # Use environment variables
                 try:
                     env_provider = os.getenv("STRANDS_PROVIDER", "ollama")
-                    selected_model = create_model(provider=env_provider, config=model_settings)
+                    selected_model = self.agent_pool.get_model(
+                        (env_provider, settings_digest(model_settings)),
+                        lambda: create_model(provider=env_provider, config=model_settings),
+                    )
                     model_info = f"Using environment model: {env_provider}"
                 except Exception as e:
                     logger.warning(f"Failed to create model from environment: {e}")
                     selected_model = self.parent_agent.model if self.parent_agent else None
                     model_info = "Failed to use environment model, using parent's model"
+                    configured = False
             else:
                 # Use specified model provider
                 try:
-                    selected_model = create_model(provider=model_provider, config=model_settings)
+                    selected_model = self.agent_pool.get_model(
+                        (model_provider, settings_digest(model_settings)),
+                        lambda: create_model(provider=model_provider, config=model_settings),
+                    )
                     model_info = f"Using {model_provider} model"
                 except Exception as e:
                     logger.warning(f"Failed to create {model_provider} model: {e}")
                     selected_model = self.parent_agent.model if self.parent_agent else None
                     model_info = f"Failed to use {model_provider} model, using parent's model"
+                    configured = False
 
             # Determine system prompt
             if not system_prompt and self.parent_agent and hasattr(self.parent_agent, "system_prompt"):
@@ -380,68 +1285,208 @@ class WorkflowManager:
             )
 
             logger.debug(f"Created task agent with {len(filtered_tools)} tools, model: {model_info}")
-            return task_agent
+            return task_agent, configured
 
         except Exception as e:
             logger.error(f"Error creating task agent: {str(e)}")
             # Fallback to parent agent or basic agent
             if self.parent_agent:
-                return self.parent_agent
-            return Agent(system_prompt="You are a helpful AI assistant.")
-
-    def _wait_for_rate_limit(self):
-        """Implements rate limiting for API calls."""
-        global _last_request_time
-        with _rate_limit_lock:
-            current_time = time.time()
-            time_since_last = current_time - _last_request_time
-            if time_since_last < _MIN_REQUEST_INTERVAL:
-                sleep_time = _MIN_REQUEST_INTERVAL - time_since_last
-                time.sleep(sleep_time)
-            _last_request_time = time.time()
-
-    @retry(
-        stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=1, min=4, max=30),
-        reraise=True,
-    )
-    def execute_task(self, task: Dict, workflow: Dict) -> Dict:
-        """Execute a single task using a specialized agent with rate limiting and retries."""
+                return self.parent_agent, False
+            return Agent(system_prompt="You are a helpful AI assistant."), False
+
+    def rate_limit_key(self, task: Dict) -> Tuple[str, str]:
+        """Return the (provider, model_id) a task's model calls are rate limited under."""
+        model_provider = task.get("model_provider")
+        model_settings = task.get("model_settings") or {}
+        if model_provider is None:
+            provider = "parent"
+            config = getattr(self.parent_agent.model, "config", None) if self.parent_agent else None
+            model_id = config.get("model_id") if isinstance(config, dict) else None
+        else:
+            provider = os.getenv("STRANDS_PROVIDER", "ollama") if model_provider == "env" else model_provider
+            model_id = model_settings.get("model_id")
+        return provider, str(model_id or "default")
+
+    def estimate_task_tokens(self, task: Dict, prompt: str) -> int:
+        """Estimate the input plus output tokens of a task's model call."""
+        params = (task.get("model_settings") or {}).get("params") or {}
+        output_tokens = params.get("max_tokens") or ESTIMATED_OUTPUT_TOKENS
+        system_prompt = task.get("system_prompt") or ""
+        return estimate_tokens(prompt) + estimate_tokens(system_prompt) + int(output_tokens)
+
+    def build_dependency_context(self, task: Dict, workflow: Dict) -> List[str]:
+        """Collect the results of a task's dependencies, fitted into the task's context budget.
+
+        Each dependency gets a share of the budget (see ``allocate_budget``). Results over their
+        share are summarized by the summary model when one is configured, and truncated otherwise.
+        When the fan-in is so wide that a share could not hold a header, a truncation note and
+        MIN_RESULT_TOKENS of text, the last dependencies are replaced by a single omission note.
+        """
+        texts = {}
+        for dep_id in task.get("dependencies") or []:
+            dep_result = workflow["task_results"].get(dep_id, {})
+            if dep_result.get("status") == "completed" and dep_result.get("result"):
+                # Format the dependency results
+                dep_content = []
+                for msg in dep_result["result"]:
+                    if isinstance(msg, dict) and msg.get("text"):
+                        dep_content.append(msg["text"])
+                if dep_content:
+                    texts[dep_id] = "\n".join(dep_content)
+
+        context = {dep_id: f"Results from {dep_id}:\n{text}" for dep_id, text in texts.items()}
+        budget = task.get("context_budget", CONTEXT_BUDGET)
+        if budget <= 0:
+            return list(context.values())
+
+        dep_ids = list(context)
+        sizes = {dep_id: estimate_tokens(part) for dep_id, part in context.items()}
+        # The header and the truncation note count against the share
+        overheads = {
+            dep_id: sizes[dep_id] - estimate_tokens(text) + TRUNCATION_NOTE_TOKENS for dep_id, text in texts.items()
+        }
+
+        def omission_note(count: int) -> str:
+            return f"Results from {count} more dependencies omitted to fit the context budget."
+
+        def allocate(kept: int) -> Optional[Dict[str, int]]:
+            """Shares for the first ``kept`` dependencies, or None when one would be too small to use."""
+            note_tokens = estimate_tokens(omission_note(len(dep_ids) - kept)) if kept < len(dep_ids) else 0
+            shares = allocate_budget({dep_id: sizes[dep_id] for dep_id in dep_ids[:kept]}, budget - note_tokens)
+            for dep_id, share in shares.items():
+                if sizes[dep_id] > share and share < overheads[dep_id] + MIN_RESULT_TOKENS:
+                    return None
+            return shares
+
+        # Fewer dependencies only get larger shares, so search for the most that still fit
+        low, high = 0, len(dep_ids)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if allocate(middle) is None:
+                high = middle - 1
+            else:
+                low = middle
+        shares = allocate(low) or {}
+
+        parts = []
+        for dep_id in dep_ids[:low]:
+            if sizes[dep_id] > shares[dep_id]:
+                fitted = self.fit_to_budget(dep_id, texts[dep_id], shares[dep_id] - overheads[dep_id])
+                parts.append(f"Results from {dep_id}:\n{fitted}")
+            else:
+                parts.append(context[dep_id])
+        if low < len(dep_ids):
+            logger.warning(f"Task '{task.get('task_id')}': {len(dep_ids) - low} dependency results omitted")
+            parts.append(omission_note(len(dep_ids) - low))
+        return parts
+
+    def fit_to_budget(self, dep_id: str, text: str, max_tokens: int) -> str:
+        """Shrink a dependency result to about ``max_tokens`` tokens by summary or truncation."""
+        max_chars = max(max_tokens * CHARS_PER_TOKEN, 1)
+        if SUMMARY_PROVIDER and max_tokens > 0:
+            try:
+                text = self.summarize_result(dep_id, text, max_tokens)
+            except Exception as e:
+                logger.warning(f"Summarizing results of {dep_id} failed, truncating instead: {str(e)}")
+        return truncate_markdown(text, max_chars)
+
+    def summarize_result(self, dep_id: str, text: str, max_tokens: int) -> str:
+        """Summarize a dependency result with the summary model; summaries are cached by content."""
+        model_settings = {"model_id": SUMMARY_MODEL_ID} if SUMMARY_MODEL_ID else None
+        key = hashlib.sha256(
+            f"{SUMMARY_PROVIDER}|{SUMMARY_MODEL_ID}|{max_tokens}|{text}".encode("utf-8", "surrogatepass")
+        ).hexdigest()
+        with self._summaries_lock:
+            if key in self._summaries:
+                self._summaries.move_to_end(key)
+                return self._summaries[key]
+
+        prompt = (
+            f"Summarize the following results of the task '{dep_id}' in at most {max_tokens * 3 // 4} words.\n\n{text}"
+        )
+        MODEL_RATE_LIMITER.acquire(
+            SUMMARY_PROVIDER, SUMMARY_MODEL_ID or "default", estimate_tokens(prompt) + max_tokens
+        )
+        model = self.agent_pool.get_model(
+            (SUMMARY_PROVIDER, settings_digest(model_settings)),
+            lambda: create_model(provider=SUMMARY_PROVIDER, config=model_settings),
+        )
+        summarizer = Agent(model=model, system_prompt=SUMMARY_SYSTEM_PROMPT, tools=[], callback_handler=None)
+        summary = str(summarizer(prompt)).strip()
+
+        with self._summaries_lock:
+            self._summaries[key] = summary
+            while len(self._summaries) > SUMMARY_CACHE_SIZE:
+                self._summaries.popitem(last=False)
+        return summary
+
+    def _wait_for_rate_limit(self, task: Dict, prompt: str) -> int:
+        """Wait for the task's model to have request and token capacity; return the token estimate."""
+        provider, model_id = self.rate_limit_key(task)
+        estimated_tokens = self.estimate_task_tokens(task, prompt)
+        MODEL_RATE_LIMITER.acquire(provider, model_id, estimated_tokens)
+        return estimated_tokens
+
+    def execute_task(self, task: Dict, workflow: Dict, start_delay: float = 0.0) -> Dict:
+        """Execute a single task using a specialized agent with rate limiting and retries.
+
+        Throttling and transient errors are retried up to MAX_RETRIES times with jittered
+        exponential backoff, honoring Retry-After; other errors fail the task immediately.
+        ``start_delay`` staggers tasks that became ready in the same burst.
+        """
         try:
             task_id = task["task_id"]
 
+            # Serve unchanged tasks from the result cache without calling the model
+            cache_key = None
+            if self.result_cache_enabled(task, workflow):
+                cache_key = self.task_cache_key(task, workflow)
+                cached = self.get_result_cache().get(cache_key)
+                if cached is not None:
+                    logger.info(f"♻️ Task {task_id} served from the result cache")
+                    return {"status": "success", "content": cached["content"], "metrics": None, "cached": True}
+
             # Build context from dependent tasks
-            context = []
-            if task.get("dependencies"):
-                for dep_id in task["dependencies"]:
-                    dep_result = workflow["task_results"].get(dep_id, {})
-                    if dep_result.get("status") == "completed" and dep_result.get("result"):
-                        # Format the dependency results
-                        dep_content = []
-                        for msg in dep_result["result"]:
-                            if isinstance(msg, dict) and msg.get("text"):
-                                dep_content.append(msg["text"])
-                        if dep_content:
-                            context.append(f"Results from {dep_id}:\n" + "\n".join(dep_content))
+            context = self.build_dependency_context(task, workflow)
 
             # Build comprehensive task prompt with context
             task_prompt = task["description"]
             if context:
                 task_prompt = "Previous task results:\n" + "\n\n".join(context) + "\n\nCurrent Task:\n" + task_prompt
 
-            # Add jitter to prevent thundering herd
-            jitter = random.uniform(0, 1)
-            time.sleep(jitter)
+            # Spread out tasks that became ready at the same time
+            if start_delay > 0:
+                time.sleep(start_delay)
 
-            # Apply rate limiting before making API call
-            self._wait_for_rate_limit()
+            pool_key = self.agent_pool_key(task)
+            attempt = 0
+            while True:
+                # Apply rate limiting before making API call
+                estimated_tokens = self._wait_for_rate_limit(task, task_prompt)
 
-            # Create specialized agent for this task
-            task_agent = self._create_task_agent(task)
+                # Reuse an idle agent with the same configuration, or create a specialized one
+                task_agent = self.agent_pool.acquire(pool_key)
+                poolable = task_agent is not None
+                if task_agent is None:
+                    task_agent, poolable = self._create_task_agent(task)
 
-            # Execute task
-            logger.debug(f"Executing task {task_id} with specialized agent")
-            result = task_agent(task_prompt)
+                # Execute task
+                logger.debug(f"Executing task {task_id} with specialized agent")
+                try:
+                    result = task_agent(task_prompt)
+                    break
+                except Exception as e:
+                    kind = classify_error(e)
+                    if kind == "throttling":
+                        self.task_executor.record_throttle()
+                    if kind == "permanent" or attempt >= MAX_RETRIES:
+                        raise
+                    delay = retry_delay(attempt, e)
+                    attempt += 1
+                    logger.warning(
+                        f"Task {task_id} hit a {kind} error, retry {attempt}/{MAX_RETRIES} in {delay:.2f}s: {str(e)}"
+                    )
+                    time.sleep(delay)
 
             # Extract response content - handle both dict and custom object return types
             try:
@@ -468,8 +1513,19 @@ class WorkflowManager:
                 metrics_text = metrics_to_string(metrics)
                 logger.debug(f"Task {task_id} metrics: {metrics_text}")
 
+            # Replace the token estimate with the real usage
+            usage = getattr(metrics, "accumulated_usage", None)
+            if isinstance(usage, dict) and isinstance(usage.get("totalTokens"), int):
+                MODEL_RATE_LIMITER.settle(*self.rate_limit_key(task), estimated_tokens, usage["totalTokens"])
+
+            # Agents that failed mid-call are dropped, and so are fallbacks that do not match pool_key
+            if poolable:
+                self.agent_pool.release(pool_key, task_agent)
+
             # Update task status
             status = "success" if stop_reason != "error" else "error"
+            if cache_key and status == "success":
+                self.get_result_cache().set(cache_key, {"content": content})
             return {
                 "status": status,
                 "content": content,
@@ -479,9 +1535,6 @@ class WorkflowManager:
         except Exception as e:
             error_msg = f"Error executing task {task['task_id']}: {str(e)}"
             logger.error(error_msg)
-            if "ThrottlingException" in str(e):
-                logger.error(f"Task {task['task_id']} hit throttling, will retry with exponential backoff")
-                raise
             return {"status": "error", "content": [{"text": error_msg}]}
 
     def create_workflow(self, workflow_id: str, tasks: List[Dict]) -> Dict:
@@ -581,111 +1634,246 @@ class WorkflowManager:
         ready_tasks.sort(key=lambda x: x.get("priority", 3), reverse=True)
         return ready_tasks
 
-    def start_workflow(self, workflow_id: str) -> Dict:
-        """Start or resume workflow execution with true parallel processing."""
+    def build_dependency_graph(self, workflow: Dict) -> Tuple[Dict[str, int], Dict[str, List[str]]]:
+        """Count unfinished dependencies per task and map each task to the tasks waiting on it.
+
+        Completed tasks are left out, so a restarted workflow only schedules the remaining work.
+        """
+        results = workflow["task_results"]
+        indegree = {}
+        dependents: Dict[str, List[str]] = {}
+        for task in workflow["tasks"]:
+            task_id = task["task_id"]
+            if results[task_id]["status"] == "completed":
+                continue
+            indegree[task_id] = 0
+            for dep_id in task.get("dependencies") or []:
+                if results[dep_id]["status"] != "completed":
+                    indegree[task_id] += 1
+                    dependents.setdefault(dep_id, []).append(task_id)
+        return indegree, dependents
+
+    def _record_task_result(self, workflow: Dict, task_id: str, future) -> bool:
+        """Store the outcome of a finished task future and return whether it succeeded."""
         try:
-            # Get workflow data
-            workflow = self.get_workflow(workflow_id)
+            result = future.result()
+
+            # Ensure content uses valid format
+            content = []
+            for item in result.get("content", []):
+                if isinstance(item, dict):
+                    content.append(item)
+                else:
+                    content.append({"text": str(item)})
+
+            succeeded = result["status"] == "success"
+            workflow["task_results"][task_id] = {
+                **workflow["task_results"][task_id],
+                "status": "completed" if succeeded else "error",
+                "result": content,
+                "completed_at": datetime.now(timezone.utc).isoformat(),
+                "metrics": result.get("metrics"),
+                "cached": bool(result.get("cached")),
+            }
+            if succeeded:
+                logger.info(f"✅ Task '{task_id}' completed successfully")
+            else:
+                logger.error(f"❌ Task '{task_id}' returned an error")
+            return succeeded
+
+        except Exception as e:
+            workflow["task_results"][task_id] = {
+                **workflow["task_results"][task_id],
+                "status": "error",
+                "result": [{"text": f"Task execution error: {str(e)}"}],
+                "completed_at": datetime.now(timezone.utc).isoformat(),
+            }
+            logger.error(f"❌ Task '{task_id}' failed: {str(e)}")
+            return False
+
+    def _skip_task(self, workflow: Dict, task_id: str, reason: str) -> None:
+        """Mark a task that can no longer run."""
+        workflow["task_results"][task_id] = {
+            **workflow["task_results"][task_id],
+            "status": "skipped",
+            "result": [{"text": reason}],
+            "completed_at": datetime.now(timezone.utc).isoformat(),
+        }
+        logger.warning(f"⏭️ Task '{task_id}' skipped: {reason}")
+
+    def is_running(self, workflow_id: str) -> bool:
+        """Return whether any task of the workflow is executing in, or queued by, this process."""
+        prefix = f"{workflow_id}:"
+        for executor in (self.task_executor, self.queue_executor):
+            if executor is None:
+                continue
+            with executor.lock:
+                if any(task_id.startswith(prefix) for task_id in executor.active_tasks):
+                    return True
+        return False
+
+    def reset_task_results(self, workflow: Dict, keep_completed: bool) -> int:
+        """Return tasks to pending, optionally keeping completed ones, and return how many were kept."""
+        kept = 0
+        for task_id, task_result in workflow["task_results"].items():
+            if keep_completed and task_result["status"] == "completed":
+                kept += 1
+                continue
+            workflow["task_results"][task_id] = {
+                "status": "pending",
+                "result": None,
+                **{key: task_result[key] for key in ("priority", "model_provider", "tools") if key in task_result},
+            }
+        return kept
+
+    def start_workflow(self, workflow_id: str, resume: bool = False, cache: Optional[bool] = None) -> Dict:
+        """Start or resume workflow execution with true parallel processing.
+
+        Starting runs every task from scratch. Resuming reloads the persisted state (snapshot plus
+        journal), keeps completed tasks and their outputs, and re-queues everything else, including
+        tasks that were running when the previous process stopped. ``cache`` turns the task result
+        cache on or off for this and later runs of the workflow.
+
+        Tasks are scheduled by counting unfinished dependencies. A task enters the ready heap
+        (highest priority first, then definition order) once its count drops to zero, and worker
+        completions are delivered through a queue, so the scheduler blocks instead of polling and
+        touches each dependency edge once. Tasks downstream of a failed task are skipped. With
+        STRANDS_WORKFLOW_EXECUTOR=queue, ready tasks go to worker processes through the durable
+        queue instead of the local thread pool.
+        """
+        try:
+            if self.is_running(workflow_id):
+                return {
+                    "status": "error",
+                    "content": [{"text": f"❌ Workflow '{workflow_id}' is already running"}],
+                }
+
+            # Get workflow data; a resume trusts what is on disk over memory
+            workflow = (self.load_workflow(workflow_id) if resume else None) or self.get_workflow(workflow_id)
             if not workflow:
                 return {
                     "status": "error",
                     "content": [{"text": f"❌ Workflow '{workflow_id}' not found"}],
                 }
 
+            kept = self.reset_task_results(workflow, keep_completed=resume)
+            if cache is not None:
+                workflow["cache"] = cache
+
             # Update status
+            now = datetime.now(timezone.utc).isoformat()
             workflow["status"] = "running"
-            workflow["started_at"] = datetime.now(timezone.utc).isoformat()
+            workflow.pop("completed_at", None)
+            if resume:
+                workflow.setdefault("started_at", now)
+                workflow["resumed_at"] = now
+            else:
+                workflow["started_at"] = now
+                workflow.pop("resumed_at", None)
             self.store_workflow(workflow_id, workflow)
 
-            logger.info(f"🚀 Starting workflow '{workflow_id}' with {len(workflow['tasks'])} tasks")
+            if resume:
+                logger.info(
+                    f"🔁 Resuming workflow '{workflow_id}': {kept} of {len(workflow['tasks'])} tasks already completed"
+                )
+            else:
+                logger.info(f"🚀 Starting workflow '{workflow_id}' with {len(workflow['tasks'])} tasks")
 
-            # Track completed tasks and active futures
-            completed_tasks = set()
-            active_futures = {}
+            executor = self.get_executor()
+            if executor is not self.task_executor:
+                # Entries left by an interrupted run are queued again below
+                executor.queue.purge(workflow_id)
+
+            tasks_by_id = {task["task_id"]: task for task in workflow["tasks"]}
+            order = {task_id: index for index, task_id in enumerate(tasks_by_id)}
+            indegree, dependents = self.build_dependency_graph(workflow)
             total_tasks = len(workflow["tasks"])
 
-            while len(completed_tasks) < total_tasks:
-                # Get all ready tasks
-                ready_tasks = self.get_ready_tasks(workflow)
-
-                # Prepare tasks for parallel submission with batching
-                tasks_to_submit = []
-                max_concurrent = self.task_executor.max_workers
-                current_batch_size = min(len(ready_tasks), max_concurrent - len(active_futures))
-
-                for task in ready_tasks[:current_batch_size]:
-                    task_id = task["task_id"]
-                    if task_id not in active_futures and task_id not in completed_tasks:
-                        # Namespace task_id with workflow_id to prevent conflicts
-                        namespaced_task_id = f"{workflow_id}:{task_id}"
-                        tasks_to_submit.append(
-                            (
-                                namespaced_task_id,
-                                self.execute_task,
-                                (task, workflow),
-                                {},
-                            )
-                        )
-
-                # Submit batch of tasks in parallel
-                if tasks_to_submit:
-                    new_futures = self.task_executor.submit_tasks(tasks_to_submit)
-                    active_futures.update(new_futures)
-                    logger.debug(f"📤 Submitted {len(tasks_to_submit)} tasks for execution")
-
-                # Wait for any task to complete
-                if active_futures:
-                    done, _ = wait(active_futures.values(), return_when=FIRST_COMPLETED)
-
-                    # Process completed tasks
-                    completed_task_ids = []
-                    for namespaced_task_id, future in active_futures.items():
-                        if future in done:
-                            # Extract original task_id from namespaced version
-                            task_id = (
-                                namespaced_task_id.split(":", 1)[1] if ":" in namespaced_task_id else namespaced_task_id
-                            )
-                            completed_task_ids.append(namespaced_task_id)
-                            try:
-                                result = future.result()
-
-                                # Ensure content uses valid format
-                                content = []
-                                for item in result.get("content", []):
-                                    if isinstance(item, dict):
-                                        content.append(item)
-                                    else:
-                                        content.append({"text": str(item)})
-
-                                workflow["task_results"][task_id] = {
-                                    **workflow["task_results"][task_id],
-                                    "status": ("completed" if result["status"] == "success" else "error"),
-                                    "result": content,
-                                    "completed_at": datetime.now(timezone.utc).isoformat(),
-                                    "metrics": result.get("metrics"),
-                                }
-                                completed_tasks.add(task_id)
-                                logger.info(f"✅ Task '{task_id}' completed successfully")
-
-                            except Exception as e:
-                                workflow["task_results"][task_id] = {
-                                    **workflow["task_results"][task_id],
-                                    "status": "error",
-                                    "result": [{"text": f"Task execution error: {str(e)}"}],
-                                    "completed_at": datetime.now(timezone.utc).isoformat(),
-                                }
-                                completed_tasks.add(task_id)
-                                logger.error(f"❌ Task '{task_id}' failed: {str(e)}")
-
-                    # Remove completed tasks from active futures
-                    for task_id in completed_task_ids:
-                        del active_futures[task_id]
-
-                # Store updated workflow state
-                self.store_workflow(workflow_id, workflow)
-
-                # Brief pause to prevent tight loop
-                time.sleep(0.1)
+            ready: List[Tuple[int, int, str]] = []
+            for task_id, count in indegree.items():
+                if count == 0:
+                    heapq.heappush(ready, (-tasks_by_id[task_id].get("priority", 3), order[task_id], task_id))
+
+            completions: Queue = Queue()
+            running: Dict[str, str] = {}
+            remaining = len(indegree)
+
+            def skip_dependents(failed_id: str) -> List[str]:
+                skipped = []
+                stack = [failed_id]
+                while stack:
+                    for dependent_id in dependents.get(stack.pop(), []):
+                        if workflow["task_results"][dependent_id]["status"] == "skipped":
+                            continue
+                        self._skip_task(workflow, dependent_id, f"Dependency '{failed_id}' did not complete")
+                        skipped.append(dependent_id)
+                        stack.append(dependent_id)
+                return skipped
+
+            while remaining:
+                # Fill free workers from the ready heap
+                started = []
+                burst = min(len(ready), executor.concurrency - len(running))
+                while ready and len(running) < executor.concurrency:
+                    _, _, task_id = heapq.heappop(ready)
+                    # Namespace task_id with workflow_id to prevent conflicts
+                    namespaced_task_id = f"{workflow_id}:{task_id}"
+                    # Only stagger starts when many tasks are released at once
+                    kwargs = {}
+                    if burst >= STARTUP_JITTER_MIN_BATCH:
+                        kwargs["start_delay"] = random.uniform(0, STARTUP_JITTER_MAX)
+                    future = executor.submit_task(
+                        namespaced_task_id, self.execute_task, tasks_by_id[task_id], workflow, **kwargs
+                    )
+                    if future is None:
+                        raise RuntimeError(f"Task '{namespaced_task_id}' is already running")
+                    workflow["task_results"][task_id] = {
+                        **workflow["task_results"][task_id],
+                        "status": "running",
+                        "started_at": datetime.now(timezone.utc).isoformat(),
+                    }
+                    running[task_id] = namespaced_task_id
+                    started.append(task_id)
+                    future.add_done_callback(lambda fut, task_id=task_id: completions.put((task_id, fut)))
+                self.journal_task_events(workflow_id, workflow, started)
+
+                if not running:
+                    # Nothing can make progress: the remaining tasks wait on each other
+                    for task_id, count in indegree.items():
+                        if count > 0 and workflow["task_results"][task_id]["status"] != "skipped":
+                            self._skip_task(workflow, task_id, "Dependency cycle")
+                    break
+
+                # Block until a task finishes, then drain any others that finished meanwhile
+                if executor is self.task_executor:
+                    finished = [completions.get()]
+                else:
+                    finished = [executor.wait(workflow_id, completions)]
+                while not completions.empty():
+                    finished.append(completions.get_nowait())
+
+                changed = []
+                for task_id, future in finished:
+                    namespaced_task_id = running.pop(task_id)
+                    succeeded = self._record_task_result(workflow, task_id, future)
+                    executor.task_completed(namespaced_task_id, workflow["task_results"][task_id])
+                    remaining -= 1
+                    changed.append(task_id)
+                    if succeeded:
+                        executor.record_success()
+                    else:
+                        skipped = skip_dependents(task_id)
+                        remaining -= len(skipped)
+                        changed.extend(skipped)
+                        continue
+                    for dependent_id in dependents.get(task_id, []):
+                        indegree[dependent_id] -= 1
+                        if indegree[dependent_id] == 0:
+                            priority = tasks_by_id[dependent_id].get("priority", 3)
+                            heapq.heappush(ready, (-priority, order[dependent_id], dependent_id))
+
+                # Journal the finished tasks instead of rewriting the whole workflow
+                self.journal_task_events(workflow_id, workflow, changed)
 
             # Workflow completed
             workflow["status"] = "completed"
@@ -696,17 +1884,16 @@ class WorkflowManager:
             completed_count = sum(1 for result in workflow["task_results"].values() if result["status"] == "completed")
             success_rate = (completed_count / total_tasks) * 100 if total_tasks > 0 else 0
 
-            return {
-                "status": "success",
-                "content": [
-                    {
-                        "text": (
-                            f"🎉 Workflow '{workflow_id}' completed successfully! "
-                            f"({completed_count}/{total_tasks} tasks succeeded - {success_rate:.1f}%)"
-                        )
-                    }
-                ],
-            }
+            text = (
+                f"🎉 Workflow '{workflow_id}' completed successfully! "
+                f"({completed_count}/{total_tasks} tasks succeeded - {success_rate:.1f}%)"
+            )
+            if resume:
+                text += f"\n🔁 Resumed with {kept} completed tasks kept"
+            cached_count = sum(1 for result in workflow["task_results"].values() if result.get("cached"))
+            if cached_count:
+                text += f"\n♻️ {cached_count} tasks served from the result cache"
+            return {"status": "success", "content": [{"text": text}]}
 
         except Exception as e:
             error_trace = traceback.format_exc()
@@ -791,6 +1978,8 @@ class WorkflowManager:
 
             if workflow.get("started_at"):
                 status_lines.append(f"🚀 **Started:** {workflow['started_at'].split('T')[0]}")
+            if workflow.get("resumed_at"):
+                status_lines.append(f"🔁 **Resumed:** {workflow['resumed_at'].split('T')[0]}")
             if workflow.get("completed_at"):
                 status_lines.append(f"🏁 **Completed:** {workflow['completed_at'].split('T')[0]}")
 
@@ -805,7 +1994,7 @@ class WorkflowManager:
             table.add_column("⏱️ Duration", justify="right")
 
             # Count statuses
-            status_counts = {"pending": 0, "completed": 0, "error": 0, "running": 0}
+            status_counts = {"pending": 0, "completed": 0, "error": 0, "running": 0, "skipped": 0}
             total_tasks = len(workflow["tasks"])
 
             for task in workflow["tasks"]:
@@ -837,6 +2026,8 @@ class WorkflowManager:
                     status_display = "[red]❌[/red]"
                 elif status == "running":
                     status_display = "[yellow]🔄[/yellow]"
+                elif status == "skipped":
+                    status_display = "[dim]⏭️[/dim]"
                 else:
                     status_display = "[blue]⏳[/blue]"
 
@@ -861,7 +2052,9 @@ class WorkflowManager:
                     f"✅ **Completed:** {status_counts['completed']}",
                     f"⏳ **Pending:** {status_counts['pending']}",
                     f"❌ **Failed:** {status_counts['error']}",
-                    f"🔄 **Active Workers:** {self.task_executor.active_workers}/{self.task_executor.max_workers}",
+                    f"⏭️ **Skipped:** {status_counts['skipped']}",
+                    f"🔄 **Active Workers:** {self.task_executor.active_workers}/{self.task_executor.concurrency} "
+                    f"(limit {self.task_executor.min_workers}-{self.task_executor.max_workers})",
                 ]
             )
 
@@ -891,6 +2084,9 @@ class WorkflowManager:
                 del self._workflows[workflow_id]
 
             # Remove file if exists
+            (WORKFLOW_DIR / f"{workflow_id}.journal").unlink(missing_ok=True)
+            if (WORKFLOW_DIR / "queue.db").exists():
+                self.get_task_queue().purge(workflow_id)
             file_path = WORKFLOW_DIR / f"{workflow_id}.json"
             if file_path.exists():
                 file_path.unlink()
@@ -910,6 +2106,86 @@ class WorkflowManager:
             return {"status": "error", "content": [{"text": error_msg}]}
 
 
+def run_worker(
+    parent_agent: Optional[Any] = None,
+    worker_id: Optional[str] = None,
+    lease_seconds: float = QUEUE_LEASE_SECONDS,
+    poll_interval: float = QUEUE_POLL_INTERVAL,
+    stop_event: Optional[Event] = None,
+    max_tasks: Optional[int] = None,
+) -> int:
+    """Run queued workflow tasks until stopped and return how many were run.
+
+    Start any number of workers, on this host or on others sharing STRANDS_WORKFLOW_DIR, and run
+    workflows with STRANDS_WORKFLOW_EXECUTOR=queue. ``parent_agent`` provides the tools and the
+    default model of tasks, like the agent calling the workflow tool does for in-process runs.
+    A worker runs as many tasks at once as its TaskExecutor's adaptive concurrency allows and
+    renews their leases while they run. When stopped, it finishes the tasks it holds first.
+    """
+    manager = WorkflowManager(parent_agent)
+    queue = manager.get_task_queue()
+    executor = manager.task_executor
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    stop_event = stop_event or Event()
+    running: Dict[Tuple[str, str], Future] = {}
+    finished = 0
+    last_renewal = time.monotonic()
+    logger.info(f"👷 Workflow worker {worker_id} started")
+
+    def post_result(key: Tuple[str, str], future: Future) -> None:
+        try:
+            result = future.result()
+        except Exception as e:
+            result = {"status": "error", "content": [{"text": f"Task execution error: {str(e)}"}]}
+        task_id = ":".join(key)
+        executor.task_completed(task_id, result)
+        # The result lives in the queue from here on; a long-running worker must not keep it
+        with executor.lock:
+            executor.results.pop(task_id, None)
+            executor.start_times.pop(task_id, None)
+        if result.get("status") == "success":
+            executor.record_success()
+        if not queue.complete(*key, worker_id, result):
+            logger.warning(f"Result of task '{key[1]}' discarded: its lease was lost or the workflow restarted")
+
+    while True:
+        try:
+            for key, future in list(running.items()):
+                if future.done():
+                    del running[key]
+                    post_result(key, future)
+                    finished += 1
+
+            # Renew before deciding whether to stop, so a draining worker keeps its leases
+            if running and time.monotonic() - last_renewal >= lease_seconds / 3:
+                for key in running:
+                    queue.renew(*key, worker_id, lease_seconds)
+                last_renewal = time.monotonic()
+
+            if stop_event.is_set() or (max_tasks is not None and finished + len(running) >= max_tasks):
+                if not running:
+                    break
+                stop_event.wait(poll_interval)
+                continue
+
+            claimed = queue.claim(worker_id, lease_seconds) if len(running) < executor.concurrency else None
+            if claimed is None:
+                stop_event.wait(poll_interval)
+                continue
+
+            key = (claimed["workflow_id"], claimed["task_id"])
+            payload = claimed["payload"]
+            future = executor.submit_task(":".join(key), manager.execute_task, payload["task"], payload["workflow"])
+            if future is not None:
+                running[key] = future
+        except sqlite3.Error as e:
+            logger.warning(f"Error accessing workflow queue: {str(e)}")
+            stop_event.wait(poll_interval)
+
+    logger.info(f"👷 Workflow worker {worker_id} stopped after {finished} tasks")
+    return finished
+
+
 # Global manager instance
 _manager = None
 
@@ -919,6 +2195,7 @@ def workflow(
     action: str,
     workflow_id: Optional[str] = None,
     tasks: Optional[List[Dict[str, Any]]] = None,
+    cache: Optional[bool] = None,
     agent: Optional[Any] = None,
 ) -> Dict[str, Any]:
     """Advanced workflow orchestration with granular model and tool control.
@@ -962,12 +2239,12 @@ def workflow(
     Args:
         action: Action to perform on workflows.
             • "create": Create a new workflow with tasks
-            • "start": Begin workflow execution
+            • "start": Begin workflow execution from scratch
+            • "resume": Continue a stopped or crashed workflow, keeping completed tasks
             • "list": Show all workflows and their status
             • "status": Get detailed workflow progress
             • "delete": Remove workflow and cleanup
             • "pause": Pause workflow execution (future)
-            • "resume": Resume paused workflow (future)
 
         workflow_id: Unique identifier for the workflow.
             Auto-generated if not provided for create action.
@@ -984,6 +2261,14 @@ def workflow(
             • dependencies (List[str]): Task IDs this task depends on [OPTIONAL]
             • priority (int): Task priority 1-5, higher is more important [OPTIONAL, default: 3]
             • timeout (int): Task timeout in seconds [OPTIONAL, default: 300]
+            • cache (bool): Whether this task may use the result cache [OPTIONAL]
+            • context_budget (int): Tokens of dependency results included in the prompt, 0 for no
+              limit [OPTIONAL, default: STRANDS_WORKFLOW_CONTEXT_BUDGET]
+
+        cache: Reuse results of unchanged tasks for start and resume actions. A task is unchanged
+            when its description, system prompt, model, model settings, tools and the results
+            of its dependencies all match an earlier successful run. The setting is remembered by
+            the workflow; tasks can opt out with "cache": false. Defaults to STRANDS_WORKFLOW_CACHE.
 
         agent: Parent agent (automatically provided by Strands framework).
 
@@ -1093,6 +2378,9 @@ def workflow(
     # Monitor progress
     result = agent.tool.workflow(action="status", workflow_id="data_pipeline")
 
+    # Continue after a crash without re-running completed tasks
+    result = agent.tool.workflow(action="resume", workflow_id="data_pipeline")
+
     # List all workflows
     result = agent.tool.workflow(action="list")
     ```
@@ -1135,7 +2423,15 @@ def workflow(
                     "status": "error",
                     "content": [{"text": "❌ workflow_id is required for start action"}],
                 }
-            return _manager.start_workflow(workflow_id)
+            return _manager.start_workflow(workflow_id, cache=cache)
+
+        elif action == "resume":
+            if not workflow_id:
+                return {
+                    "status": "error",
+                    "content": [{"text": "❌ workflow_id is required for resume action"}],
+                }
+            return _manager.start_workflow(workflow_id, resume=True, cache=cache)
 
         elif action == "list":
             return _manager.list_workflows()
@@ -1156,7 +2452,7 @@ def workflow(
                 }
             return _manager.delete_workflow(workflow_id)
 
-        elif action in ["pause", "resume"]:
+        elif action == "pause":
             return {
                 "status": "error",
                 "content": [{"text": f"🚧 Action '{action}' is not yet implemented"}],
@@ -1165,7 +2461,9 @@ def workflow(
         else:
             return {
                 "status": "error",
-                "content": [{"text": f"❌ Unknown action: {action}. Available: create, start, list, status, delete"}],
+                "content": [
+                    {"text": f"❌ Unknown action: {action}. Available: create, start, resume, list, status, delete"}
+                ],
             }
 
     except Exception as e:
@@ -2,6 +2,9 @@
 Tests for the calculator tool using the Agent interface.
 """
 
+import os
+import sys
+import time
 import unittest.mock as mock
 
 import pytest
@@ -11,21 +14,33 @@ from sympy import Integer, Symbol, exp, log
 
 # Function level imports from calculator module
 from src.strands_tools.calculator import (
+    SymbolicResultCache,
+    SymbolicTimeoutError,
+    SymbolicWorker,
     apply_symbolic_simplifications,
+    batch_evaluate,
     calculate_derivative,
     calculate_integral,
     calculate_limit,
     calculate_series,
+    compile_expression,
     create_error_panel,
     create_result_table,
     evaluate_expression,
+    expand_batch_values,
+    fast_numeric_evaluation,
     force_numerical_eval,
+    format_matrix_result,
     format_number,
     get_precision_level,
     numeric_evaluation,
+    numeric_limit,
+    numeric_solve,
     parse_expression,
     parse_matrix_expression,
     preprocess_expression,
+    run_fallback,
+    run_symbolic,
     solve_equation,
 )
 from src.strands_tools.calculator import calculator as calculator_func
@@ -34,6 +49,22 @@ from src.strands_tools.calculator import calculator as calculator_func
 from strands_tools import calculator as calculator_module
 
 
+@pytest.fixture(autouse=True)
+def result_cache_dir(tmp_path, monkeypatch):
+    """Keep the persistent result cache out of the home directory."""
+    cache_dir = tmp_path / "calculator_cache"
+    monkeypatch.setenv("CALCULATOR_RESULT_CACHE", "true")
+    monkeypatch.setenv("CALCULATOR_RESULT_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture
+def worker_ready():
+    """Treat the symbolic worker as started, so calls go to its (mocked) run method."""
+    with mock.patch("src.strands_tools.calculator.symbolic_worker.poll_ready", return_value=True):
+        yield
+
+
 @pytest.fixture
 def agent():
     """Create an agent with the calculator tool loaded."""
@@ -642,3 +673,424 @@ def test_error_handling(agent):
     result_text = extract_result_text(result)
     # Should either give an error or solve in terms of y
     assert "Error" in result_text or "y" in result_text
+
+
+def test_compile_expression_is_cached():
+    """Test that parsing the same expression text twice reuses the compiled form."""
+    compile_expression.cache_clear()
+
+    first = compile_expression("a*x**2 + b")
+    second = compile_expression("a*x**2 + b")
+
+    assert first is second
+    assert first.symbol_names == ("a", "b", "x")
+    assert compile_expression.cache_info().hits == 1
+    assert first.get_function(("a", "b", "x")) is first.get_function(("a", "b", "x"))
+
+
+@pytest.mark.parametrize(
+    "expression,variables",
+    [
+        ("x*y", {"x": 2, "y": 3}),
+        ("x/3", {"x": 1}),
+        ("x*x", {"x": 1000}),
+        ("sqrt(x)", {"x": -4}),
+        ("sin(x) + log(y)", {"x": 0.5, "y": 2.5}),
+        ("pi*r**2", {"r": 2}),
+    ],
+)
+def test_fast_numeric_evaluation_matches_symbolic(expression, variables):
+    """Test that the mpmath fast path formats results exactly like the symbolic path."""
+    fast = fast_numeric_evaluation(compile_expression(expression), variables, 10, False)
+    symbolic = evaluate_expression(parse_expression(expression), variables, 10, False)
+
+    assert fast is not None
+    assert str(fast) == str(symbolic)
+
+
+@pytest.mark.parametrize(
+    "expression,variables",
+    [
+        ("a*x + b", {"a": 2, "b": 3}),  # free symbol without a value
+        ("x + 1", {"x": "y"}),  # non-numeric value
+        ("x**100", {"x": 2}),  # exact integer beyond float precision
+        ("1/x", {"x": 0}),  # not finite
+        ("2 + 2", {}),  # no variables
+    ],
+)
+def test_fast_numeric_evaluation_falls_back(expression, variables):
+    """Test that the fast path declines when it cannot reproduce the symbolic result."""
+    assert fast_numeric_evaluation(compile_expression(expression), variables, 10, False) is None
+
+
+def test_calculator_numeric_variables(agent):
+    """Test evaluating the same formula with different numeric inputs."""
+    for x, expected in [(1, "4"), (2, "7"), (0.5, "2.5")]:
+        result = agent.tool.calculator(expression="3*x + 1", variables={"x": x})
+        assert f"Result: {expected}" in extract_result_text(result)
+
+
+def test_expand_batch_values():
+    """Test expanding lists, ranges and scalars into equal-length rows."""
+    inputs, size = expand_batch_values(
+        {"a": [1, 2, 3], "b": {"start": 0, "stop": 3}, "c": {"start": 0, "stop": 1, "num": 3}, "d": 7}
+    )
+
+    assert size == 3
+    assert inputs == {"a": [1, 2, 3], "b": [0.0, 1.0, 2.0], "c": [0.0, 0.5, 1.0], "d": [7, 7, 7]}
+
+    with pytest.raises(ValueError, match="same number of values"):
+        expand_batch_values({"x": [1, 2], "y": [1, 2, 3]})
+
+    with pytest.raises(ValueError, match="must not be zero"):
+        expand_batch_values({"x": {"start": 0, "stop": 1, "step": 0}})
+    with pytest.raises(ValueError, match="must not be negative"):
+        expand_batch_values({"x": {"start": 0, "stop": 1, "num": -5}})
+
+    with mock.patch.dict("os.environ", {"CALCULATOR_BATCH_MAX_SIZE": "10"}):
+        with pytest.raises(ValueError, match="batch limit"):
+            expand_batch_values({"x": {"start": 0, "stop": 100}})
+
+
+@pytest.mark.parametrize("numpy_available", [True, False])
+def test_batch_evaluate(numpy_available):
+    """Test batch evaluation with and without NumPy installed."""
+    if numpy_available:
+        pytest.importorskip("numpy")
+
+    with mock.patch.dict(sys.modules, {} if numpy_available else {"numpy": None}):
+        inputs, values = batch_evaluate(compile_expression("x * y + 1"), {"x": [1, 2, 3], "y": 2})
+
+    assert inputs["y"] == [2, 2, 2]
+    assert [float(v) for v in values] == [3.0, 5.0, 7.0]
+
+
+def test_batch_evaluate_missing_variable():
+    """Test that every free symbol needs values in batch mode."""
+    with pytest.raises(ValueError, match="Missing values for variables: y"):
+        batch_evaluate(compile_expression("x + y"), {"x": [1, 2]})
+
+
+def test_calculator_batch_mode(agent):
+    """Test batch mode through the agent interface."""
+    result = agent.tool.calculator(
+        expression="p * (1 + r)**n",
+        mode="batch",
+        variables={"p": [1000, 2000], "r": 0.1, "n": [1, 2]},
+    )
+    result_text = extract_result_text(result)
+
+    assert "Batch of 2 evaluations" in result_text
+    assert "min: 1100" in result_text
+    assert "max: 2420" in result_text
+    assert "p=2000, r=0.1, n=2 -> 2420" in result_text
+
+
+def test_numeric_solve():
+    """Test numeric root finding for single equations and systems."""
+    x, y = sp.symbols("x y")
+
+    roots = numeric_solve(x**2 - 4, precision=10)
+    assert sorted(roots) == [-2.0, 2.0]
+
+    roots = numeric_solve(x**2 + 1, precision=10)
+    assert set(roots) == {complex(0, 1), complex(0, -1)}
+
+    solution = numeric_solve([x + y - 10, x - y - 2], precision=10)
+    assert solution == {x: 6.0, y: 4.0}
+
+    with pytest.raises(ValueError, match="single unknown"):
+        numeric_solve(x + y, precision=10)
+
+
+def test_numeric_limit():
+    """Test numeric limits at finite points and infinity."""
+    x = sp.Symbol("x")
+
+    assert numeric_limit(sp.sin(x) / x, "x", "0") == pytest.approx(1.0)
+    assert numeric_limit((1 + 1 / x) ** x, "x", "oo") == pytest.approx(float(sp.E))
+
+    with pytest.raises(ValueError, match="single variable"):
+        numeric_limit(x * sp.Symbol("y"), "x", "0")
+
+
+def test_symbolic_worker_round_trip_and_timeout():
+    """Test that the worker returns results and is replaced after a timeout."""
+    worker = SymbolicWorker()
+    x = sp.Symbol("x")
+    try:
+        assert worker.run("integrate", (x**2, "x"), timeout=30) == x**3 / 3
+
+        with pytest.raises(ValueError, match="Integration error"):
+            worker.run("integrate", (sp.Integer(1) / 0, "x"), timeout=30)
+
+        hard = sp.exp(sp.sin(x)) * sp.log(x) ** 3 / (1 + x**7) ** sp.Rational(1, 2)
+        process = worker._process
+        with pytest.raises(SymbolicTimeoutError):
+            worker.run("integrate", (hard, "x"), timeout=0.2)
+        # The killed worker is replaced right away so that its successor starts in the background
+        assert process.poll() is not None
+        assert worker.is_alive() and worker._process is not process
+
+        assert worker.run("limit", (sp.sin(x) / x, "x", "0"), timeout=30) == 1
+    finally:
+        worker.stop()
+
+
+def test_symbolic_worker_startup_counts_against_budget():
+    """Test that a call does not wait longer than its budget for the worker to start."""
+    worker = SymbolicWorker()
+    x = sp.Symbol("x")
+    try:
+        started = time.monotonic()
+        with pytest.raises(SymbolicTimeoutError, match="did not start"):
+            worker.run("integrate", (x**2, "x"), timeout=0.05)
+        assert time.monotonic() - started < 0.5
+
+        # The process keeps starting and serves the next call
+        assert worker.is_alive()
+        assert worker.run("integrate", (x**2, "x"), timeout=30) == x**3 / 3
+    finally:
+        worker.stop()
+
+
+def test_first_call_runs_in_process_while_worker_starts():
+    """Test that calls made while the worker imports SymPy run in-process instead of waiting for it."""
+    worker = SymbolicWorker()
+    x = sp.Symbol("x")
+    try:
+        with mock.patch("src.strands_tools.calculator.symbolic_worker", worker):
+            started = time.monotonic()
+            assert run_symbolic("integrate", (x**2, "x"), timeout=30) == x**3 / 3
+            assert time.monotonic() - started < 1
+            assert worker.is_alive()
+
+            deadline = time.monotonic() + 30
+            while not worker.poll_ready() and time.monotonic() < deadline:
+                time.sleep(0.05)
+            with mock.patch.object(worker, "run", wraps=worker.run) as mock_run:
+                assert run_symbolic("integrate", (x**2, "x"), timeout=30) == x**3 / 3
+            mock_run.assert_called_once()
+    finally:
+        worker.stop()
+
+
+def test_numeric_expressions_skip_worker(worker_ready):
+    """Test that only symbolic simplification goes to the worker process."""
+    with mock.patch("src.strands_tools.calculator.symbolic_worker.run", return_value=sp.Symbol("x")) as mock_run:
+        assert calculator_func(expression="2+3")["content"][0]["text"] == "Result: 5"
+        assert calculator_func(expression="x**2", variables={"x": "sqrt(2)"})["content"][0]["text"] == "Result: 2"
+        mock_run.assert_not_called()
+
+        calculator_func(expression="x + x")
+        mock_run.assert_called_once()
+
+
+def test_fallback_bounded_by_deadline():
+    """Test that a slow numeric fallback gives up at the deadline of the call."""
+
+    def slow_fallback():
+        time.sleep(1)
+
+    started = time.monotonic()
+    with pytest.raises(SymbolicTimeoutError):
+        run_fallback(slow_fallback, (), time.monotonic() + 0.05)
+    assert time.monotonic() - started < 0.5
+    assert run_fallback(lambda a: a + 1, (1,), None) == 2
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected,note",
+    [
+        ({"expression": "x**2 - 4", "mode": "solve"}, "2.0", "roots found numerically"),
+        ({"expression": "sin(x)/x", "mode": "limit", "wrt": "x", "point": "0"}, "1.0", "approximated numerically"),
+        ({"expression": "x**2", "mode": "integrate", "wrt": "x"}, "Integral(x**2, x)", "left unevaluated"),
+        ({"expression": "sqrt(x**2)", "variables": {"y": 1}}, "sqrt(x**2)", "evaluated without it"),
+    ],
+)
+def test_calculator_timeout_fallbacks(kwargs, expected, note, worker_ready):
+    """Test that each budgeted mode falls back when the worker times out."""
+    with mock.patch("src.strands_tools.calculator.symbolic_worker.run", side_effect=SymbolicTimeoutError("exceeded")):
+        result = calculator_func(**kwargs, timeout=1)
+
+    assert result["status"] == "success"
+    assert expected in result["content"][0]["text"]
+    assert note in result["content"][0]["text"]
+
+
+def test_calculator_without_timeout_runs_inline():
+    """Test that timeout=0 skips the worker process."""
+    with mock.patch("src.strands_tools.calculator.symbolic_worker.run") as mock_run:
+        result = calculator_func(expression="x**2 - 4", mode="solve", timeout=0)
+
+    mock_run.assert_not_called()
+    assert result["status"] == "success"
+    assert "2" in result["content"][0]["text"]
+
+
+@pytest.mark.parametrize(
+    "expression,expected",
+    [
+        ("det([[1, 2], [3, 4]])", "-2"),
+        ("inv([[1, 2], [3, 4]])", "Matrix([[-2, 1], [3/2, -1/2]])"),
+        ("solve([[3, 1], [1, 2]], [9, 8])", "Matrix([[2], [3]])"),
+        ("eigvals([[2, 0], [0, 3]])", "{2: 1, 3: 1}"),
+        ("svd([[3, 0], [0, 4]])", "[4, 3]"),
+        ("rank([[1, 2], [2, 4]])", "1"),
+        ("trace([[1, 2], [3, 4]])", "5"),
+        ("transpose([[1, 2], [3, 4]])", "Matrix([[1, 3], [2, 4]])"),
+        ("[[1, 2], [3, 4]] ** 2", "Matrix([[7, 10], [15, 22]])"),
+        ("2 * [[1, 2], [3, 4]] - [[1, 1], [1, 1]]", "Matrix([[1, 3], [5, 7]])"),
+        ("[[4611686018427387904, 0], [0, 1]] * [[4, 0], [0, 1]]", "Matrix([[18446744073709551616, 0], [0, 1]])"),
+    ],
+)
+def test_matrix_functions(expression, expected):
+    """Test that integer matrices are computed exactly."""
+    result = calculator_func(expression=expression, mode="matrix")
+
+    assert result["status"] == "success"
+    assert result["content"][0]["text"] == f"Result: {expected}"
+
+
+def test_numeric_matrix_without_numpy():
+    """Test that numeric matrices fall back to exact SymPy results when NumPy is missing."""
+    with mock.patch.dict(sys.modules, {"numpy": None}):
+        assert parse_matrix_expression("det([[1, 2], [3, 4]])") == -2
+        assert parse_matrix_expression("inv([[1, 2], [3, 4]])") == sp.Matrix(
+            [[-2, 1], [sp.Rational(3, 2), -sp.Rational(1, 2)]]
+        )
+        assert parse_matrix_expression("[[1, 2], [3, 4]] * [[5, 6], [7, 8]]") == sp.Matrix([[19, 22], [43, 50]])
+
+
+def test_float_matrix_uses_numpy():
+    """Test that float matrices are computed with NumPy and printed like SymPy matrices."""
+    np = pytest.importorskip("numpy")
+
+    result = parse_matrix_expression("inv([[4.0, 7.0], [2.0, 6.0]])")
+
+    assert isinstance(result, np.ndarray)
+    formatted = format_matrix_result(result)
+    assert isinstance(formatted, sp.Matrix)
+    assert (formatted - sp.Matrix([[0.6, -0.7], [-0.2, 0.4]])).norm() < 1e-12
+    assert format_matrix_result(parse_matrix_expression("det([[2.0, 0], [0, 3]])")) == pytest.approx(6.0)
+
+
+def test_integer_and_big_matrices_stay_exact():
+    """Test that integer matrices, and float matrices with integers beyond float precision, use SymPy."""
+    assert parse_matrix_expression("inv([[1, 2], [3, 4]])") == sp.Matrix(
+        [[-2, 1], [sp.Rational(3, 2), -sp.Rational(1, 2)]]
+    )
+
+    result = parse_matrix_expression("[[0.5, 36893488147419103233]] * [[2], [1]]")
+
+    assert isinstance(result, sp.Matrix)
+    assert float(result[0]) == pytest.approx(36893488147419103234.0)
+
+
+def test_symbolic_matrix_uses_sympy():
+    """Test that matrices with symbolic entries stay symbolic."""
+    result = parse_matrix_expression("det([['a', 1], [0, 'b']])")
+
+    assert result == sp.Symbol("a") * sp.Symbol("b")
+
+
+def test_matrix_errors():
+    """Test errors for unsupported syntax and singular matrices."""
+    with pytest.raises(ValueError, match="unsupported syntax"):
+        parse_matrix_expression("cofactor([[1, 2], [3, 4]])")
+
+    with pytest.raises(ValueError, match="integer exponent"):
+        parse_matrix_expression("[[1, 2], [3, 4]] ** 0.5")
+
+    with pytest.raises(ValueError, match="Matrix parsing error"):
+        parse_matrix_expression("inv([[1, 2], [2, 4]])")
+
+
+def test_result_cache_key_uses_canonical_form():
+    """Test that keys depend on the canonical expression, operation and parameters."""
+    x = sp.Symbol("x")
+
+    key = SymbolicResultCache.make_key("derive", parse_expression("x**2 + 2*x"), ("x", 1))
+    assert key == SymbolicResultCache.make_key("derive", x**2 + 2 * x, ("x", 1))
+    assert key != SymbolicResultCache.make_key("derive", x**2 + 2 * x, ("x", 2))
+    assert key != SymbolicResultCache.make_key("integrate", x**2 + 2 * x, ("x", 1))
+
+
+def test_result_cache_shared_between_instances(tmp_path):
+    """Test that results written by one cache instance are read by another, as across processes."""
+    x = sp.Symbol("x")
+    key = SymbolicResultCache.make_key("integrate", x**2, ("x",))
+
+    SymbolicResultCache(tmp_path, 1024 * 1024).set(key, x**3 / 3)
+
+    assert SymbolicResultCache(tmp_path, 1024 * 1024).get(key) == x**3 / 3
+    assert SymbolicResultCache(tmp_path, 1024 * 1024).get("missing") is None
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path):
+    """Test size-based eviction of the oldest entries."""
+    cache = SymbolicResultCache(tmp_path, max_bytes=1500)
+    for i in range(10):
+        cache.set(f"key{i}", "x" * 200)
+        os.utime(tmp_path / f"key{i}.pkl", (i, i))
+
+    remaining = sorted(path.stem for path in tmp_path.glob("*.pkl"))
+    assert sum(path.stat().st_size for path in tmp_path.glob("*.pkl")) <= 1500
+    assert "key9" in remaining
+    assert "key0" not in remaining
+
+
+def test_result_cache_size_tracks_overwrites_and_stale_tmp_files(tmp_path):
+    """Test that overwriting an entry is not counted twice and that leftover temp files are evicted."""
+    cache = SymbolicResultCache(tmp_path, max_bytes=1000)
+    cache.set("key", "x" * 100)
+    size = cache._size
+    for _ in range(20):
+        cache.set("key", "x" * 100)
+    assert cache._size == size
+
+    stale = tmp_path / "orphan.tmp"
+    stale.write_bytes(b"x" * 10)
+    os.utime(stale, (0, 0))
+    fresh = tmp_path / "inflight.tmp"
+    fresh.write_bytes(b"x" * 10)
+    cache.set("big", "x" * 900)
+
+    assert not stale.exists()
+    assert fresh.exists()
+
+
+def test_result_cache_off_by_default(monkeypatch):
+    """Test that the pickle-based cache needs to be enabled explicitly."""
+    monkeypatch.delenv("CALCULATOR_RESULT_CACHE")
+    assert calculator_module.get_result_cache() is None
+
+
+def test_result_cache_discards_corrupt_entries(tmp_path):
+    """Test that unreadable entries are treated as misses and removed."""
+    (tmp_path / "broken.pkl").write_bytes(b"not a pickle")
+
+    assert SymbolicResultCache(tmp_path, 1024).get("broken") is None
+    assert not (tmp_path / "broken.pkl").exists()
+
+
+def test_calculator_reuses_cached_results(result_cache_dir):
+    """Test that repeated derivatives and series are answered from the cache."""
+    with mock.patch("src.strands_tools.calculator.calculate_derivative", wraps=calculate_derivative) as mock_derivative:
+        first = calculator_func(expression="sin(x)*x**2", mode="derive", wrt="x")
+        second = calculator_func(expression="sin(x)*x**2", mode="derive", wrt="x")
+
+    assert first == second
+    assert mock_derivative.call_count == 1
+    assert list(result_cache_dir.glob("*.pkl"))
+
+
+def test_calculator_result_cache_disabled(monkeypatch):
+    """Test that a zero size limit disables the cache."""
+    monkeypatch.setenv("CALCULATOR_RESULT_CACHE_MAX_MB", "0")
+
+    with mock.patch("src.strands_tools.calculator.calculate_series", wraps=calculate_series) as mock_series:
+        calculator_func(expression="exp(x)", mode="series", wrt="x")
+        calculator_func(expression="exp(x)", mode="series", wrt="x")
+
+    assert mock_series.call_count == 2
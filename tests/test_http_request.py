@@ -2,18 +2,34 @@
 Tests for the http_request tool using the Agent interface and direct invocation.
 """
 
+import email.utils
+import http.server
 import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
-from urllib.parse import urlparse
+from urllib.parse import parse_qsl, urlsplit
 
 import pytest
+import requests
 import responses
 from strands import Agent
 
 from strands_tools import http_request
 
 
+@pytest.fixture(autouse=True)
+def reset_host_limiter():
+    """Start every test with closed circuits, full rate limit buckets and empty auth caches."""
+    http_request.HOST_LIMITER.clear()
+    http_request.clear_auth_caches()
+    yield
+    http_request.HOST_LIMITER.clear()
+    http_request.clear_auth_caches()
+
+
 @pytest.fixture
 def agent():
     """Create an agent with the http_request tool loaded."""
@@ -750,16 +766,13 @@ def test_metrics_collection_with_detail():
     # Verify metrics were processed
     assert mock_metrics.called
 
-    # Verify metrics were stored in REQUEST_METRICS
-    assert len(http_request.REQUEST_METRICS) > 0
-    assert urlparse("example.com").netloc in [urlparse(url).netloc for url in http_request.REQUEST_METRICS]
-    assert len(http_request.REQUEST_METRICS["example.com"]) > 0
-
-    # Verify metrics data structure
-    metrics_entry = http_request.REQUEST_METRICS["example.com"][0]
-    assert "duration" in metrics_entry
-    assert "status_code" in metrics_entry
-    assert metrics_entry["status_code"] == 200
+    # Verify metrics were recorded for the host
+    assert "example.com" in http_request.REQUEST_METRICS
+    host_metrics = http_request.get_request_metrics("example.com")["example.com"]
+    assert host_metrics["count"] == 1
+    assert host_metrics["status"] == {"2xx": 1}
+    assert set(host_metrics["latency_ms"]) == {"p50", "p95", "p99", "mean", "max"}
+    assert host_metrics["bytes_received"] > 0
 
     # Verify metrics are mentioned in the result
     result_text = extract_result_text(result)
@@ -784,8 +797,8 @@ def test_session_reuse():
         status=200,
     )
 
-    # Clear session cache
-    http_request.SESSION_CACHE.clear()
+    # Clear session pool
+    http_request.SESSION_POOL.clear()
 
     # Make first request
     tool_use1 = {
@@ -826,9 +839,183 @@ def test_session_reuse():
     assert result2["status"] == "success"
 
     # Verify session was reused (get_cached_session should return cached session for second request)
-    assert len(http_request.SESSION_CACHE) == 1
-    assert urlparse("example.com").netloc in [urlparse(url).netloc for url in http_request.SESSION_CACHE]
+    assert len(http_request.SESSION_POOL) == 1
+    assert http_request.SESSION_POOL.keys()[0][:3] == ("https", "example.com", 443)
     assert mock_session.call_count == 2
+    stats = http_request.SESSION_POOL.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_session_pool_keys_by_config():
+    """Sessions with different pool settings for the same host are not shared."""
+    pool = http_request.SessionPool(max_sessions=8, max_connections=100)
+
+    small = pool.get("https://example.com/a", {"pool_size": 2})
+    large = pool.get("https://example.com/b", {"pool_size": 20})
+    other_port = pool.get("https://example.com:8443/a", {"pool_size": 2})
+
+    assert small is not large
+    assert other_port is not small
+    assert pool.get("https://EXAMPLE.com/c", {"pool_size": 2}) is small
+    assert pool.stats()["connections"] == 24
+    pool.clear()
+
+
+def test_session_pool_evicts_lru_when_over_limits():
+    """The least recently used session is evicted once the session or connection cap is reached."""
+    pool = http_request.SessionPool(max_sessions=2, max_connections=15)
+
+    def request(url, pool_size):
+        session = pool.get(url, {"pool_size": pool_size})
+        pool.release(session)
+        return session
+
+    first = request("https://a.example.com", 5)
+    request("https://b.example.com", 5)
+    request("https://a.example.com", 5)
+
+    with patch.object(requests.Session, "close") as mock_close:
+        request("https://c.example.com", 5)
+        mock_close.assert_called_once()
+    assert [key[1] for key in pool.keys()] == ["a.example.com", "c.example.com"]
+    assert request("https://a.example.com", 5) is first
+
+    # A session larger than the remaining budget pushes out older ones
+    request("https://d.example.com", 10)
+    stats = pool.stats()
+    assert stats["connections"] <= 15
+    assert stats["evictions"] == 2
+    pool.clear()
+
+
+def test_session_pool_closes_evicted_sessions_after_release():
+    """An evicted session stays open while a request uses it and is closed by the last release."""
+    pool = http_request.SessionPool(max_sessions=1, max_connections=15)
+
+    held = pool.get("https://a.example.com", {"pool_size": 10})
+    with patch.object(held, "close") as mock_close:
+        pool.get("https://b.example.com", {"pool_size": 10})
+        assert [key[1] for key in pool.keys()] == ["b.example.com"]
+        mock_close.assert_not_called()
+        # The busy evicted session still holds its connections
+        assert pool.stats()["open_connections"] == 20
+        assert pool.stats()["retired_in_use"] == 1
+
+        pool.release(held)
+        mock_close.assert_called_once()
+    assert pool.stats()["open_connections"] == 10
+
+    idle = pool.get("https://c.example.com", {})
+    pool.release(idle)
+    with patch.object(idle, "close") as mock_close:
+        pool.get("https://d.example.com", {})
+        mock_close.assert_called_once()
+    pool.clear()
+
+
+@responses.activate
+def test_request_releases_its_session():
+    """http_request releases the pooled session when it is done, also on errors."""
+    responses.add(responses.GET, "https://example.com/ok", body="ok", status=200)
+    with patch.object(http_request.SESSION_POOL, "release", wraps=http_request.SESSION_POOL.release) as mock_release:
+        http_request.http_request(tool={"toolUseId": "id", "input": {"method": "GET", "url": "https://example.com/ok"}})
+        http_request.http_request(
+            tool={"toolUseId": "id", "input": {"method": "GET", "url": "https://example.com/missing"}}
+        )
+
+    assert mock_release.call_count == 2
+
+
+def test_session_pool_evicts_idle_sessions():
+    """Sessions idle for longer than the timeout are dropped."""
+    pool = http_request.SessionPool(idle_timeout=30)
+
+    with patch("strands_tools.http_request.time.monotonic", return_value=1000.0):
+        first = pool.get("https://example.com", {})
+    with patch("strands_tools.http_request.time.monotonic", return_value=1020.0):
+        assert pool.evict_idle() == 0
+    with patch("strands_tools.http_request.time.monotonic", return_value=1100.0):
+        assert pool.evict_idle() == 1
+        assert len(pool) == 0
+        assert pool.get("https://example.com", {}) is not first
+    assert pool.stats()["idle_evictions"] == 1
+    pool.clear()
+
+
+def test_session_pool_is_thread_safe():
+    """Concurrent lookups for the same key return a single session."""
+    pool = http_request.SessionPool()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sessions = list(executor.map(lambda _: pool.get("https://example.com", {}), range(64)))
+
+    assert len({id(session) for session in sessions}) == 1
+    assert pool.stats()["misses"] == 1
+    pool.clear()
+
+
+def test_request_metrics_percentiles():
+    """Percentiles are estimated from the fixed-size latency histogram."""
+    metrics = http_request.RequestMetrics(window=60, slots=6)
+    for duration_ms in range(1, 101):
+        metrics.record("api.example.com", duration_ms / 1000, 200, bytes_received=10)
+    metrics.record("api.example.com", 2.0, 503, retries=2)
+    metrics.record("api.example.com", 0.5, None)
+
+    stats = metrics.summary()["api.example.com"]
+    latency = stats["latency_ms"]
+    assert stats["count"] == 102
+    assert 40 <= latency["p50"] <= 60
+    assert 85 <= latency["p95"] <= 110
+    assert latency["p95"] <= latency["p99"] <= latency["max"] == 2000.0
+    assert stats["status"] == {"2xx": 100, "5xx": 1, "error": 1}
+    assert stats["retries"] == 2
+    assert stats["bytes_received"] == 1000
+
+
+def test_request_metrics_fixed_memory():
+    """Old slots roll out of the window and the number of hosts is capped."""
+    metrics = http_request.RequestMetrics(window=60, slots=6, max_hosts=2)
+
+    with patch("strands_tools.http_request.time.monotonic", return_value=1000.0):
+        metrics.record("a.example.com", 0.1, 200)
+        metrics.record("b.example.com", 0.1, 200)
+        metrics.record("c.example.com", 0.1, 200)
+        assert metrics.hosts() == ["b.example.com", "c.example.com"]
+        assert metrics.summary("b.example.com")["b.example.com"]["count"] == 1
+
+    with patch("strands_tools.http_request.time.monotonic", return_value=1100.0):
+        assert metrics.summary() == {}
+        metrics.record("b.example.com", 0.2, 200)
+        assert metrics.summary()["b.example.com"]["count"] == 1
+
+
+def test_metrics_action():
+    """The metrics action reports recorded hosts without sending a request."""
+    http_request.REQUEST_METRICS.clear()
+    http_request.REQUEST_METRICS.record("api.example.com", 0.05, 200)
+    http_request.REQUEST_METRICS.record("other.example.com", 0.05, 404)
+
+    with patch("requests.Session.request") as mock_request:
+        result = http_request.http_request(
+            tool={"toolUseId": "metrics-id", "input": {"action": "metrics", "url": "https://api.example.com/x"}}
+        )
+
+    assert not mock_request.called
+    assert result["status"] == "success"
+    result_text = extract_result_text(result)
+    assert "api.example.com" in result_text
+    assert "other.example.com" not in result_text
+    assert "p95" in result_text
+    assert "Session pool:" in result_text
+    http_request.REQUEST_METRICS.clear()
+
+
+def test_missing_method_and_url():
+    """A request without method or url returns an error."""
+    result = http_request.http_request(tool={"toolUseId": "missing-id", "input": {}})
+    assert result["status"] == "error"
+    assert "method and url are required" in extract_result_text(result)
 
 
 @responses.activate
@@ -1092,3 +1279,534 @@ def test_proxy_support():
     assert result["status"] == "success"
     result_text = extract_result_text(result)
     assert "Status Code: 200" in result_text
+
+
+@pytest.fixture
+def response_cache_dir(tmp_path, monkeypatch):
+    """Point the response cache at a temporary directory."""
+    monkeypatch.setenv("HTTP_REQUEST_CACHE_DIR", str(tmp_path / "http_cache"))
+    return tmp_path / "http_cache"
+
+
+def cached_get(url, **extra):
+    return http_request.http_request(
+        tool={"toolUseId": "cache-id", "input": {"method": "GET", "url": url, "cache": True, **extra}}
+    )
+
+
+@responses.activate
+def test_response_cache_fresh_hit_skips_network(response_cache_dir):
+    """A fresh cached response is served without contacting the origin."""
+    responses.add(
+        responses.GET,
+        "https://docs.example.com/page",
+        body="cached page",
+        status=200,
+        headers={"Cache-Control": "max-age=60"},
+    )
+
+    first = cached_get("https://docs.example.com/page")
+    second = cached_get("https://docs.example.com/page")
+
+    assert len(responses.calls) == 1
+    assert "Cache: stored" in extract_result_text(first)
+    second_text = extract_result_text(second)
+    assert "Cache: hit" in second_text
+    assert "Body: cached page" in second_text
+
+    # Requests without the cache option always go to the network
+    http_request.http_request(
+        tool={"toolUseId": "id", "input": {"method": "GET", "url": "https://docs.example.com/page"}}
+    )
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_response_cache_revalidates_with_etag(response_cache_dir):
+    """Stale entries are revalidated with If-None-Match and a 304 reuses the stored body."""
+    responses.add(
+        responses.GET,
+        "https://api.example.com/items",
+        body="item list",
+        status=200,
+        headers={"Cache-Control": "no-cache", "ETag": '"v1"'},
+    )
+
+    def not_modified(request):
+        assert request.headers["If-None-Match"] == '"v1"'
+        return (304, {"Cache-Control": "max-age=60"}, "")
+
+    cached_get("https://api.example.com/items")
+    responses.remove(responses.GET, "https://api.example.com/items")
+    responses.add_callback(responses.GET, "https://api.example.com/items", callback=not_modified)
+
+    revalidated = cached_get("https://api.example.com/items")
+    revalidated_text = extract_result_text(revalidated)
+    assert "Cache: revalidated" in revalidated_text
+    assert "Status Code: 200" in revalidated_text
+    assert "Body: item list" in revalidated_text
+
+    # The 304 refreshed the entry with a new max-age, so the next call is a hit
+    assert "Cache: hit" in extract_result_text(cached_get("https://api.example.com/items"))
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_response_cache_respects_no_store_and_vary(response_cache_dir):
+    """no-store responses are never stored and Vary selects between stored responses."""
+    responses.add(
+        responses.GET,
+        "https://example.com/private",
+        body="secret",
+        headers={"Cache-Control": "no-store, max-age=60"},
+    )
+    responses.add(
+        responses.GET,
+        "https://example.com/negotiated",
+        body="english",
+        headers={"Cache-Control": "max-age=60", "Vary": "Accept-Language"},
+    )
+
+    assert "Cache: not cacheable" in extract_result_text(cached_get("https://example.com/private"))
+    cached_get("https://example.com/private")
+    assert len(responses.calls) == 2
+
+    cached_get("https://example.com/negotiated", headers={"Accept-Language": "en"})
+    assert "Cache: hit" in extract_result_text(
+        cached_get("https://example.com/negotiated", headers={"Accept-Language": "en"})
+    )
+    assert "Cache: hit" not in extract_result_text(
+        cached_get("https://example.com/negotiated", headers={"Accept-Language": "de"})
+    )
+    assert len(responses.calls) == 4
+
+
+def test_freshness_lifetime():
+    """Freshness comes from max-age, then Expires, then the Last-Modified heuristic."""
+    now = 1_700_000_000.0
+    date = email.utils.formatdate(now, usegmt=True)
+
+    assert http_request.freshness_lifetime({"Cache-Control": "public, max-age=120"}, now) == 120
+    assert http_request.freshness_lifetime({"Cache-Control": "no-cache, max-age=120"}, now) == 0
+    assert (
+        http_request.freshness_lifetime({"Date": date, "Expires": email.utils.formatdate(now + 300, usegmt=True)}, now)
+        == 300
+    )
+    assert http_request.freshness_lifetime({"Date": date, "Expires": "0"}, now) == 0
+    last_modified = email.utils.formatdate(now - 1000, usegmt=True)
+    assert http_request.freshness_lifetime({"Date": date, "Last-Modified": last_modified}, now) == 100
+    assert http_request.freshness_lifetime({}, now) == 0
+
+
+def test_response_cache_lru_eviction(tmp_path):
+    """The least recently used entries are evicted once the size limit is exceeded."""
+    cache = http_request.ResponseCache(tmp_path, max_bytes=5000)
+    entry = {"content": b"x" * 2000}
+
+    cache.set("a", entry)
+    cache.set("b", entry)
+    os.utime(tmp_path / "a.pkl", (1, 1))
+    os.utime(tmp_path / "b.pkl", (2, 2))
+    assert cache.get("a") == entry  # refreshes a
+    cache.set("c", entry)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == entry
+    assert cache.get("c") == entry
+
+    (tmp_path / "a.pkl").write_bytes(b"corrupt")
+    assert cache.get("a") is None
+    assert not (tmp_path / "a.pkl").exists()
+
+
+def test_response_cache_revalidation_does_not_grow_size(tmp_path):
+    """Rewriting an entry, as every 304 revalidation does, replaces its size instead of adding to it."""
+    cache = http_request.ResponseCache(tmp_path, max_bytes=5000)
+    entry = {"content": b"x" * 2000}
+    cache.set("a", entry)
+    cache.set("b", entry)
+
+    for _ in range(10):
+        cache.set("a", entry)
+
+    assert cache.get("b") == entry
+    assert cache._size == sum(path.stat().st_size for path in tmp_path.glob("*.pkl"))
+
+
+@responses.activate
+def test_save_to_streams_body_to_file(tmp_path, monkeypatch):
+    """save_to writes the body to disk and reports the byte count instead of the body."""
+    monkeypatch.setenv("BYPASS_TOOL_CONSENT", "true")
+    payload = b"\x00\x01binary" * 20000
+    responses.add(responses.GET, "https://example.com/artifact.bin", body=payload, status=200)
+    target = tmp_path / "downloads" / "artifact.bin"
+
+    http_request.REQUEST_METRICS.clear()
+    result = http_request.http_request(
+        tool={
+            "toolUseId": "save-id",
+            "input": {"method": "GET", "url": "https://example.com/artifact.bin", "save_to": str(target)},
+        }
+    )
+
+    assert result["status"] == "success"
+    assert target.read_bytes() == payload
+    result_text = extract_result_text(result)
+    assert f"Body: saved {len(payload):,} bytes to {target}" in result_text
+    assert "binary" not in result_text
+    assert responses.calls[0].request.req_kwargs["stream"] is True
+    assert http_request.get_request_metrics("example.com")["example.com"]["bytes_received"] == len(payload)
+
+
+@responses.activate
+def test_save_to_requires_consent(tmp_path, monkeypatch):
+    """Without BYPASS_TOOL_CONSENT, saving asks first and never overwrites an existing file."""
+    monkeypatch.delenv("BYPASS_TOOL_CONSENT", raising=False)
+    responses.add(responses.GET, "https://example.com/file", body=b"new", status=200)
+    target = tmp_path / "file.txt"
+    tool = {
+        "toolUseId": "save-id",
+        "input": {"method": "GET", "url": "https://example.com/file", "save_to": str(target)},
+    }
+
+    with patch("strands_tools.http_request.get_user_input", side_effect=["n", "not now"]):
+        result = http_request.http_request(tool=tool)
+    assert result["status"] == "error"
+    assert "cancelled by the user" in extract_result_text(result)
+    assert not target.exists()
+    assert not responses.calls
+
+    with patch("strands_tools.http_request.get_user_input", return_value="y"):
+        assert http_request.http_request(tool=tool)["status"] == "success"
+    assert target.read_bytes() == b"new"
+
+    target.write_bytes(b"keep")
+    with patch("strands_tools.http_request.get_user_input", return_value="y") as mock_input:
+        result = http_request.http_request(tool=tool)
+    assert result["status"] == "error"
+    assert "Refusing to overwrite" in extract_result_text(result)
+    mock_input.assert_not_called()
+    assert target.read_bytes() == b"keep"
+
+
+@responses.activate
+def test_max_bytes_truncates_body():
+    """max_bytes stops reading the body after the limit."""
+    responses.add(responses.GET, "https://example.com/large", body="a" * 200000, status=200)
+
+    result = http_request.http_request(
+        tool={
+            "toolUseId": "max-bytes-id",
+            "input": {"method": "GET", "url": "https://example.com/large", "max_bytes": 1000},
+        }
+    )
+
+    result_text = extract_result_text(result)
+    assert f"Body: {'a' * 1000}\n" in result_text
+    assert "a" * 1001 not in result_text
+    assert "Truncated: body cut off after max_bytes=1000 bytes" in result_text
+
+
+def test_stream_response_decodes_incrementally():
+    """Multi-byte characters split across chunks are decoded correctly and content is never buffered."""
+    encoded = "héllo wörld €".encode("utf-8")
+    response = MagicMock()
+    response.encoding = "utf-8"
+    response.iter_content.return_value = [encoded[:2], encoded[2:11], encoded[11:]]
+    type(response).content = property(lambda self: pytest.fail("response.content must not be read"))
+
+    streamed = http_request.stream_response(response)
+    assert streamed == {
+        "content": "héllo wörld €",
+        "bytes_received": len(encoded),
+        "truncated": False,
+        "saved_to": None,
+    }
+
+    truncated = http_request.stream_response(response, max_bytes=3)
+    assert truncated["content"] == "hé"
+    assert truncated["truncated"] is True
+    assert response.close.called
+
+
+def test_stream_response_defaults_to_utf8():
+    """Text without a declared charset is decoded as UTF-8, not requests' ISO-8859-1 default."""
+    encoded = "naïve €".encode("utf-8")
+    response = MagicMock()
+    response.encoding = "ISO-8859-1"
+    response.headers = {"Content-Type": "text/plain"}
+    response.iter_content.return_value = [encoded]
+    assert http_request.stream_response(response)["content"] == "naïve €"
+
+    response.headers = {"Content-Type": 'text/plain; charset="iso-8859-1"'}
+    response.iter_content.return_value = ["café".encode("latin-1")]
+    assert http_request.stream_response(response)["content"] == "café"
+
+
+class _BatchHandler(http.server.BaseHTTPRequestHandler):
+    """Local handler that sleeps for ?delay= seconds and echoes ?id=, tracking concurrency."""
+
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def do_GET(self):
+        query = dict(parse_qsl(urlsplit(self.path).query))
+        with self.lock:
+            type(self).active += 1
+            type(self).peak = max(type(self).peak, type(self).active)
+        try:
+            time.sleep(float(query.get("delay", 0)))
+            body = f"response {query.get('id', '')}".encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            with self.lock:
+                type(self).active -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def batch_server():
+    """Run a local HTTP server for batch tests."""
+    _BatchHandler.active = _BatchHandler.peak = 0
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _BatchHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_batch_requests_concurrent_and_ordered(batch_server):
+    """Batch requests run concurrently within the per-host limit and come back in input order."""
+    delays = [0.3, 0.1, 0.2, 0.0, 0.3, 0.1]
+    items = [{"url": f"{batch_server}/item?id={i}&delay={delay}"} for i, delay in enumerate(delays)]
+
+    start = time.time()
+    result = http_request.http_request(tool={"toolUseId": "batch-id", "input": {"requests": items, "max_per_host": 3}})
+    elapsed = time.time() - start
+
+    assert result["status"] == "success"
+    texts = [block["text"] for block in result["content"]]
+    assert texts[0].startswith("Batch: 6 requests, 6 completed, 0 failed")
+    for i, text in enumerate(texts[1:]):
+        assert text.startswith(f"[{i}] GET {batch_server}/item?id={i}&")
+        assert f"Body: response {i}" in text
+    assert _BatchHandler.peak <= 3
+    assert elapsed < sum(delays)
+
+
+def test_batch_request_timeout_and_errors(batch_server):
+    """A slow request times out without failing the rest of the batch."""
+    items = [
+        {"url": f"{batch_server}/slow?id=0&delay=2", "timeout": 0.2},
+        {"url": f"{batch_server}/fast?id=1"},
+        {"url": "http://127.0.0.1:1/unreachable"},
+    ]
+
+    result = http_request.http_request(tool={"toolUseId": "batch-id", "input": {"requests": items, "timeout": 5}})
+
+    assert result["status"] == "success"
+    texts = [block["text"] for block in result["content"]]
+    assert "1 completed, 2 failed" in texts[0]
+    assert "Error: Timed out after 0.2 seconds" in texts[1]
+    assert "Body: response 1" in texts[2]
+    assert "Error:" in texts[3]
+
+
+def test_batch_request_max_bytes_and_shared_headers(batch_server):
+    """Top-level settings apply to every batch item unless overridden."""
+    specs = [
+        http_request.prepare_batch_request(
+            {"headers": {"X-Shared": "1"}, "auth_type": "Bearer", "auth_token": "abc", "max_bytes": 4}, item
+        )
+        for item in ({"url": f"{batch_server}/a?id=0"}, {"url": f"{batch_server}/b?id=1", "max_bytes": None})
+    ]
+    assert specs[0]["headers"] == {"X-Shared": "1", "Authorization": "Bearer abc"}
+    assert specs[0]["method"] == "GET"
+
+    results = http_request.run_coroutine(http_request.run_batch_requests(specs))
+    assert results[0]["body"] == "resp"
+    assert results[0]["truncated"] is True
+    assert results[1]["body"] == "response 1"
+
+    with pytest.raises(ValueError, match="not supported in batch mode"):
+        http_request.prepare_batch_request({"auth_type": "digest"}, {"url": batch_server})
+
+
+def test_batch_modifying_requests_need_confirmation(monkeypatch):
+    """A batch with modifying requests asks for one confirmation and can be cancelled."""
+    monkeypatch.delenv("BYPASS_TOOL_CONSENT", raising=False)
+    items = [{"url": "https://example.com/a", "method": "DELETE"}, {"url": "https://example.com/b"}]
+
+    with (
+        patch("strands_tools.http_request.get_user_input", return_value="no thanks") as mock_input,
+        patch("strands_tools.http_request.run_batch_requests") as mock_run,
+    ):
+        result = http_request.http_request(tool={"toolUseId": "batch-id", "input": {"requests": items}})
+
+    assert mock_input.call_count == 1
+    assert not mock_run.called
+    assert result["status"] == "error"
+    assert "cancelled by the user" in extract_result_text(result)
+
+
+def test_token_bucket_reserve():
+    """Tokens refill at the configured rate and reservations report the wait."""
+    with patch("strands_tools.http_request.time.monotonic", return_value=100.0):
+        bucket = http_request.TokenBucket(rate=2, capacity=2)
+        assert bucket.reserve(max_wait=10) == 0
+        assert bucket.reserve(max_wait=10) == 0
+        assert bucket.reserve(max_wait=10) == pytest.approx(0.5)
+        assert bucket.reserve(max_wait=0.5) is None
+    with patch("strands_tools.http_request.time.monotonic", return_value=102.0):
+        assert bucket.reserve(max_wait=0) == 0
+
+
+def test_circuit_breaker_states():
+    """The breaker opens after consecutive failures and lets one trial through after the reset timeout."""
+    with patch("strands_tools.http_request.time.monotonic", return_value=0.0):
+        breaker = http_request.CircuitBreaker(failure_threshold=2, reset_timeout=10)
+        breaker.record(False)
+        breaker.record(True)
+        breaker.record(False)
+        assert breaker.state == "closed"
+        breaker.record(False)
+        assert breaker.state == "open"
+        assert breaker.allow() == pytest.approx(10)
+
+    with patch("strands_tools.http_request.time.monotonic", return_value=11.0):
+        assert breaker.allow() is None
+        assert breaker.state == "half_open"
+        assert breaker.allow() is not None  # only one trial at a time
+        breaker.record(False)
+        assert breaker.state == "open"
+
+    with patch("strands_tools.http_request.time.monotonic", return_value=22.0):
+        assert breaker.allow() is None
+        breaker.record(True)
+        assert breaker.state == "closed"
+        assert breaker.allow() is None
+
+
+@responses.activate
+def test_circuit_breaker_fails_fast_across_calls():
+    """Once a host's circuit opens, later calls fail without touching the network."""
+    http_request.HOST_LIMITER.configure("flaky.example.com", failure_threshold=2, reset_timeout=60)
+    responses.add(responses.GET, "https://flaky.example.com/api", status=503)
+    tool_use = {"toolUseId": "breaker-id", "input": {"method": "GET", "url": "https://flaky.example.com/api"}}
+
+    with patch("strands_tools.http_request.get_cached_session", return_value=requests.Session()):
+        http_request.http_request(tool=tool_use)
+        http_request.http_request(tool=tool_use)
+        result = http_request.http_request(tool=tool_use)
+
+    assert len(responses.calls) == 2
+    assert result["status"] == "error"
+    assert "Circuit open for flaky.example.com" in extract_result_text(result)
+    assert http_request.HOST_LIMITER.stats()["flaky.example.com"]["circuit"] == "open"
+
+    specs = [http_request.prepare_batch_request({}, {"url": "https://flaky.example.com/api"})]
+    batch_result = http_request.run_coroutine(http_request.run_batch_requests(specs))[0]
+    assert "Circuit open" in batch_result["error"]
+    http_request.HOST_LIMITER.configure("flaky.example.com")
+
+
+@responses.activate
+def test_rate_limit_waits_between_requests():
+    """Requests beyond the burst wait for the host's token bucket to refill."""
+    http_request.HOST_LIMITER.configure("slow.example.com", rate=1, burst=1)
+    responses.add(responses.GET, "https://slow.example.com/api", body="ok")
+    tool_use = {"toolUseId": "rate-id", "input": {"method": "GET", "url": "https://slow.example.com/api"}}
+
+    with patch("strands_tools.http_request.time.sleep") as mock_sleep:
+        http_request.http_request(tool=tool_use)
+        assert not mock_sleep.called
+        http_request.http_request(tool=tool_use)
+
+    assert mock_sleep.call_count == 1
+    assert 0.9 < mock_sleep.call_args[0][0] <= 1.0
+    assert len(responses.calls) == 2
+
+    with pytest.raises(http_request.RateLimitError):
+        http_request.HOST_LIMITER.acquire("slow.example.com", max_wait=0)
+    http_request.HOST_LIMITER.configure("slow.example.com")
+
+
+def test_aws_credentials_resolved_once():
+    """The credential chain is resolved once and reused until the cache TTL passes."""
+    frozen = MagicMock(access_key="AKID", secret_key="secret", token="token")
+    mock_session = MagicMock(region_name="us-west-2")
+    mock_session.get_credentials.return_value.get_frozen_credentials.return_value = frozen
+
+    with patch("boto3.Session", return_value=mock_session) as mock_boto_session:
+        with patch("strands_tools.http_request.time.monotonic", return_value=1000.0):
+            assert http_request.get_aws_credentials() == (frozen, "us-west-2")
+            assert http_request.get_aws_credentials() == (frozen, "us-west-2")
+        assert mock_boto_session.call_count == 1
+        assert mock_session.get_credentials.return_value.get_frozen_credentials.call_count == 2
+
+        with patch(
+            "strands_tools.http_request.time.monotonic",
+            return_value=1000.0 + http_request.CREDENTIALS_CACHE_TTL + 1,
+        ):
+            http_request.get_aws_credentials()
+        assert mock_boto_session.call_count == 2
+
+
+def test_sigv4_signer_cached_per_credentials():
+    """SigV4 signers are reused for the same credentials and rebuilt after a refresh."""
+    first = MagicMock(access_key="AKID", secret_key="secret", token="token-1")
+    refreshed = MagicMock(access_key="AKID", secret_key="secret", token="token-2")
+    config = {"service": "execute-api", "region": "us-east-1"}
+
+    with patch("strands_tools.http_request.get_aws_credentials", return_value=(first, "us-east-1")):
+        signer = http_request.handle_aws_sigv4(config, "https://abc.execute-api.us-east-1.amazonaws.com/prod")
+        assert http_request.handle_aws_sigv4(config, "https://abc.execute-api.us-east-1.amazonaws.com/other") is signer
+
+    with patch("strands_tools.http_request.get_aws_credentials", return_value=(refreshed, "us-east-1")):
+        renewed = http_request.handle_aws_sigv4(config, "https://abc.execute-api.us-east-1.amazonaws.com/prod")
+    assert renewed is not signer
+    assert renewed.aws_token == "token-2"
+
+
+def test_jwt_cached_until_near_expiry():
+    """JWTs are reused until less than the refresh fraction of their lifetime remains."""
+    config = {"secret": "s3cret", "algorithm": "HS256", "expiry": 3600}
+    now = time.time()
+
+    with patch("jwt.encode", side_effect=["token-1", "token-2", "token-3"]) as mock_encode:
+        with patch("strands_tools.http_request.time.time", return_value=now):
+            assert http_request.handle_jwt(config) == {"Authorization": "Bearer token-1"}
+        with patch("strands_tools.http_request.time.time", return_value=now + 3000):
+            assert http_request.handle_jwt(config) == {"Authorization": "Bearer token-1"}
+        with patch("strands_tools.http_request.time.time", return_value=now + 3300):
+            assert http_request.handle_jwt(config) == {"Authorization": "Bearer token-2"}
+        assert http_request.handle_jwt({**config, "secret": "other"}) == {"Authorization": "Bearer token-3"}
+
+    assert mock_encode.call_count == 3
+
+
+def test_extract_content_from_html_budget_and_boilerplate():
+    """Markdown conversion drops page chrome and respects the character budget."""
+    html = (
+        "<html><body><nav><a href='/'>Home</a></nav><main><h1>Guide</h1>"
+        f"<p>{'word ' * 200}</p></main><footer>Copyright</footer></body></html>"
+    )
+
+    markdown = http_request.extract_content_from_html(html)
+    assert markdown.startswith("# Guide")
+    assert "Home" not in markdown
+    assert "Copyright" not in markdown
+
+    truncated = http_request.extract_content_from_html(html, max_chars=100)
+    assert "[... truncated" in truncated
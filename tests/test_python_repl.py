@@ -6,7 +6,7 @@ import tempfile
 import threading
 import time
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import dill
 import pytest
@@ -76,6 +76,144 @@ class TestOutputCapture:
         assert "Standard error" in output
 
 
+class TestCappedOutput:
+    """Test the CappedOutput class."""
+
+    def test_under_cap_keeps_everything(self):
+        """Test that output under the cap is returned unchanged."""
+        buffer = python_repl.CappedOutput(max_bytes=100)
+        buffer.write("hello ")
+        buffer.write("world")
+
+        assert buffer.getvalue() == "hello world"
+        assert buffer.spill_path is None
+
+    def test_over_cap_elides_middle_and_spills(self):
+        """Test that the head and tail are kept and the full output is spilled to disk."""
+        buffer = python_repl.CappedOutput(max_bytes=20)
+        for i in range(1000):
+            buffer.write(f"{i}\n")
+
+        value = buffer.getvalue()
+        assert value.startswith("0\n1\n2\n")
+        assert value.endswith("998\n999\n")
+        assert "bytes elided" in value
+        assert buffer.spill_path in value
+
+        with open(buffer.spill_path) as f:
+            assert f.read() == "".join(f"{i}\n" for i in range(1000))
+
+        buffer.close()
+        assert not os.path.exists(buffer.spill_path)
+
+    def test_spill_files_kept_until_next_turn(self):
+        """Test that retained outputs are closed, deleting their spill files, when their owner starts another turn."""
+        owner = MagicMock()
+        first = python_repl.CappedOutput(max_bytes=10)
+        first.write("x" * 100)
+        quiet = python_repl.CappedOutput(max_bytes=10)
+
+        python_repl.retain_output(owner, 1, first, quiet)
+        assert os.path.exists(first.spill_path)
+        assert quiet.closed
+
+        # A second call in the same turn keeps the first call's files
+        second = python_repl.CappedOutput(max_bytes=10)
+        second.write("y" * 100)
+        python_repl.release_outputs(owner, 1)
+        python_repl.retain_output(owner, 1, second)
+        assert os.path.exists(first.spill_path)
+
+        python_repl.release_outputs(owner, 2)
+        assert first.closed
+        assert not os.path.exists(first.spill_path)
+        assert not os.path.exists(second.spill_path)
+
+    def test_owners_do_not_release_each_other(self):
+        """Test that a cell of one agent does not delete the spill files returned to another."""
+        first_agent, second_agent = MagicMock(), MagicMock()
+        first = python_repl.CappedOutput(max_bytes=10)
+        first.write("x" * 100)
+        python_repl.retain_output(first_agent, 1, first)
+
+        second = python_repl.CappedOutput(max_bytes=10)
+        second.write("y" * 100)
+        python_repl.release_outputs(second_agent, 5)
+        python_repl.retain_output(second_agent, 5, second)
+        assert os.path.exists(first.spill_path)
+
+        python_repl.release_outputs()
+        assert not os.path.exists(first.spill_path)
+        assert not os.path.exists(second.spill_path)
+
+    def test_cap_from_env(self):
+        """Test that the cap defaults to PYTHON_REPL_MAX_OUTPUT_BYTES."""
+        with patch.dict(os.environ, {"PYTHON_REPL_MAX_OUTPUT_BYTES": "1234"}):
+            assert python_repl.CappedOutput().max_bytes == 1234
+
+    def test_write_after_close(self):
+        """Test that writing to a closed buffer raises like other streams."""
+        buffer = python_repl.CappedOutput(max_bytes=10)
+        buffer.close()
+        with pytest.raises(ValueError):
+            buffer.write("late")
+
+    def test_output_capture_is_capped(self):
+        """Test that OutputCapture applies the cap to captured stdout."""
+        with patch.dict(os.environ, {"PYTHON_REPL_MAX_OUTPUT_BYTES": "64"}):
+            capture = python_repl.OutputCapture()
+        with capture:
+            for i in range(500):
+                print(f"row {i}")
+
+        output = capture.get_output()
+        assert "row 0" in output
+        assert "row 499" in output
+        assert "row 250" not in output
+        assert len(output) < 300
+        capture.stdout.close()
+        capture.stderr.close()
+
+
+class TestCellProfiler:
+    """Test the CellProfiler class."""
+
+    def test_cpu_profile_lists_hot_functions(self):
+        """Test that cpu mode reports the functions that ran."""
+        profiler = python_repl.CellProfiler("cpu", top_n=5)
+        with profiler:
+            exec("def slow_function():\n    return sum(i * i for i in range(10000))\nslow_function()", {})
+
+        report = profiler.get_report()
+        assert "CPU profile (top 5 functions" in report
+        assert "slow_function" in report
+
+    def test_memory_profile_lists_allocation_sites(self):
+        """Test that memory mode reports allocation sites."""
+        namespace = {}
+        profiler = python_repl.CellProfiler("memory", top_n=3)
+        with profiler:
+            exec("data = [str(i) for i in range(10000)]", namespace)
+
+        report = profiler.get_report()
+        assert "Memory profile (top 3 allocation sites" in report
+        assert "<string>:1" in report
+
+    def test_memory_profile_stops_tracing(self):
+        """Test that tracemalloc is stopped when the profiler started it."""
+        import tracemalloc
+
+        assert not tracemalloc.is_tracing()
+        with python_repl.CellProfiler("memory"):
+            assert tracemalloc.is_tracing()
+        assert not tracemalloc.is_tracing()
+
+    def test_invalid_mode(self):
+        """Test that an unknown profile mode is rejected."""
+        with pytest.raises(ValueError, match="Unsupported profile mode"):
+            python_repl.CellProfiler("disk")
+
+
 class TestReplState:
     """Test the ReplState class."""
 
@@ -270,6 +408,31 @@ class TestPythonRepl:
         # Verify the code was actually executed
         assert python_repl.repl_state.get_namespace()["result"] == 4
 
+    def test_spill_file_kept_for_calling_agent(self, mock_console):
+        """Test that a spill file returned to an agent survives until that agent's next turn."""
+        agent = MagicMock(messages=[{"role": "user"}])
+        tool_use = {
+            "toolUseId": "test-id",
+            "input": {"code": "print('z' * 500)", "interactive": False},
+        }
+
+        with patch.dict(os.environ, {"PYTHON_REPL_MAX_OUTPUT_BYTES": "64"}):
+            result = python_repl.python_repl(tool=tool_use, non_interactive_mode=True, agent=agent)
+            text = result["content"][0]["text"]
+            spill_path = text.split("saved to ")[1].split("]")[0]
+            assert os.path.exists(spill_path)
+
+            # Another call in the same turn, and calls without the agent, keep the file
+            python_repl.python_repl(tool=tool_use, non_interactive_mode=True, agent=agent)
+            python_repl.python_repl(tool=tool_use, non_interactive_mode=True)
+            assert os.path.exists(spill_path)
+
+            agent.messages.append({"role": "assistant"})
+            python_repl.python_repl(tool=tool_use, non_interactive_mode=True, agent=agent)
+            assert not os.path.exists(spill_path)
+
+        python_repl.release_outputs()
+
     def test_syntax_error(self, mock_console):
         """Test handling of syntax errors."""
         tool_use = {
@@ -441,6 +604,61 @@ class TestPythonRepl:
             assert "RecursionError" in result["content"][0]["text"]
             assert "reset_state=True" in result["content"][0]["text"]
 
+    def test_profile_standard_mode(self, mock_console):
+        """Test that the profile report is returned next to the output."""
+        tool_use = {
+            "toolUseId": "test-id",
+            "input": {
+                "code": "def profiled_function():\n    return sorted(range(1000))\nprint(len(profiled_function()))",
+                "interactive": False,
+                "profile": "cpu",
+            },
+        }
+
+        result = python_repl.python_repl(tool=tool_use, non_interactive_mode=True)
+
+        assert result["status"] == "success"
+        assert "1000" in result["content"][0]["text"]
+        assert "CPU profile" in result["content"][1]["text"]
+        assert "profiled_function" in result["content"][1]["text"]
+
+    def test_profile_invalid_mode(self, mock_console):
+        """Test that an unknown profile mode returns an error without running the code."""
+        tool_use = {
+            "toolUseId": "test-id",
+            "input": {"code": "profile_should_not_run = True", "interactive": False, "profile": "disk"},
+        }
+
+        result = python_repl.python_repl(tool=tool_use, non_interactive_mode=True)
+
+        assert result["status"] == "error"
+        assert "Unsupported profile mode" in result["content"][0]["text"]
+        assert "profile_should_not_run" not in python_repl.repl_state.get_namespace()
+
+    def test_profile_invalid_top_n(self, mock_console):
+        """Test that a non-integer profile_top_n is reported as a tool error."""
+        tool_use = {
+            "toolUseId": "test-id",
+            "input": {"code": "print('hi')", "interactive": False, "profile": "cpu", "profile_top_n": "many"},
+        }
+
+        result = python_repl.python_repl(tool=tool_use, non_interactive_mode=True)
+
+        assert result["status"] == "error"
+        assert "invalid literal for int()" in result["content"][0]["text"]
+
+    def test_profile_top_n_env_overrides_input(self, mock_console):
+        """Test that PYTHON_REPL_PROFILE_TOP_N takes precedence over the tool input."""
+        tool_use = {
+            "toolUseId": "test-id",
+            "input": {"code": "x = 1", "interactive": False, "profile": "cpu", "profile_top_n": 50},
+        }
+
+        with patch.dict(os.environ, {"PYTHON_REPL_PROFILE_TOP_N": "3"}):
+            result = python_repl.python_repl(tool=tool_use, non_interactive_mode=True)
+
+        assert "CPU profile (top 3 functions" in result["content"][1]["text"]
+
     def test_interactive_mode(self, mock_console):
         """Test interactive mode with PTY simulation."""
         tool_use = {
@@ -686,13 +904,26 @@ class TestPtyManager:
             # Just verify no exceptions occurred
             # Input handling is difficult to test due to stdin interaction
 
+    def test_profile_report_from_child(self):
+        """Test that the child process hands its profile report back to the parent."""
+        pty_mgr = python_repl.PtyManager(profiler=python_repl.CellProfiler("cpu", top_n=5))
+        pty_mgr.start("def child_function():\n    return sum(range(1000))\nchild_function()")
+        os.waitpid(pty_mgr.pid, 0)
+        pty_mgr.pid = -1
+
+        profile_file = pty_mgr.profile_file
+        assert "child_function" in pty_mgr.get_profile_report()
+
+        pty_mgr.stop()
+        assert not os.path.exists(profile_file)
+
     def test_get_output_binary_truncation(self):
         """Test that binary content is truncated in get_output."""
         pty_mgr = python_repl.PtyManager()
 
         # Add binary-looking content to the output buffer
         binary_content = "\\x00\\x01" * 100  # Long binary content
-        pty_mgr.output_buffer = [binary_content]
+        pty_mgr.output_capture.write(binary_content)
 
         output = pty_mgr.get_output()
 
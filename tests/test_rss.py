@@ -91,6 +91,7 @@ class TestRSSManager:
         html = "<p>Test <strong>content</strong> with <a href='https://example.com'>link</a></p>"
         result = manager.clean_html(html)
         assert "Test **content** with [link](https://example.com)" in result
+        assert manager.clean_html("<p>Photo</p><img src='https://example.com/a.png' alt='a'>") == "Photo"
 
         # Test format_entry with different entry structures
         with patch.object(manager, "clean_html", side_effect=lambda x: x):  # Simplify clean_html for testing
@@ -4,7 +4,10 @@ Tests for the workflow tool using the Agent interface.
 
 import json
 import tempfile
+import threading
+import time
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -19,6 +22,10 @@ def reset_workflow_manager():
     """Reset the global workflow manager before each test to ensure clean state."""
     # Reset global manager before each test
     workflow_module._manager = None
+    # The manager class is a singleton, so drop agents pooled by earlier tests
+    instance = workflow_module.WorkflowManager._instance
+    if instance is not None and hasattr(instance, "agent_pool"):
+        instance.agent_pool.clear()
     yield
     # Cleanup after test
     if hasattr(workflow_module, "_manager") and workflow_module._manager:
@@ -122,6 +129,46 @@ def mock_agent_result():
     return result
 
 
+@pytest.fixture
+def manager(mock_workflow_dir):
+    """Create a fresh WorkflowManager persisting to a temporary directory."""
+    with (
+        patch.object(workflow_module, "WORKFLOW_DIR", Path(mock_workflow_dir)),
+        patch.object(workflow_module.WorkflowManager, "_instance", None),
+        patch.object(workflow_module.WorkflowManager, "_workflows", {}),
+        patch.object(workflow_module.WorkflowManager, "_journal_events", {}),
+        patch.object(workflow_module.WorkflowManager, "_own_writes", {}),
+        patch.object(workflow_module.WorkflowManager, "_start_file_watching"),
+    ):
+        manager = workflow_module.WorkflowManager()
+        manager.task_executor = workflow_module.TaskExecutor(max_workers=2)
+        yield manager
+        manager.task_executor.shutdown()
+
+
+def run_workflow(manager, tasks, outcomes=None, workflow_id="wf"):
+    """Create and start a workflow whose tasks succeed unless listed in outcomes."""
+    executed = []
+
+    def execute_task(task, workflow, start_delay=0.0):
+        executed.append(task["task_id"])
+        for dep_id in task["dependencies"]:
+            assert workflow["task_results"][dep_id]["status"] == "completed"
+        status = (outcomes or {}).get(task["task_id"], "success")
+        return {"status": status, "content": [{"text": f"{task['task_id']} done"}]}
+
+    manager.create_workflow(workflow_id, tasks)
+    with (
+        patch.object(manager, "execute_task", side_effect=execute_task),
+        patch.object(workflow_module.time, "sleep") as mock_sleep,
+        patch.object(manager, "get_ready_tasks") as mock_ready,
+    ):
+        result = manager.start_workflow(workflow_id)
+    mock_sleep.assert_not_called()
+    mock_ready.assert_not_called()
+    return result, executed, manager.get_workflow(workflow_id)
+
+
 class TestWorkflowCreation:
     """Test workflow creation functionality."""
 
@@ -223,7 +270,7 @@ class TestWorkflowExecution:
 
             result = workflow_module.workflow(action="start", workflow_id="test_workflow", agent=mock_parent_agent)
 
-            mock_manager.start_workflow.assert_called_once_with("test_workflow")
+            mock_manager.start_workflow.assert_called_once_with("test_workflow", cache=None)
             assert result["status"] == "success"
             assert "completed successfully" in result["content"][0]["text"]
 
@@ -573,6 +620,1019 @@ class TestWorkflowManager:
         assert ready_tasks[0]["task_id"] == "task2"
 
 
+class TestWorkflowScheduling:
+    """Test the dependency-counting scheduler in start_workflow."""
+
+    def test_runs_dependencies_before_dependents(self, manager):
+        tasks = [
+            {"task_id": "report", "description": "r", "dependencies": ["analysis", "charts"], "priority": 5},
+            {"task_id": "analysis", "description": "a", "dependencies": ["collect"], "priority": 1},
+            {"task_id": "charts", "description": "c", "dependencies": ["collect"]},
+            {"task_id": "collect", "description": "d"},
+        ]
+
+        result, executed, workflow = run_workflow(manager, tasks)
+
+        assert result["status"] == "success"
+        assert "4/4 tasks succeeded" in result["content"][0]["text"]
+        assert executed[0] == "collect"
+        assert executed[-1] == "report"
+        assert all(r["status"] == "completed" for r in workflow["task_results"].values())
+        assert workflow["task_results"]["report"]["result"] == [{"text": "report done"}]
+
+    def test_ready_tasks_run_by_priority(self, manager):
+        manager.task_executor = workflow_module.TaskExecutor(max_workers=1)
+        tasks = [
+            {"task_id": "low", "description": "l", "priority": 1},
+            {"task_id": "high", "description": "h", "priority": 5},
+            {"task_id": "mid_a", "description": "m", "priority": 3},
+            {"task_id": "mid_b", "description": "m", "priority": 3},
+        ]
+
+        _, executed, _ = run_workflow(manager, tasks)
+
+        assert executed == ["high", "mid_a", "mid_b", "low"]
+
+    def test_failed_task_skips_dependents(self, manager):
+        tasks = [
+            {"task_id": "a", "description": "a"},
+            {"task_id": "b", "description": "b", "dependencies": ["a"]},
+            {"task_id": "c", "description": "c", "dependencies": ["b"]},
+            {"task_id": "d", "description": "d"},
+        ]
+
+        result, executed, workflow = run_workflow(manager, tasks, outcomes={"a": "error"})
+
+        assert sorted(executed) == ["a", "d"]
+        assert "1/4 tasks succeeded" in result["content"][0]["text"]
+        statuses = {task_id: r["status"] for task_id, r in workflow["task_results"].items()}
+        assert statuses == {"a": "error", "b": "skipped", "c": "skipped", "d": "completed"}
+        assert "Dependency 'a' did not complete" in workflow["task_results"]["c"]["result"][0]["text"]
+
+    def test_dependency_cycle_does_not_hang(self, manager):
+        tasks = [
+            {"task_id": "a", "description": "a", "dependencies": ["b"]},
+            {"task_id": "b", "description": "b", "dependencies": ["a"]},
+            {"task_id": "c", "description": "c"},
+        ]
+
+        _, executed, workflow = run_workflow(manager, tasks)
+
+        assert executed == ["c"]
+        assert workflow["task_results"]["a"]["status"] == "skipped"
+        assert workflow["task_results"]["b"]["status"] == "skipped"
+
+    def test_dependency_graph_skips_completed_tasks(self, manager):
+        tasks = [
+            {"task_id": "a", "description": "a"},
+            {"task_id": "b", "description": "b", "dependencies": ["a"]},
+        ]
+        run_workflow(manager, tasks, outcomes={"b": "error"})
+        workflow = manager.get_workflow("wf")
+        workflow["task_results"]["b"]["status"] = "pending"
+
+        indegree, dependents = manager.build_dependency_graph(workflow)
+
+        assert indegree == {"b": 0}
+        assert dependents == {}
+
+    def test_large_fan_out(self, manager):
+        manager.task_executor = workflow_module.TaskExecutor(max_workers=8)
+        tasks = [{"task_id": "root", "description": "root"}]
+        tasks += [{"task_id": f"t{i}", "description": "leaf", "dependencies": ["root"]} for i in range(500)]
+        tasks.append({"task_id": "sink", "description": "sink", "dependencies": [f"t{i}" for i in range(500)]})
+
+        result, executed, _ = run_workflow(manager, tasks)
+
+        assert "502/502 tasks succeeded" in result["content"][0]["text"]
+        assert executed[0] == "root" and executed[-1] == "sink"
+
+
+class TestAdaptiveConcurrency:
+    """Test AIMD concurrency control in TaskExecutor."""
+
+    @pytest.fixture
+    def executor(self):
+        executor = workflow_module.TaskExecutor(min_workers=2, max_workers=8, cpu_threshold=80)
+        with (
+            patch.object(workflow_module, "cpu_load_percent", return_value=10.0) as mock_load,
+            patch.object(workflow_module.time, "monotonic", return_value=1000.0) as mock_clock,
+        ):
+            executor.mock_load = mock_load
+            executor.mock_clock = mock_clock
+            yield executor
+        executor.shutdown()
+
+    def test_slow_start_grows_per_success_up_to_max(self, executor):
+        assert executor.concurrency == 2
+        for _ in range(3):
+            executor.record_success()
+        assert executor.concurrency == 5
+        for _ in range(10):
+            executor.record_success()
+        assert executor.concurrency == 8
+
+    def test_throttle_halves_then_grows_additively(self, executor):
+        for _ in range(6):
+            executor.record_success()
+        assert executor.concurrency == 8
+
+        executor.record_throttle()
+        assert executor.concurrency == 4
+
+        # One step per full round of successful tasks
+        for _ in range(3):
+            executor.record_success()
+        assert executor.concurrency == 4
+        executor.record_success()
+        assert executor.concurrency == 5
+
+    def test_scale_down_cooldown_and_floor(self, executor):
+        executor.concurrency = 8
+        executor.record_throttle()
+        executor.record_throttle()
+        assert executor.concurrency == 4
+
+        for offset in (10, 20, 30):
+            executor.mock_clock.return_value = 1000.0 + offset
+            executor.record_throttle()
+        assert executor.concurrency == 2
+
+    def test_cpu_overload_scales_down(self, executor):
+        executor.concurrency = 6
+        executor.mock_load.return_value = 95.0
+
+        executor.record_success()
+
+        assert executor.concurrency == 3
+
+    def test_bounds_are_normalized(self):
+        executor = workflow_module.TaskExecutor(min_workers=10, max_workers=4)
+        assert (executor.min_workers, executor.concurrency, executor.max_workers) == (4, 4, 4)
+        executor.shutdown()
+
+    def test_scheduler_respects_concurrency_limit(self, manager):
+        manager.task_executor = workflow_module.TaskExecutor(min_workers=1, max_workers=4)
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def execute_task(task, workflow, start_delay=0.0):
+            with lock:
+                in_flight.append(task["task_id"])
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.remove(task["task_id"])
+            return {"status": "success", "content": [{"text": "ok"}]}
+
+        manager.create_workflow("wf", [{"task_id": f"t{i}", "description": "t"} for i in range(12)])
+        with (
+            patch.object(workflow_module, "cpu_load_percent", return_value=None),
+            patch.object(manager, "execute_task", side_effect=execute_task),
+        ):
+            manager.start_workflow("wf")
+
+        assert peak[0] == 1
+        assert max(peak) <= 4
+        assert manager.task_executor.concurrency == 4
+
+    def test_is_throttling_error(self):
+        assert workflow_module.is_throttling_error(Exception("ThrottlingException: Rate exceeded"))
+        assert workflow_module.is_throttling_error(Exception("429 Too Many Requests"))
+        assert not workflow_module.is_throttling_error(ValueError("invalid prompt"))
+
+
+class TestModelRateLimiter:
+    """Test per-model request and token rate limiting."""
+
+    @pytest.fixture
+    def clock(self):
+        with (
+            patch.object(workflow_module.time, "monotonic", return_value=100.0) as mock_clock,
+            patch.object(workflow_module.time, "sleep") as mock_sleep,
+        ):
+            mock_clock.sleep = mock_sleep
+            yield mock_clock
+
+    def test_requests_per_minute(self, clock):
+        limiter = workflow_module.ModelRateLimiter(rpm=60, tpm=0, overrides={})
+
+        waits = [limiter.acquire("bedrock", "m1", 10) for _ in range(61)]
+
+        assert waits[:60] == [0.0] * 60
+        assert waits[60] == pytest.approx(1.0)
+        clock.sleep.assert_called_once_with(pytest.approx(1.0))
+
+    def test_tokens_per_minute(self, clock):
+        limiter = workflow_module.ModelRateLimiter(rpm=0, tpm=6000, overrides={})
+
+        assert limiter.acquire("bedrock", "m1", 6000) == 0.0
+        assert limiter.acquire("bedrock", "m1", 600) == pytest.approx(6.0)
+        # Requests larger than a minute's budget wait for a full bucket instead of forever
+        clock.return_value = 1000.0
+        assert limiter.acquire("bedrock", "m1", 50000) == 0.0
+
+    def test_models_do_not_share_buckets(self, clock):
+        limiter = workflow_module.ModelRateLimiter(rpm=1, tpm=0, overrides={})
+
+        assert limiter.acquire("bedrock", "m1", 1) == 0.0
+        assert limiter.acquire("bedrock", "m2", 1) == 0.0
+        assert limiter.acquire("anthropic", "m1", 1) == 0.0
+        assert limiter.acquire("bedrock", "m1", 1) == pytest.approx(60.0)
+
+    def test_overrides(self):
+        limiter = workflow_module.ModelRateLimiter(
+            rpm=600,
+            tpm=0,
+            overrides={"bedrock": {"rpm": 100, "tpm": 1000}, "bedrock:us.model-v1:0": {"tpm": 5000}},
+        )
+
+        assert limiter.limits("bedrock", "us.model-v1:0") == (100, 5000)
+        assert limiter.limits("bedrock", "other") == (100, 1000)
+        assert limiter.limits("ollama", "qwen") == (600, 0)
+
+    def test_settle_corrects_estimate(self, clock):
+        limiter = workflow_module.ModelRateLimiter(rpm=0, tpm=6000, overrides={})
+
+        limiter.acquire("bedrock", "m1", 6000)
+        limiter.settle("bedrock", "m1", estimated=6000, actual=600)
+
+        assert limiter.acquire("bedrock", "m1", 5400) == 0.0
+
+    def test_execute_task_reserves_for_task_model(self, mock_parent_agent):
+        with (
+            patch("strands_tools.workflow.Agent") as mock_agent_class,
+            patch("strands_tools.workflow.create_model"),
+            patch.object(workflow_module, "MODEL_RATE_LIMITER") as mock_limiter,
+            patch.object(workflow_module.time, "sleep"),
+        ):
+            metrics = MagicMock(accumulated_usage={"totalTokens": 42})
+            mock_agent_class.return_value.return_value = AgentResult(
+                message={"content": [{"text": "done"}]}, stop_reason="end_turn", metrics=metrics, state=MagicMock()
+            )
+            manager = workflow_module.WorkflowManager(mock_parent_agent)
+            task = {
+                "task_id": "t",
+                "description": "x" * 400,
+                "model_provider": "bedrock",
+                "model_settings": {"model_id": "m1", "params": {"max_tokens": 500}},
+            }
+
+            with patch.object(workflow_module, "metrics_to_string", return_value=""):
+                manager.execute_task(task, {"task_results": {}})
+
+        mock_limiter.acquire.assert_called_once_with("bedrock", "m1", 101 + 1 + 500)
+        mock_limiter.settle.assert_called_once_with("bedrock", "m1", 602, 42)
+
+
+class TestTaskAgentPool:
+    """Test reuse of task agents and models."""
+
+    def test_release_resets_and_reuses(self):
+        pool = workflow_module.TaskAgentPool(max_size=4)
+        agent = SimpleNamespace(messages=[{"role": "user"}], state="old", event_loop_metrics="old")
+
+        assert pool.acquire("key") is None
+        pool.release("key", agent)
+        reused = pool.acquire("key")
+
+        assert reused is agent
+        assert agent.messages == []
+        assert isinstance(agent.state, workflow_module.AgentState)
+        assert isinstance(agent.event_loop_metrics, workflow_module.EventLoopMetrics)
+        assert pool.acquire("key") is None
+        assert pool.stats() == {"idle": 0, "models": 0, "hits": 1, "misses": 2}
+
+    def test_evicts_least_recently_used(self):
+        pool = workflow_module.TaskAgentPool(max_size=2)
+        agents = [SimpleNamespace(messages=[]) for _ in range(3)]
+
+        pool.release("a", agents[0])
+        pool.release("b", agents[1])
+        pool.release("c", agents[2])
+
+        assert pool.acquire("a") is None
+        assert pool.acquire("b") is agents[1]
+        assert pool.acquire("c") is agents[2]
+
+    def test_models_are_shared(self):
+        pool = workflow_module.TaskAgentPool()
+        factory = MagicMock(side_effect=lambda: object())
+
+        first = pool.get_model(("bedrock", "x"), factory)
+        second = pool.get_model(("bedrock", "x"), factory)
+        other = pool.get_model(("bedrock", "y"), factory)
+
+        assert first is second
+        assert other is not first
+        assert factory.call_count == 2
+
+    def test_execute_task_reuses_agents_per_configuration(self, mock_parent_agent):
+        with (
+            patch("strands_tools.workflow.Agent") as mock_agent_class,
+            patch("strands_tools.workflow.create_model") as mock_create_model,
+            patch.object(workflow_module.time, "sleep"),
+        ):
+            mock_agent_class.side_effect = lambda **kwargs: MagicMock(
+                return_value=AgentResult(
+                    message={"content": [{"text": "done"}]}, stop_reason="end_turn", metrics=None, state={}
+                )
+            )
+            manager = workflow_module.WorkflowManager(mock_parent_agent)
+            base = {"description": "d", "tools": ["calculator"], "model_provider": "bedrock"}
+
+            for i in range(3):
+                manager.execute_task({**base, "task_id": f"t{i}", "model_settings": {"model_id": "m1"}}, {})
+            manager.execute_task(
+                {**base, "task_id": "p", "model_settings": {"model_id": "m1"}, "system_prompt": "x"}, {}
+            )
+            manager.execute_task({**base, "task_id": "m", "model_settings": {"model_id": "m2"}}, {})
+
+        assert mock_agent_class.call_count == 3
+        assert mock_create_model.call_count == 2
+
+    def test_failed_agent_is_not_pooled(self, mock_parent_agent):
+        with (
+            patch("strands_tools.workflow.Agent") as mock_agent_class,
+            patch.object(workflow_module.time, "sleep"),
+        ):
+            mock_agent_class.side_effect = lambda **kwargs: MagicMock(side_effect=Exception("boom"))
+            manager = workflow_module.WorkflowManager(mock_parent_agent)
+
+            manager.execute_task({"task_id": "a", "description": "d"}, {})
+            manager.execute_task({"task_id": "b", "description": "d"}, {})
+
+        assert mock_agent_class.call_count == 2
+        assert manager.agent_pool.stats()["idle"] == 0
+
+    def test_fallback_agent_is_not_pooled(self, mock_parent_agent):
+        with (
+            patch("strands_tools.workflow.Agent") as mock_agent_class,
+            patch("strands_tools.workflow.create_model", side_effect=Exception("no credentials")) as mock_create,
+            patch.object(workflow_module.time, "sleep"),
+        ):
+            mock_agent_class.side_effect = lambda **kwargs: MagicMock(
+                return_value=AgentResult(
+                    message={"content": [{"text": "done"}]}, stop_reason="end_turn", metrics=None, state={}
+                )
+            )
+            manager = workflow_module.WorkflowManager(mock_parent_agent)
+            task = {"description": "d", "model_provider": "bedrock", "model_settings": {"model_id": "m1"}}
+
+            agent, configured = manager._create_task_agent({**task, "task_id": "probe"})
+            assert not configured
+            assert mock_agent_class.call_args.kwargs["model"] is manager.parent_agent.model
+
+            manager.execute_task({**task, "task_id": "a"}, {})
+            manager.execute_task({**task, "task_id": "b"}, {})
+
+        # Every task retries the requested model instead of reusing the fallback
+        assert mock_create.call_count == 3
+        assert manager.agent_pool.stats()["idle"] == 0
+
+
+class TestTaskResultCache:
+    """Test the content-addressed task result cache."""
+
+    TASKS = [
+        {"task_id": "a", "description": "collect"},
+        {"task_id": "b", "description": "analyze", "dependencies": ["a"]},
+        {"task_id": "c", "description": "report", "dependencies": ["b"]},
+        {"task_id": "d", "description": "unrelated"},
+    ]
+
+    @pytest.fixture
+    def model_calls(self):
+        """Patch task agents to answer with the task description and a call counter."""
+        calls = []
+
+        def make_agent(**kwargs):
+            def call(prompt):
+                description = prompt.rsplit("\n", 1)[-1]
+                calls.append(description)
+                return AgentResult(
+                    message={"content": [{"text": f"{description} #{len(calls)}"}]},
+                    stop_reason="end_turn",
+                    metrics=None,
+                    state={},
+                )
+
+            return MagicMock(side_effect=call)
+
+        with (
+            patch("strands_tools.workflow.Agent", side_effect=make_agent),
+            patch.object(workflow_module.time, "sleep"),
+        ):
+            yield calls
+
+    def test_rerun_is_served_from_cache(self, manager, model_calls):
+        manager.create_workflow("wf", self.TASKS)
+        manager.start_workflow("wf", cache=True)
+        assert len(model_calls) == 4
+        first = manager.get_workflow("wf")["task_results"]
+
+        manager.create_workflow("wf", self.TASKS)
+        result = manager.start_workflow("wf", cache=True)
+
+        assert len(model_calls) == 4
+        assert "4 tasks served from the result cache" in result["content"][0]["text"]
+        results = manager.get_workflow("wf")["task_results"]
+        assert results["c"]["result"] == first["c"]["result"]
+        assert all(r["cached"] for r in results.values())
+
+    def test_edit_invalidates_downstream_only(self, manager, model_calls):
+        manager.create_workflow("wf", self.TASKS)
+        manager.start_workflow("wf", cache=True)
+        model_calls.clear()
+
+        edited = [dict(task) for task in self.TASKS]
+        edited[1]["description"] = "analyze deeper"
+        manager.create_workflow("wf", edited)
+        manager.start_workflow("wf", cache=True)
+
+        assert sorted(model_calls) == ["analyze deeper", "report"]
+
+    def test_disabled_by_default(self, manager, model_calls):
+        for _ in range(2):
+            manager.create_workflow("wf", self.TASKS)
+            manager.start_workflow("wf")
+
+        assert len(model_calls) == 8
+
+    def test_task_opt_out_and_remembered_setting(self, manager, model_calls):
+        tasks = [{"task_id": "a", "description": "cached"}, {"task_id": "b", "description": "live", "cache": False}]
+        manager.create_workflow("wf", tasks)
+        manager.start_workflow("wf", cache=True)
+
+        # The workflow remembers cache=True for later runs
+        manager.start_workflow("wf")
+
+        assert model_calls == ["cached", "live", "live"]
+
+    def test_cache_eviction(self, tmp_path):
+        cache = workflow_module.TaskResultCache(tmp_path, max_bytes=100)
+
+        cache.set("old", {"content": [{"text": "x" * 40}]})
+        cache.set("new", {"content": [{"text": "y" * 40}]})
+        cache.set("too_big", {"content": [{"text": "z" * 200}]})
+
+        assert cache.get("old") is None
+        assert cache.get("new") == {"content": [{"text": "y" * 40}]}
+        assert cache.get("too_big") is None
+
+
+class TestRetryPolicy:
+    """Test error classification, backoff and startup jitter."""
+
+    @pytest.fixture
+    def flaky_agent(self, mock_parent_agent):
+        """Patch task agents with a scripted sequence of errors and results."""
+        outcomes = []
+
+        def call(prompt):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return AgentResult(message={"content": [{"text": outcome}]}, stop_reason="end_turn", metrics=None, state={})
+
+        agent = MagicMock(side_effect=call)
+        with (
+            patch("strands_tools.workflow.Agent", return_value=agent),
+            patch.object(workflow_module.time, "sleep") as mock_sleep,
+        ):
+            manager = workflow_module.WorkflowManager(mock_parent_agent)
+            yield manager, agent, outcomes, mock_sleep
+
+    def test_classify_error(self):
+        assert workflow_module.classify_error(Exception("ThrottlingException: slow down")) == "throttling"
+        assert workflow_module.classify_error(ConnectionResetError("reset by peer")) == "transient"
+        assert workflow_module.classify_error(Exception("ReadTimeoutError: Read timed out")) == "transient"
+        assert workflow_module.classify_error(Exception("ServiceUnavailableException")) == "transient"
+        assert workflow_module.classify_error(ValueError("ValidationException: bad input")) == "permanent"
+
+    def test_retry_after_seconds(self):
+        from botocore.exceptions import ClientError
+
+        boto_error = ClientError(
+            {
+                "Error": {"Code": "ThrottlingException", "Message": "slow down"},
+                "ResponseMetadata": {"HTTPHeaders": {"retry-after": "7"}},
+            },
+            "Converse",
+        )
+        http_error = Exception("429")
+        http_error.response = SimpleNamespace(headers={"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})
+
+        assert workflow_module.retry_after_seconds(boto_error) == 7.0
+        assert workflow_module.retry_after_seconds(http_error) == 0.0
+        assert workflow_module.retry_after_seconds(Exception("no hint")) is None
+
+    def test_retry_delay_starts_small_and_is_capped(self):
+        with patch.object(workflow_module.random, "uniform", side_effect=lambda low, high: high):
+            assert workflow_module.retry_delay(0, Exception("x")) == pytest.approx(0.25)
+            assert workflow_module.retry_delay(2, Exception("x")) == pytest.approx(1.0)
+            assert workflow_module.retry_delay(20, Exception("x")) == pytest.approx(30.0)
+
+            error = Exception("throttled")
+            error.retry_after = 5
+            assert workflow_module.retry_delay(0, error) == 5.0
+
+    def test_throttling_is_retried_with_short_backoff(self, flaky_agent):
+        manager, agent, outcomes, mock_sleep = flaky_agent
+        outcomes.extend([Exception("ThrottlingException"), ConnectionError("reset"), "done"])
+
+        with patch.object(manager.task_executor, "record_throttle") as mock_throttle:
+            result = manager.execute_task({"task_id": "t", "description": "d"}, {})
+
+        assert result["status"] == "success"
+        assert agent.call_count == 3
+        mock_throttle.assert_called_once()
+        assert mock_sleep.call_count == 2
+        assert all(c.args[0] <= 0.5 for c in mock_sleep.call_args_list)
+
+    def test_deterministic_errors_are_not_retried(self, flaky_agent):
+        manager, agent, outcomes, mock_sleep = flaky_agent
+        outcomes.append(ValueError("ValidationException: prompt too long"))
+
+        result = manager.execute_task({"task_id": "t", "description": "d"}, {})
+
+        assert result["status"] == "error"
+        assert agent.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_retries_are_bounded(self, flaky_agent):
+        manager, agent, outcomes, _ = flaky_agent
+        outcomes.extend([Exception("Too Many Requests")] * 10)
+
+        with patch.object(workflow_module, "MAX_RETRIES", 2):
+            result = manager.execute_task({"task_id": "t", "description": "d"}, {})
+
+        assert result["status"] == "error"
+        assert agent.call_count == 3
+
+    def test_startup_jitter_only_for_bursts(self, manager):
+        manager.task_executor = workflow_module.TaskExecutor(min_workers=8, max_workers=8)
+        delays = []
+
+        def execute_task(task, workflow, start_delay=0.0):
+            delays.append(start_delay)
+            return {"status": "success", "content": []}
+
+        for count in (3, 6):
+            manager.create_workflow(f"wf{count}", [{"task_id": f"t{i}", "description": "t"} for i in range(count)])
+            with patch.object(manager, "execute_task", side_effect=execute_task):
+                manager.start_workflow(f"wf{count}")
+
+        assert delays[:3] == [0.0, 0.0, 0.0]
+        assert all(0 <= delay <= workflow_module.STARTUP_JITTER_MAX for delay in delays[3:])
+        assert any(delay > 0 for delay in delays[3:])
+
+
+class TestDependencyContext:
+    """Test budgeting of dependency results in task prompts."""
+
+    @staticmethod
+    def workflow_with_results(results):
+        return {
+            "task_results": {
+                dep_id: {"status": "completed", "result": [{"text": text}]} for dep_id, text in results.items()
+            }
+        }
+
+    def test_allocate_budget_gives_small_results_all_they_need(self):
+        shares = workflow_module.allocate_budget({"a": 10, "b": 500, "c": 1000}, 600)
+
+        assert shares == {"a": 10, "b": 295, "c": 295}
+        assert workflow_module.allocate_budget({"a": 10, "b": 20}, 600) == {"a": 10, "b": 20}
+
+    def test_wide_fan_in_stays_within_budget(self, manager):
+        results = {f"dep{i}": "word " * 2000 for i in range(50)}
+        task = {"task_id": "join", "dependencies": list(results), "context_budget": 1000}
+
+        context = manager.build_dependency_context(task, self.workflow_with_results(results))
+
+        assert 1 < len(context) < 50
+        assert all("[... truncated" in part for part in context[:-1])
+        assert context[-1] == f"Results from {51 - len(context)} more dependencies omitted to fit the context budget."
+        assert sum(len(part) for part in context) <= 1000 * workflow_module.CHARS_PER_TOKEN
+
+    def test_very_wide_fan_in_is_bounded(self, manager):
+        results = {f"dep{i}": "x" * 8000 for i in range(3000)}
+        task = {"task_id": "join", "dependencies": list(results)}
+
+        context = manager.build_dependency_context(task, self.workflow_with_results(results))
+
+        tokens = sum(workflow_module.estimate_tokens(part) for part in context)
+        assert tokens <= workflow_module.CONTEXT_BUDGET
+        assert context[0].startswith("Results from dep0:\nxxx")
+        assert len(context[0]) > workflow_module.MIN_RESULT_TOKENS * workflow_module.CHARS_PER_TOKEN
+        assert context[-1].endswith("more dependencies omitted to fit the context budget.")
+
+    def test_cache_key_covers_context_settings(self, manager):
+        task = {"task_id": "t", "description": "d", "dependencies": []}
+        workflow = {"task_results": {}}
+        key = manager.task_cache_key(task, workflow)
+
+        assert manager.task_cache_key({**task, "context_budget": 500}, workflow) != key
+        with patch.object(workflow_module, "SUMMARY_PROVIDER", "bedrock"):
+            assert manager.task_cache_key(task, workflow) != key
+        with patch.object(workflow_module, "SUMMARY_MODEL_ID", "small-model"):
+            assert manager.task_cache_key(task, workflow) != key
+
+    def test_small_results_are_kept_whole(self, manager):
+        results = {"small": "short answer", "large": "x" * 10000}
+        task = {"task_id": "t", "dependencies": ["small", "large"], "context_budget": 500}
+
+        context = manager.build_dependency_context(task, self.workflow_with_results(results))
+
+        assert context[0] == "Results from small:\nshort answer"
+        assert context[1].startswith("Results from large:\nxxx")
+        assert "[... truncated" in context[1]
+
+    def test_zero_budget_disables_limit(self, manager):
+        results = {"dep": "x" * 10000}
+        task = {"task_id": "t", "dependencies": ["dep"], "context_budget": 0}
+
+        assert manager.build_dependency_context(task, self.workflow_with_results(results)) == [
+            "Results from dep:\n" + "x" * 10000
+        ]
+
+    def test_summaries_are_used_and_cached(self, manager):
+        results = {"dep": "long result " * 1000}
+        task = {"task_id": "t", "dependencies": ["dep"], "context_budget": 100}
+        summarizer = MagicMock(return_value="the gist")
+        manager._summaries = workflow_module.OrderedDict()
+
+        with (
+            patch.object(workflow_module, "SUMMARY_PROVIDER", "bedrock"),
+            patch.object(workflow_module, "SUMMARY_MODEL_ID", "small-model"),
+            patch("strands_tools.workflow.create_model") as mock_create_model,
+            patch("strands_tools.workflow.Agent", return_value=summarizer),
+        ):
+            first = manager.build_dependency_context(task, self.workflow_with_results(results))
+            second = manager.build_dependency_context(task, self.workflow_with_results(results))
+
+        assert first == second == ["Results from dep:\nthe gist"]
+        summarizer.assert_called_once()
+        mock_create_model.assert_called_once_with(provider="bedrock", config={"model_id": "small-model"})
+
+    def test_failed_summary_falls_back_to_truncation(self, manager):
+        results = {"dep": "x" * 10000}
+        task = {"task_id": "t", "dependencies": ["dep"], "context_budget": 100}
+        manager._summaries = workflow_module.OrderedDict()
+
+        with (
+            patch.object(workflow_module, "SUMMARY_PROVIDER", "bedrock"),
+            patch("strands_tools.workflow.create_model", side_effect=Exception("no credentials")),
+        ):
+            context = manager.build_dependency_context(task, self.workflow_with_results(results))
+
+        assert "[... truncated" in context[0]
+
+
+class TestWorkerQueue:
+    """Test the durable queue and the worker process mode."""
+
+    @pytest.fixture
+    def queue(self, mock_workflow_dir):
+        return workflow_module.DurableTaskQueue(Path(mock_workflow_dir) / "queue.db")
+
+    def test_claim_complete_collect(self, queue):
+        queue.enqueue("wf", "a", {"task": {"task_id": "a"}})
+        queue.enqueue("wf", "b", {"task": {"task_id": "b"}})
+
+        claimed = queue.claim("w1")
+        assert claimed == {"workflow_id": "wf", "task_id": "a", "payload": {"task": {"task_id": "a"}}}
+        assert queue.claim("w2")["task_id"] == "b"
+        assert queue.claim("w3") is None
+
+        assert not queue.complete("wf", "a", "w2", {"status": "success"})
+        assert queue.complete("wf", "a", "w1", {"status": "success", "content": [{"text": "done"}]})
+        assert queue.collect("wf") == {"a": {"status": "success", "content": [{"text": "done"}]}}
+        assert queue.collect("wf") == {}
+
+    def test_expired_lease_moves_to_another_worker(self, queue):
+        queue.enqueue("wf", "a", {})
+        now = time.time()
+
+        with patch.object(workflow_module.time, "time", return_value=now):
+            assert queue.claim("w1", lease_seconds=10)["task_id"] == "a"
+            assert queue.claim("w2", lease_seconds=10) is None
+        with patch.object(workflow_module.time, "time", return_value=now + 11):
+            assert queue.claim("w2", lease_seconds=10)["task_id"] == "a"
+
+        assert not queue.complete("wf", "a", "w1", {"status": "success"})
+        assert not queue.renew("wf", "a", "w1")
+        assert queue.renew("wf", "a", "w2")
+
+    def test_task_fails_after_losing_workers(self, queue):
+        queue.enqueue("wf", "a", {})
+        now = time.time()
+
+        for attempt in range(workflow_module.QUEUE_MAX_ATTEMPTS):
+            with patch.object(workflow_module.time, "time", return_value=now + attempt * 20):
+                assert queue.claim(f"w{attempt}", lease_seconds=10) is not None
+        with patch.object(workflow_module.time, "time", return_value=now + 100):
+            assert queue.claim("w9", lease_seconds=10) is None
+
+        result = queue.collect("wf")["a"]
+        assert result["status"] == "error"
+        assert "lost its worker" in result["content"][0]["text"]
+
+    def test_workflow_runs_on_workers(self, manager):
+        seen = {}
+
+        def execute_task(task, workflow, start_delay=0.0):
+            seen[task["task_id"]] = sorted(workflow["task_results"])
+            return {"status": "success", "content": [{"text": f"{task['task_id']} done"}]}
+
+        tasks = [
+            {"task_id": "a", "description": "a"},
+            {"task_id": "b", "description": "b", "dependencies": ["a"]},
+            {"task_id": "c", "description": "c", "dependencies": ["a"]},
+            {"task_id": "d", "description": "d", "dependencies": ["b", "c"]},
+        ]
+        manager.create_workflow("wf", tasks)
+        manager.queue_executor = workflow_module.QueueExecutor(manager.get_task_queue(), poll_interval=0.01)
+        stop = threading.Event()
+
+        with (
+            patch.object(workflow_module, "EXECUTOR", "queue"),
+            patch.object(manager, "execute_task", side_effect=execute_task),
+        ):
+            worker = threading.Thread(
+                target=workflow_module.run_worker, kwargs={"poll_interval": 0.01, "stop_event": stop}
+            )
+            worker.start()
+            try:
+                result = manager.start_workflow("wf")
+            finally:
+                stop.set()
+                worker.join(timeout=10)
+
+        assert result["status"] == "success"
+        assert not worker.is_alive()
+        assert seen == {"a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"]}
+        task_results = manager.get_workflow("wf")["task_results"]
+        assert task_results["d"]["status"] == "completed"
+        assert task_results["d"]["result"] == [{"text": "d done"}]
+        assert manager.get_task_queue().collect("wf") == {}
+
+    def test_worker_stops_after_max_tasks(self, manager):
+        queue = manager.get_task_queue()
+        for task_id in ("a", "b", "c"):
+            queue.enqueue("wf", task_id, {"task": {"task_id": task_id}, "workflow": {"task_results": {}}})
+
+        with patch.object(manager, "execute_task", side_effect=RuntimeError("boom")):
+            assert workflow_module.run_worker(worker_id="w", poll_interval=0.01, max_tasks=2) == 2
+
+        results = queue.collect("wf")
+        assert sorted(results) == ["a", "b"]
+        assert "boom" in results["a"]["content"][0]["text"]
+        assert queue.claim("other")["task_id"] == "c"
+
+    def test_workflow_fails_without_workers(self, manager):
+        manager.create_workflow("wf", [{"task_id": "a", "description": "a"}])
+        manager.queue_executor = workflow_module.QueueExecutor(manager.get_task_queue(), poll_interval=0.01)
+
+        with (
+            patch.object(workflow_module, "EXECUTOR", "queue"),
+            patch.object(workflow_module, "QUEUE_CLAIM_TIMEOUT", 0.2),
+        ):
+            result = manager.start_workflow("wf")
+
+        assert result["status"] == "error"
+        assert "No worker claimed a task of workflow 'wf'" in result["content"][0]["text"]
+        assert not manager.is_running("wf")
+        assert manager.get_task_queue().claim("late-worker") is None
+
+    def test_held_lease_counts_as_progress(self, manager):
+        queue = manager.get_task_queue()
+        executor = workflow_module.QueueExecutor(queue, poll_interval=0.01)
+        queue.enqueue("wf", "a", {})
+        queue.claim("w1")
+        completions = workflow_module.Queue()
+        threading.Timer(0.3, completions.put, args=[("a", None)]).start()
+
+        assert executor.wait("wf", completions, claim_timeout=0.1) == ("a", None)
+
+    def test_draining_worker_renews_leases(self, manager):
+        queue = manager.get_task_queue()
+        queue.enqueue("wf", "a", {"task": {"task_id": "a"}, "workflow": {"task_results": {}}})
+        stop = threading.Event()
+        release = threading.Event()
+        renewed = threading.Event()
+
+        def execute_task(task, workflow):
+            stop.set()
+            release.wait(timeout=10)
+            return {"status": "success", "content": [{"text": "done"}]}
+
+        def renew(*args, **kwargs):
+            renewed.set()
+            release.set()
+            return True
+
+        with (
+            patch.object(manager, "execute_task", side_effect=execute_task),
+            patch.object(workflow_module.DurableTaskQueue, "renew", side_effect=renew),
+        ):
+            finished = workflow_module.run_worker(
+                worker_id="w", lease_seconds=0.03, poll_interval=0.01, stop_event=stop
+            )
+
+        assert finished == 1
+        assert renewed.is_set()
+        assert queue.collect("wf")["a"]["status"] == "success"
+
+    def test_worker_drops_posted_results(self, manager):
+        queue = manager.get_task_queue()
+        queue.enqueue("wf", "a", {"task": {"task_id": "a"}, "workflow": {"task_results": {}}})
+        result = {"status": "success", "content": [{"text": "done"}]}
+
+        with patch.object(manager, "execute_task", return_value=result):
+            assert workflow_module.run_worker(worker_id="w", poll_interval=0.01, max_tasks=1) == 1
+
+        assert manager.task_executor.results == {}
+        assert manager.task_executor.start_times == {}
+        assert queue.collect("wf") == {"a": result}
+
+
+class TestWorkflowJournal:
+    """Test journal-based persistence of task progress."""
+
+    CHAIN = [
+        {"task_id": "a", "description": "a"},
+        {"task_id": "b", "description": "b", "dependencies": ["a"]},
+        {"task_id": "c", "description": "c", "dependencies": ["b"]},
+    ]
+
+    def test_task_progress_is_journaled_not_snapshotted(self, manager, mock_workflow_dir):
+        with patch.object(manager, "store_workflow", wraps=manager.store_workflow) as mock_store:
+            run_workflow(manager, self.CHAIN)
+
+        # Only creation, start and completion write the whole workflow
+        assert mock_store.call_count == 3
+        assert not (Path(mock_workflow_dir) / "wf.journal").exists()
+
+    def test_journal_records_transitions(self, manager, mock_workflow_dir):
+        journal = Path(mock_workflow_dir) / "wf.journal"
+        parsed = []
+        journal_task_events = manager.journal_task_events
+
+        def read_back(workflow_id, workflow, task_ids):
+            journal_task_events(workflow_id, workflow, task_ids)
+            if journal.exists():
+                parsed[:] = [json.loads(line) for line in journal.read_text().splitlines()]
+
+        with patch.object(manager, "journal_task_events", side_effect=read_back):
+            run_workflow(manager, self.CHAIN, outcomes={"b": "error"})
+
+        assert [(e["task_id"], e["event"]) for e in parsed] == [
+            ("a", "started"),
+            ("a", "completed"),
+            ("b", "started"),
+            ("b", "failed"),
+            ("c", "skipped"),
+        ]
+        assert parsed[1]["state"]["result"] == [{"text": "a done"}]
+
+    def test_load_replays_journal_over_snapshot(self, manager, mock_workflow_dir):
+        manager.create_workflow("wf", self.CHAIN)
+        workflow = manager.get_workflow("wf")
+        workflow["task_results"]["a"].update(status="completed", result=[{"text": "x"}])
+        workflow["task_results"]["b"].update(status="running")
+        manager.journal_task_events("wf", workflow, ["a", "b"])
+        with open(Path(mock_workflow_dir) / "wf.journal", "a") as f:
+            f.write('{"event":"completed","task_id":"b","sta')
+
+        manager._workflows.clear()
+        loaded = manager.load_workflow("wf")
+
+        assert loaded["task_results"]["a"]["status"] == "completed"
+        assert loaded["task_results"]["a"]["result"] == [{"text": "x"}]
+        assert loaded["task_results"]["b"]["status"] == "running"
+        assert loaded["task_results"]["c"]["status"] == "pending"
+
+    def test_snapshot_compacts_journal(self, manager, mock_workflow_dir):
+        journal = Path(mock_workflow_dir) / "wf.journal"
+        manager.create_workflow("wf", self.CHAIN)
+        workflow = manager.get_workflow("wf")
+
+        with patch.object(workflow_module, "SNAPSHOT_INTERVAL", 3):
+            manager.journal_task_events("wf", workflow, ["a", "b"])
+            assert len(journal.read_text().splitlines()) == 2
+            workflow["task_results"]["c"]["status"] = "running"
+            manager.journal_task_events("wf", workflow, ["c"])
+
+        assert not journal.exists()
+        with open(Path(mock_workflow_dir) / "wf.json") as f:
+            assert json.load(f)["task_results"]["c"]["status"] == "running"
+
+    def test_watcher_ignores_own_writes(self, manager, mock_workflow_dir):
+        manager.create_workflow("wf", self.CHAIN)
+        file_path = str(Path(mock_workflow_dir) / "wf.json")
+        handler = workflow_module.WorkflowFileHandler(manager)
+        event = MagicMock(is_directory=False, src_path=file_path)
+
+        with patch.object(manager, "load_workflow") as mock_load:
+            handler.on_modified(event)
+            mock_load.assert_not_called()
+
+            # An external edit is picked up
+            with open(file_path, "a") as f:
+                f.write(" ")
+            handler.on_modified(event)
+            mock_load.assert_called_once_with("wf")
+
+
+class TestWorkflowResume:
+    """Test resuming workflows from persisted state."""
+
+    TASKS = [
+        {"task_id": "a", "description": "a"},
+        {"task_id": "b", "description": "b", "dependencies": ["a"]},
+        {"task_id": "c", "description": "c", "dependencies": ["b"]},
+        {"task_id": "d", "description": "d"},
+    ]
+
+    def _crash_after_b_started(self, manager):
+        """Persist a workflow as a process that died while task b was running would leave it."""
+        manager.create_workflow("wf", self.TASKS)
+        workflow = manager.get_workflow("wf")
+        workflow["status"] = "running"
+        manager.store_workflow("wf", workflow)
+        workflow["task_results"]["a"].update(status="completed", result=[{"text": "a output"}])
+        workflow["task_results"]["d"].update(status="completed", result=[{"text": "d output"}])
+        workflow["task_results"]["b"].update(status="running")
+        manager.journal_task_events("wf", workflow, ["a", "d", "b"])
+        # Simulate a new process: nothing is known in memory
+        manager._workflows.clear()
+
+    def test_resume_keeps_completed_and_requeues_running(self, manager):
+        self._crash_after_b_started(manager)
+
+        with patch.object(manager, "execute_task") as mock_execute:
+            mock_execute.side_effect = lambda task, workflow: {
+                "status": "success",
+                "content": [{"text": f"{task['task_id']} done"}],
+            }
+            result = manager.start_workflow("wf", resume=True)
+
+        assert result["status"] == "success"
+        assert "4/4 tasks succeeded" in result["content"][0]["text"]
+        assert "Resumed with 2 completed tasks kept" in result["content"][0]["text"]
+        assert [c.args[0]["task_id"] for c in mock_execute.call_args_list] == ["b", "c"]
+
+        workflow = manager.load_workflow("wf")
+        assert workflow["task_results"]["a"]["result"] == [{"text": "a output"}]
+        assert workflow["task_results"]["c"]["result"] == [{"text": "c done"}]
+        assert workflow["resumed_at"]
+
+    def test_resume_retries_failed_and_skipped_tasks(self, manager):
+        _, executed, _ = run_workflow(manager, self.TASKS, outcomes={"b": "error"})
+        assert sorted(executed) == ["a", "b", "d"]
+
+        with patch.object(manager, "execute_task") as mock_execute:
+            mock_execute.return_value = {"status": "success", "content": [{"text": "ok"}]}
+            manager.start_workflow("wf", resume=True)
+
+        assert [c.args[0]["task_id"] for c in mock_execute.call_args_list] == ["b", "c"]
+        statuses = {task_id: r["status"] for task_id, r in manager.get_workflow("wf")["task_results"].items()}
+        assert set(statuses.values()) == {"completed"}
+
+    def test_start_runs_everything_again(self, manager):
+        self._crash_after_b_started(manager)
+        manager.load_workflow("wf")
+
+        with patch.object(manager, "execute_task") as mock_execute:
+            mock_execute.return_value = {"status": "success", "content": [{"text": "ok"}]}
+            manager.start_workflow("wf")
+
+        assert sorted(c.args[0]["task_id"] for c in mock_execute.call_args_list) == ["a", "b", "c", "d"]
+
+    def test_resume_refuses_running_workflow(self, manager):
+        manager.create_workflow("wf", self.TASKS)
+        manager.task_executor.active_tasks.add("wf:a")
+
+        result = manager.start_workflow("wf", resume=True)
+
+        assert result["status"] == "error"
+        assert "already running" in result["content"][0]["text"]
+
+    def test_resume_action_routes_to_manager(self, mock_parent_agent):
+        with patch("strands_tools.workflow.WorkflowManager") as mock_manager_class:
+            mock_manager = MagicMock()
+            mock_manager_class.return_value = mock_manager
+            mock_manager.start_workflow.return_value = {"status": "success", "content": [{"text": "resumed"}]}
+
+            result = workflow_module.workflow(action="resume", workflow_id="wf", agent=mock_parent_agent)
+
+        assert result["status"] == "success"
+        mock_manager.start_workflow.assert_called_once_with("wf", resume=True, cache=None)
+
+
 class TestWorkflowEdgeCases:
     """Test edge cases and error conditions."""
 
@@ -584,12 +1644,18 @@ class TestWorkflowEdgeCases:
         assert "Unknown action: invalid_action" in result["content"][0]["text"]
 
     def test_unimplemented_actions(self, mock_parent_agent):
-        """Test pause and resume actions (not yet implemented)."""
-        for action in ["pause", "resume"]:
-            result = workflow_module.workflow(action=action, workflow_id="test_workflow", agent=mock_parent_agent)
+        """Test pause action (not yet implemented)."""
+        result = workflow_module.workflow(action="pause", workflow_id="test_workflow", agent=mock_parent_agent)
 
-            assert result["status"] == "error"
-            assert f"Action '{action}' is not yet implemented" in result["content"][0]["text"]
+        assert result["status"] == "error"
+        assert "Action 'pause' is not yet implemented" in result["content"][0]["text"]
+
+    def test_resume_missing_id(self, mock_parent_agent):
+        """Test resume without a workflow_id."""
+        result = workflow_module.workflow(action="resume", agent=mock_parent_agent)
+
+        assert result["status"] == "error"
+        assert "workflow_id is required for resume action" in result["content"][0]["text"]
 
     def test_workflow_exception_handling(self, mock_parent_agent, sample_tasks):
         """Test workflow tool handles exceptions gracefully."""
@@ -0,0 +1,49 @@
+"""
+Tests for the on-disk pickle cache.
+"""
+
+import os
+import stat
+
+from strands_tools.utils.file_cache import PickleFileCache
+
+
+def test_directory_is_private(tmp_path):
+    directory = tmp_path / "cache"
+    PickleFileCache(directory, 1024)
+
+    assert stat.S_IMODE(directory.stat().st_mode) & 0o077 == 0
+
+
+def test_overwrites_are_not_counted_twice(tmp_path):
+    cache = PickleFileCache(tmp_path, max_bytes=1000)
+    cache.set("a", "x" * 100)
+    cache.set("b", "y" * 100)
+    size = cache._size
+
+    for _ in range(50):
+        cache.set("a", "x" * 100)
+
+    assert cache._size == size == sum(path.stat().st_size for path in tmp_path.glob("*.pkl"))
+    assert cache.get("b") == "y" * 100
+
+
+def test_stale_tmp_files_are_removed(tmp_path):
+    stale = tmp_path / "orphan.tmp"
+    stale.write_bytes(b"x" * 10)
+    os.utime(stale, (0, 0))
+    fresh = tmp_path / "inflight.tmp"
+    fresh.write_bytes(b"x" * 10)
+
+    PickleFileCache(tmp_path, max_bytes=1000).set("a", "value")
+
+    assert not stale.exists()
+    assert fresh.exists()
+
+
+def test_values_over_the_limit_are_not_stored(tmp_path):
+    cache = PickleFileCache(tmp_path, max_bytes=100)
+
+    assert not cache.set("big", "x" * 1000)
+    assert cache.get("big") is None
+    assert cache.set("small", "x")
@@ -0,0 +1,145 @@
+"""
+Tests for the HTML to Markdown pipeline.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from strands_tools.utils import html_util
+from strands_tools.utils.html_util import extract_main_content, html_to_markdown, truncate_markdown
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head><title>Article</title><script>window.tracking = true;</script><style>body {}</style></head>
+<body>
+  <nav><a href="/">Home</a> <a href="/docs">Docs</a></nav>
+  <div class="site-menu"><a href="/login">Log in</a></div>
+  <div id="content">
+    <div class="post">
+      <h1>Release Notes</h1>
+      <p>This release makes the HTTP client considerably faster for long running agents.</p>
+      <p>Sessions are pooled per host and responses can be cached on disk.</p>
+      <ul><li>Pooled sessions</li><li>Response cache</li></ul>
+    </div>
+    <div class="comments"><p>Great release, thanks!</p></div>
+  </div>
+  <div class="sidebar"><p>Related posts you might like</p></div>
+  <div class="cookie-banner"><p>We use cookies</p></div>
+  <footer><p>Copyright 2025</p></footer>
+</body>
+</html>"""
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    html_util.clear_markdown_cache()
+    yield
+    html_util.clear_markdown_cache()
+
+
+class TestHtmlToMarkdown:
+    """Test the conversion pipeline."""
+
+    def test_keeps_main_content_only(self):
+        markdown = html_to_markdown(PAGE)
+
+        assert markdown.startswith("# Release Notes")
+        assert "considerably faster" in markdown
+        assert "* Pooled sessions" in markdown
+        for boilerplate in ("Home", "Log in", "tracking", "Great release", "Related posts", "cookies", "Copyright"):
+            assert boilerplate not in markdown
+
+    def test_prefers_article_element(self):
+        html = "<div><p>Teaser text outside</p><article><header><h2>Title</h2></header><p>Body.</p></article></div>"
+        assert html_to_markdown(html) == "## Title\n\nBody."
+
+    def test_fragment_without_main_content_extraction(self):
+        html = "<p>Test <strong>content</strong> with <a href='https://example.com'>link</a></p><p>Second</p>"
+        assert html_to_markdown(html, main_content=False) == (
+            "Test **content** with [link](https://example.com)\n\nSecond"
+        )
+
+    def test_empty_input(self):
+        assert html_to_markdown("") == ""
+        assert html_to_markdown(None) == ""
+
+    def test_size_budget(self):
+        markdown = html_to_markdown(PAGE, max_chars=100)
+
+        assert len(markdown.split("\n\n[... truncated")[0]) <= 100
+        assert markdown.endswith("characters]")
+        assert markdown.startswith("# Release Notes")
+
+    def test_results_cached_by_content(self):
+        with patch.object(html_util, "extract_main_content", wraps=extract_main_content) as mock_extract:
+            first = html_to_markdown(PAGE)
+            second = html_to_markdown(PAGE)
+            html_to_markdown(PAGE, max_chars=50)
+
+        assert first == second
+        assert mock_extract.call_count == 2
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            '<div class="layout-page page-with-super-sidebar"><div><h1>Guide</h1>{body}</div></div>',
+            '<div class="site with-sidebar"><article><h1>Guide</h1>{body}</article></div>',
+            '<body class="menu-open"><div><h1>Guide</h1>{body}</div></body>',
+            '<div id="comments-enabled-content"><h1>Guide</h1>{body}</div>',
+            '<form id="aspnetForm"><div><h1>Guide</h1>{body}</div></form>',
+        ],
+    )
+    def test_keeps_wrappers_that_look_like_boilerplate(self, html):
+        body = "".join(
+            f"<p>Paragraph {i} explains how the pooled sessions are reused between calls.</p>" for i in range(4)
+        )
+        markdown = html_to_markdown(html.format(body=body))
+
+        assert markdown.startswith("# Guide")
+        assert "Paragraph 3 explains" in markdown
+
+    def test_strips_link_heavy_blocks_inside_content(self):
+        links = "".join(f'<p><a href="/{i}">Related post {i}</a></p>' for i in range(5))
+        html = f"<article><p>{'Main text. ' * 20}</p><div class='related-posts'>{links}</div></article>"
+        markdown = html_to_markdown(html)
+
+        assert "Main text." in markdown
+        assert "Related post" not in markdown
+
+    def test_falls_back_to_whole_document(self):
+        html = '<div class="cookie-banner"><span>Only text on the page</span></div>'
+        assert html_to_markdown(html) == "Only text on the page"
+
+    def test_images_can_be_dropped(self):
+        html = '<p>Chart below</p><p><img src="chart.png" alt="chart"></p>'
+
+        assert "![chart](chart.png)" in html_to_markdown(html, main_content=False)
+        assert html_to_markdown(html, main_content=False, images=False) == "Chart below"
+
+    def test_scores_large_pages_in_linear_time(self):
+        section = "<div class='block'><p>{}</p><ul><li><a href='#'>link</a></li></ul></div>"
+        html = "<div>" * 200 + "".join(section.format("text " * 20) for _ in range(2000)) + "</div>" * 200
+        soup = html_util.BeautifulSoup(html, "html.parser")
+
+        with patch.object(html_util.Tag, "get_text", side_effect=AssertionError("text measured per element")):
+            stats = html_util._measure(soup)
+            extract_main_content(soup, stats)
+
+        assert stats[id(soup)].p_count == 2000
+        assert stats[id(soup)].links == 2000 * len("link")
+
+
+class TestTruncateMarkdown:
+    """Test size budget enforcement."""
+
+    def test_cuts_at_paragraph_boundary(self):
+        text = "First paragraph.\n\nSecond paragraph that is longer."
+        assert truncate_markdown(text, 30) == "First paragraph.\n\n[... truncated 34 characters]"
+
+    def test_within_budget_or_unlimited(self):
+        assert truncate_markdown("short", 10) == "short"
+        assert truncate_markdown("x" * 100, 0) == "x" * 100
+
+    def test_hard_cut_without_boundary(self):
+        assert truncate_markdown("x" * 100, 40) == f"{'x' * 40}\n\n[... truncated 60 characters]"